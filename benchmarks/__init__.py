@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Benchmarks for airspeed velocity (asv).
+
+Each benchmark class times PyDims operations next to the equivalent raw NumPy
+operations (methods prefixed with ``time_numpy_``), so the overhead of PyDims can
+be tracked separately from the cost of the underlying array operations.
+
+Run with ``asv run`` from the repository root, or ``asv dev`` for a quick run
+against the current environment.
+"""
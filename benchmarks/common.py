@@ -0,0 +1,21 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+
+import pydims as dms
+
+# Small arrays measure per-op overhead, large arrays measure throughput.
+SIZES = (10, 1_000_000)
+
+
+def make_values(size: int, ndim: int = 2) -> np.ndarray:
+    """Return random values with ``size`` elements in ``ndim`` roughly equal dims."""
+    rng = np.random.default_rng(seed=1234)
+    shape = [round(size ** (1 / ndim))] * ndim
+    shape[-1] = size // int(np.prod(shape[:-1]))
+    return rng.random(tuple(shape))
+
+
+def make_array(values: np.ndarray, unit=None) -> dms.DimensionedArray:
+    dims = ('x', 'y', 'z', 'w')[: values.ndim]
+    return dms.DimensionedArray(values=values, dims=dims, unit=unit)
@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""Graph build time for Dask-backed arrays. Nothing is computed."""
+
+import dask.array as da
+
+import pydims as dms
+
+
+class DaskGraphBuild:
+    params = ((10, 1000),)
+    param_names = ('nchunks',)
+
+    def setup(self, nchunks):
+        self.values = da.ones((nchunks * 100, 100), chunks=(100, 100))
+        self.array = dms.DimensionedArray(
+            values=self.values, dims=('x', 'y'), unit=None
+        )
+        self.transposed = dms.permute_dims(self.array, ('y', 'x'))
+
+    def time_add_transposed(self, nchunks):
+        self.array + self.transposed
+
+    def time_dask_add_transposed(self, nchunks):
+        self.values + self.transposed.values.T
+
+    def time_sum(self, nchunks):
+        dms.sum(self.array, dim='x')
+
+    def time_dask_sum(self, nchunks):
+        da.sum(self.values, axis=0)
+
+    def time_getitem(self, nchunks):
+        self.array[{'x': slice(10, 250)}]
+
+    def time_dask_getitem(self, nchunks):
+        self.values[10:250]
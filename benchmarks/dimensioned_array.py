@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import operator
+
+import numpy as np
+
+import pydims as dms
+from pydims.common import elemwise_binary
+
+from .common import SIZES, make_array, make_values
+
+
+class Construction:
+    params = (SIZES,)
+    param_names = ('size',)
+
+    def setup(self, size):
+        self.values = make_values(size)
+
+    def time_construct(self, size):
+        dms.DimensionedArray(values=self.values, dims=('x', 'y'), unit=None)
+
+    def time_numpy_asarray(self, size):
+        np.asarray(self.values)
+
+
+class ElemwiseBinary:
+    params = (SIZES, ('matching', 'transposed'))
+    param_names = ('size', 'dim_order')
+
+    def setup(self, size, dim_order):
+        self.a = make_array(make_values(size))
+        values = make_values(size)
+        if dim_order == 'matching':
+            self.b = dms.DimensionedArray(values=values, dims=('x', 'y'), unit=None)
+            self.b_numpy = values
+        else:
+            transposed = np.ascontiguousarray(values.T)
+            self.b = dms.DimensionedArray(values=transposed, dims=('y', 'x'), unit=None)
+            self.b_numpy = transposed.T
+
+    def time_elemwise_binary(self, size, dim_order):
+        elemwise_binary(self.a, self.b, values_op=operator.add, unit_op=lambda a, b: a)
+
+    def time_add(self, size, dim_order):
+        self.a + self.b
+
+    def time_numpy_add(self, size, dim_order):
+        self.a.values + self.b_numpy
+
+
+class ToDtypeAndUnit:
+    params = (SIZES, (('float64', 'float32'), ('float32', 'float64')))
+    param_names = ('size', 'dtypes')
+
+    def setup(self, size, dtypes):
+        from pydims.string_units import Unit
+
+        src, self.dst = (getattr(np, dtype) for dtype in dtypes)
+        self.array = make_array(make_values(size).astype(src), unit=Unit('m'))
+
+    def time_to(self, size, dtypes):
+        self.array.to(dtype=self.dst, unit='mm')
+
+    def time_numpy_astype_multiply(self, size, dtypes):
+        self.array.values.astype(self.dst) * 1000.0
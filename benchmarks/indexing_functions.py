@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+
+import pydims as dms
+
+from .common import SIZES, make_array, make_values
+
+
+class Take:
+    params = (SIZES,)
+    param_names = ('size',)
+
+    def setup(self, size):
+        self.array = make_array(make_values(size))
+        nx = self.array.sizes['x']
+        indices = np.random.default_rng(seed=1234).integers(0, nx, size=nx)
+        self.indices = dms.DimensionedArray(values=indices, dims=('x',), unit=None)
+
+    def time_take(self, size):
+        dms.take(self.array, self.indices)
+
+    def time_numpy_take(self, size):
+        np.take(self.array.values, self.indices.values, axis=0)
+
+
+class GetItem:
+    params = (SIZES,)
+    param_names = ('size',)
+
+    def setup(self, size):
+        self.array = make_array(make_values(size))
+
+    def time_getitem(self, size):
+        self.array[{'x': 0, 'y': slice(0, 2)}]
+
+    def time_numpy_getitem(self, size):
+        self.array.values[0, 0:2]
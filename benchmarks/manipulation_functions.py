@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+
+import pydims as dms
+
+from .common import SIZES, make_array, make_values
+
+
+class Manipulation:
+    params = (SIZES,)
+    param_names = ('size',)
+
+    def setup(self, size):
+        self.array = make_array(make_values(size))
+        self.values = self.array.values
+        self.nx, self.ny = self.values.shape
+        self.column = self.array[{'y': 0}]
+
+    def time_permute_dims(self, size):
+        dms.permute_dims(self.array, ('y', 'x'))
+
+    def time_numpy_permute_dims(self, size):
+        np.permute_dims(self.values, (1, 0))
+
+    def time_flatten(self, size):
+        dms.flatten(self.array, dims=('x', 'y'), dim='xy')
+
+    def time_numpy_flatten(self, size):
+        np.reshape(self.values, (-1,))
+
+    def time_fold(self, size):
+        dms.fold(self.array, 'y', sizes={'y1': 1, 'y2': self.ny})
+
+    def time_numpy_fold(self, size):
+        np.reshape(self.values, (self.nx, 1, self.ny))
+
+    def time_squeeze(self, size):
+        dms.squeeze(dms.fold(self.array, 'y', sizes={'y1': 1, 'y2': self.ny}), 'y1')
+
+    def time_expand_dims(self, size):
+        dms.expand_dims(self.column, sizes={'z': 4})
+
+    def time_numpy_expand_dims(self, size):
+        np.broadcast_to(self.column.values, (4, self.nx))
+
+    def time_concat(self, size):
+        dms.concat((self.array, self.array), dim='x')
+
+    def time_numpy_concat(self, size):
+        np.concat((self.values, self.values), axis=0)
+
+    def time_stack(self, size):
+        dms.stack((self.array, self.array), dim='z')
+
+    def time_numpy_stack(self, size):
+        np.stack((self.values, self.values), axis=0)
+
+
+class TransposeCopy:
+    # Power-of-two row lengths cause cache aliasing in naive transposing copies.
+    params = (((1000, 1000), (1024, 1024), (4096, 4096), (64, 256, 256)),)
+    param_names = ('shape',)
+
+    def setup(self, shape):
+        values = np.random.default_rng(seed=1234).random(shape)
+        self.array = make_array(values)
+        self.dims = self.array.dims[::-1]
+        self.transposed = dms.permute_dims(self.array, self.dims)
+
+    def time_ascontiguous(self, shape):
+        dms.ascontiguous(self.array, dims=self.dims)
+
+    def time_permute_dims_copy(self, shape):
+        dms.permute_dims(self.array, self.dims, copy=True)
+
+    def time_flatten(self, shape):
+        dms.flatten(self.transposed, dim='flat')
+
+    def time_numpy_ascontiguousarray(self, shape):
+        np.ascontiguousarray(self.transposed.values)
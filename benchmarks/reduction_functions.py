@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+
+import pydims as dms
+
+from .common import SIZES, make_array, make_values
+
+_REDUCTIONS = ('all', 'any', 'max', 'min', 'sum', 'mean', 'prod', 'std', 'var')
+
+
+class Reduction:
+    params = (SIZES, _REDUCTIONS, ('x', 'y', None))
+    param_names = ('size', 'reduction', 'dim')
+
+    def setup(self, size, reduction, dim):
+        values = make_values(size)
+        if reduction in ('all', 'any'):
+            values = values > 0.5
+        self.array = make_array(values)
+        self.func = getattr(dms, reduction)
+        self.numpy_func = getattr(np, reduction)
+        self.axis = None if dim is None else self.array.dims.index(dim)
+
+    def time_reduce(self, size, reduction, dim):
+        self.func(self.array, dim=dim)
+
+    def time_numpy_reduce(self, size, reduction, dim):
+        self.numpy_func(self.array.values, axis=self.axis)
+
+
+class MultiDimReduction:
+    params = (
+        SIZES,
+        ('contiguous', 'transposed'),
+        (None, 'blocked', 'kahan'),
+        (('x', 'y'), ('z', 'y'), 'z'),
+    )
+    param_names = ('size', 'layout', 'accumulation', 'dims')
+
+    def setup(self, size, layout, accumulation, dims):
+        self.array = make_array(make_values(size, ndim=3).astype(np.float32))
+        if layout == 'transposed':
+            self.array = self.array.permute_dims(('z', 'x', 'y'))
+        dims = dims if isinstance(dims, tuple) else (dims,)
+        self.axis = tuple(self.array.dims.index(dim) for dim in dims)
+
+    def time_sum(self, size, layout, accumulation, dims):
+        dms.sum(self.array, dim=dims, accumulation=accumulation)
+
+    def time_numpy_sum(self, size, layout, accumulation, dims):
+        np.sum(self.array.values, axis=self.axis)
+
+
+class IncrementalReduction:
+    params = (SIZES, ('sum', 'mean', 'min', 'max'), ('y', None))
+    param_names = ('size', 'reduction', 'dim')
+
+    def setup(self, size, reduction, dim):
+        self.array = make_array(make_values(size))
+        self.maintained = dms.MaintainedReduction(self.array, reduction, dim=dim)
+        self.func = getattr(dms, reduction)
+        self.value = dms.DimensionedArray(values=np.float64(0.5), dims=(), unit=None)
+
+    def time_update_and_read(self, size, reduction, dim):
+        self.array[{'x': 0, 'y': 0}] = self.value
+        return self.maintained.result
+
+    def time_update_and_recompute(self, size, reduction, dim):
+        self.array[{'x': 0, 'y': 0}] = self.value
+        self.func(self.array, dim=dim)
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+from .common import SIZES, make_array, make_values
+
+
+def _meter(backend: str):
+    if backend == 'string':
+        from pydims.string_units import Unit
+
+        return Unit('m')
+    if backend == 'pint':
+        from pint import UnitRegistry
+
+        return UnitRegistry().Unit('m')
+    if backend == 'astropy':
+        import astropy.units as u
+
+        return u.m
+    if backend == 'scipp':
+        import scipp as sc
+
+        return sc.Unit('m')
+    raise ValueError(backend)
+
+
+class ToUnit:
+    params = (SIZES, ('string', 'pint', 'astropy', 'scipp'))
+    param_names = ('size', 'backend')
+
+    def setup(self, size, backend):
+        src = _meter(backend)
+        self.dst = 'mm'
+        self.array = make_array(make_values(size), unit=src)
+        self.scale = self.array.units_namespace.get_scale(src=src, dst=self.dst)
+
+    def time_to_unit(self, size, backend):
+        self.array.to(unit=self.dst)
+
+    def time_get_scale(self, size, backend):
+        self.array.units_namespace.get_scale(src=self.array.unit, dst=self.dst)
+
+    def time_numpy_multiply(self, size, backend):
+        self.array.values * self.scale
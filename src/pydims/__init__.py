@@ -1,44 +1,165 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Pydims contributors (https://github.com/pydims)
-# ruff: noqa: E402, F401
-
-import importlib.metadata
-
-try:
-    __version__ = importlib.metadata.version(__package__ or __name__)
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.0.0"
-
-del importlib
-
-from .creation_functions import CreationFunctions
-from .dimensioned_array import DimensionedArray, DimensionError, exp, UnitsError
-from .indexing_functions import take
-from .array_api_manipulation_functions import (
-    broadcast_to,
-    concat,
-    expand_dims,
-    flatten,
-    fold,
-    moveaxis,
-    permute_dims,
-    reshape,
-    squeeze,
-    stack,
+# ruff: noqa: F401
+
+"""
+Arrays with named dimensions and physical units.
+
+Submodules and the top-level functions and classes are imported lazily on first
+access, so ``import pydims`` is cheap and does not import any array library.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# Avoid importing typing to keep `import pydims` fast.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from . import profiling
+    from .appendable_array import AppendableArray
+    from .coordinate_index import CoordinateIndex
+    from .copy_on_write import set_copy_on_write
+    from .creation_functions import CreationFunctions
+    from .dimensioned_array import DimensionedArray, DimensionError, exp, UnitsError
+    from .formatting import set_repr_options
+    from .indexing_functions import sel, take
+    from .maintained_reduction import MaintainedReduction
+    from .array_api_manipulation_functions import (
+        broadcast_to,
+        concat,
+        expand_dims,
+        flatten,
+        fold,
+        moveaxis,
+        permute_dims,
+        reshape,
+        squeeze,
+        stack,
+    )
+    from .memory_functions import ascontiguous, is_contiguous, shares_memory
+    from .reduction_functions import (
+        all,
+        any,
+        count_nonzero,
+        max,
+        mean,
+        min,
+        prod,
+        std,
+        sum,
+        var,
+    )
+
+_submodules = (
+    'appendable_array',
+    'array_api_manipulation_functions',
+    'caching',
+    'common',
+    'coordinate_index',
+    'copy_on_write',
+    'creation_functions',
+    'dimensioned_array',
+    'formatting',
+    'indexing_functions',
+    'maintained_reduction',
+    'memory_functions',
+    'meta',
+    'packed_mask',
+    'profiling',
+    'random_functions',
+    'reduction_functions',
+    'string_units',
+    'testing',
+    'units_api_compat',
 )
-from .reduction_functions import all, any, max, min, sum, mean, prod, std, var
 
-DimensionedArray.expand_dims = expand_dims
-DimensionedArray.flatten = flatten
-DimensionedArray.fold = fold
-DimensionedArray.permute_dims = permute_dims
-DimensionedArray.reshape = reshape
-DimensionedArray.squeeze = squeeze
+_lazy_attributes = {
+    'AppendableArray': 'appendable_array',
+    'CoordinateIndex': 'coordinate_index',
+    'CreationFunctions': 'creation_functions',
+    'DimensionedArray': 'dimensioned_array',
+    'DimensionError': 'dimensioned_array',
+    'MaintainedReduction': 'maintained_reduction',
+    'UnitsError': 'dimensioned_array',
+    'exp': 'dimensioned_array',
+    'set_copy_on_write': 'copy_on_write',
+    'set_repr_options': 'formatting',
+    'sel': 'indexing_functions',
+    'take': 'indexing_functions',
+    **dict.fromkeys(
+        (
+            'broadcast_to',
+            'concat',
+            'expand_dims',
+            'flatten',
+            'fold',
+            'moveaxis',
+            'permute_dims',
+            'reshape',
+            'squeeze',
+            'stack',
+        ),
+        'array_api_manipulation_functions',
+    ),
+    **dict.fromkeys(
+        ('ascontiguous', 'is_contiguous', 'shares_memory'), 'memory_functions'
+    ),
+    **dict.fromkeys(
+        (
+            'all',
+            'any',
+            'count_nonzero',
+            'max',
+            'min',
+            'sum',
+            'mean',
+            'prod',
+            'std',
+            'var',
+        ),
+        'reduction_functions',
+    ),
+}
+
+
+def _version() -> str:
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version(__package__ or __name__)
+    except importlib.metadata.PackageNotFoundError:
+        return "0.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    if name == '__version__':
+        value = _version()
+    elif name in _submodules:
+        value = importlib.import_module(f'.{name}', __name__)
+    elif name in _lazy_attributes:
+        module = importlib.import_module(f'.{_lazy_attributes[name]}', __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_submodules, '__version__'})
+
 
 __all__ = [
     'all',
     'any',
+    'AppendableArray',
+    'ascontiguous',
     'broadcast_to',
+    'CoordinateIndex',
+    'count_nonzero',
     'CreationFunctions',
     'DimensionedArray',
     'DimensionError',
@@ -46,11 +167,17 @@ __all__ = [
     'exp',
     'flatten',
     'fold',
+    'is_contiguous',
+    'MaintainedReduction',
     'concat',
     'moveaxis',
     'permute_dims',
     'reshape',
     'squeeze',
+    'sel',
+    'set_copy_on_write',
+    'set_repr_options',
+    'shares_memory',
     'stack',
     'take',
     'UnitsError',
@@ -0,0 +1,240 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Buffers for appending data along a dimension.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from array_api_compat import device
+
+from .dimensioned_array import (
+    ArrayImplementation,
+    Dim,
+    DimensionedArray,
+    DimensionError,
+    Dims,
+    DType,
+    UnitImplementation,
+)
+from .profiling import instrumented
+
+
+class AppendableArray:
+    """
+    Array that can be extended along one dimension.
+
+    In contrast to :py:func:`concat`, which copies all existing data on every call,
+    the values are stored in a buffer with spare capacity along the append
+    dimension. The buffer grows geometrically, so appending a frame has amortized
+    constant cost. :py:attr:`array` returns a view of the filled region without
+    copying.
+
+    With ``ring=True`` the buffer has a fixed capacity and acts as a sliding window
+    over the most recently appended frames. Each frame is written twice, so that
+    the window is always a contiguous region of the buffer and :py:attr:`array`
+    can return a view without copying, at the cost of doubling memory and writes.
+
+    The array backend must support in-place assignment, so this is not supported
+    for lazy backends such as Dask.
+    """
+
+    # Values with spare capacity along the append dim. Typed as Any since the array
+    # API does not provide static types for indexing and attributes.
+    _buffer: Any
+    # Number of frames in the buffer, or the window size in ring mode.
+    _capacity: int
+
+    def __init__(
+        self,
+        initial: DimensionedArray,
+        /,
+        *,
+        dim: Dim,
+        capacity: int | None = None,
+        ring: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        initial:
+            Initial content. Defines the dims, unit, and dtype of the buffer.
+        dim:
+            Dimension along which data is appended.
+        capacity:
+            Initial capacity along ``dim``. Required if ``ring`` is True, in which
+            case it is the fixed size of the sliding window.
+        ring:
+            If True, keep only the last ``capacity`` frames.
+        """
+        if dim not in initial.dims:
+            raise DimensionError(f"Dimension '{dim}' not in dims {initial.dims}")
+        if capacity is None:
+            if ring:
+                raise ValueError("Ring buffer requires a capacity")
+            capacity = 1
+        elif capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self._dim = dim
+        self._dims = initial.dims
+        self._unit = initial.unit
+        self._axis = initial.dims.index(dim)
+        self._ring = ring
+        self._xp = initial.array_namespace
+        self._size = 0
+        self._end = 0
+        if ring:
+            self._capacity = capacity
+            self._buffer = self._allocate(initial, 2 * capacity)
+        else:
+            self._capacity = max(capacity, initial.sizes[dim])
+            self._buffer = self._allocate(initial, self._capacity)
+        self.append(initial)
+
+    def _allocate(self, template: DimensionedArray, length: int) -> Any:
+        shape = list(template.shape)
+        shape[self._axis] = length
+        return self._xp.empty(
+            tuple(shape),
+            dtype=template.dtype,
+            device=device(template.values),
+        )
+
+    def _key(self, start: int, stop: int) -> tuple[slice, ...]:
+        return (*(slice(None),) * self._axis, slice(start, stop))
+
+    @property
+    def dim(self) -> Dim:
+        return self._dim
+
+    @property
+    def dims(self) -> Dims:
+        return self._dims
+
+    @property
+    def unit(self) -> UnitImplementation | None:
+        return self._unit
+
+    @property
+    def dtype(self) -> DType:
+        return self._buffer.dtype
+
+    @property
+    def capacity(self) -> int:
+        """Number of frames that fit in the buffer without reallocation."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def array(self) -> DimensionedArray:
+        """
+        View of the filled region of the buffer.
+
+        The view shares memory with the buffer. It remains valid after further
+        appends but may then refer to stale data in ring mode, or to a buffer that
+        is no longer in use after a reallocation.
+        """
+        if self._ring:
+            stop = self._end + self._capacity
+            key = self._key(stop - self._size, stop)
+        else:
+            key = self._key(0, self._size)
+        return DimensionedArray(
+            values=self._buffer[key], dims=self._dims, unit=self._unit
+        )
+
+    def _check_compatible(self, array: DimensionedArray) -> DimensionedArray:
+        if self._dim not in array.dims:
+            frame_dims = tuple(d for d in self._dims if d != self._dim)
+            if array.dims != frame_dims:
+                raise ValueError("All arrays must have the same dims")
+            from .array_api_manipulation_functions import expand_dims, permute_dims
+
+            array = permute_dims(expand_dims(array, {self._dim: 1}), self._dims)
+        if array.dims != self._dims:
+            raise ValueError("All arrays must have the same dims")
+        if array.unit != self._unit:
+            raise ValueError("All arrays must have the same unit")
+        for dim, size in array.sizes.items():
+            if dim != self._dim and size != self._buffer.shape[self._axis_of(dim)]:
+                raise DimensionError(
+                    f"Sizes of dimension '{dim}' do not match: "
+                    f"{self._buffer.shape[self._axis_of(dim)]} != {size}."
+                )
+        if self._xp.result_type(self.dtype, array.dtype) != self.dtype:
+            raise TypeError(
+                f"Cannot append array of dtype {array.dtype} to buffer of dtype "
+                f"{self.dtype}"
+            )
+        return array
+
+    def _axis_of(self, dim: Dim) -> int:
+        return self._dims.index(dim)
+
+    @instrumented('AppendableArray.append')
+    def append(self, array: DimensionedArray) -> None:
+        """
+        Append data along the append dimension.
+
+        Parameters
+        ----------
+        array:
+            Data to append. Must have the same dims (in the same order) and unit as
+            the buffer. If the append dimension is missing, ``array`` is appended
+            as a single frame.
+        """
+        array = self._check_compatible(array)
+        values = array.values
+        count = array.sizes[self._dim]
+        if self._ring:
+            self._append_ring(values, count)
+        else:
+            self._append_grow(values, count)
+
+    def _append_grow(self, values: ArrayImplementation, count: int) -> None:
+        needed = self._size + count
+        if needed > self._capacity:
+            self._capacity = max(2 * self._capacity, needed)
+            shape = list(self._buffer.shape)
+            shape[self._axis] = self._capacity
+            buffer = self._xp.empty(
+                tuple(shape),
+                dtype=self.dtype,
+                device=device(self._buffer),
+            )
+            filled = self._key(0, self._size)
+            buffer[filled] = self._buffer[filled]
+            self._buffer = buffer
+        self._buffer[self._key(self._size, needed)] = values
+        self._size = needed
+
+    def _append_ring(self, values: Any, count: int) -> None:
+        capacity = self._capacity
+        if count > capacity:
+            values = values[self._key(count - capacity, count)]
+            count = capacity
+        offset = 0
+        while offset < count:
+            length = min(count - offset, capacity - self._end)
+            chunk = values[self._key(offset, offset + length)]
+            self._buffer[self._key(self._end, self._end + length)] = chunk
+            self._buffer[
+                self._key(self._end + capacity, self._end + capacity + length)
+            ] = chunk
+            self._end = (self._end + length) % capacity
+            offset += length
+        self._size = min(self._size + count, capacity)
+
+    def __repr__(self) -> str:
+        mode = 'ring' if self._ring else 'grow'
+        return (
+            f"AppendableArray(dim={self._dim!r}, size={self._size}, "
+            f"capacity={self._capacity}, mode={mode!r})"
+        )
+
+
+__all__ = ['AppendableArray']
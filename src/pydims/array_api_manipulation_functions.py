@@ -4,13 +4,17 @@
 Functions from the "Manipulation Functions" section of the Python Array API.
 """
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from itertools import accumulate, pairwise
 from math import prod
 from typing import Any, NoReturn
 
 import array_api_compat
 
-from .dimensioned_array import Dim, DimArr, Dims
+from . import copy_on_write
+from .dimensioned_array import ArrayImplementation, Dim, DimArr, Dims, Shape
+from .memory_functions import _copy_required_error, _copy_values
+from .profiling import instrumented, record_copy
 
 
 def _not_supported_because_it_relies_on_axis_order(
@@ -55,19 +59,124 @@ def moveaxis(*args: Any, **kwargs: Any) -> NoReturn:
     )
 
 
+def _maybe_copy(values: ArrayImplementation, copy: bool | None) -> ArrayImplementation:
+    """Apply the copy argument to the result of an operation that returns a view."""
+    return _copy_values(values) if copy else values
+
+
+def _derived(array: DimArr, values: ArrayImplementation, dims: Dims) -> DimArr:
+    """Return an array with new values and dims, sharing on write if a view."""
+    result = array.__class__(values=values, dims=dims, unit=array.unit)
+    copy_on_write.join_view(array, result)
+    return result
+
+
+def _reshape(
+    name: str, values: ArrayImplementation, shape: Shape, copy: bool | None
+) -> ArrayImplementation:
+    xp = array_api_compat.array_namespace(values)
+    if copy is not False and array_api_compat.is_numpy_array(values):
+        # Copy with the cache-blocked kernel if the new shape needs a copy.
+        if not copy and _reshapes_to_view(values, shape):
+            return values.reshape(shape)
+        return _copy_values(values).reshape(shape)
+    if copy is not False:
+        return xp.reshape(values, shape, copy=copy)
+    if array_api_compat.is_lazy_array(values):
+        return xp.reshape(values, shape)
+    try:
+        return xp.reshape(values, shape, copy=False)
+    except (AttributeError, ValueError):
+        raise _copy_required_error(name) from None
+
+
+def _reshapes_to_view(values: ArrayImplementation, shape: Shape) -> bool:
+    """
+    Return True if strided values can be reshaped to shape without a copy.
+
+    Checked from the strides since NumPy's no-copy reshape copies before it fails.
+    """
+    if prod(shape) != values.size:
+        # Let reshape raise its error.
+        return True
+    if values.size <= 1:
+        return True
+    old = [(n, s) for n, s in zip(values.shape, values.strides, strict=True) if n != 1]
+    new = [n for n in shape if n != 1]
+    i = j = 0
+    while i < len(old):
+        # Find the smallest groups of old and new dims with equal sizes.
+        old_size, new_size = old[i][0], new[j]
+        end, j = i + 1, j + 1
+        while old_size != new_size:
+            if old_size < new_size:
+                old_size *= old[end][0]
+                end += 1
+            else:
+                new_size *= new[j]
+                j += 1
+        # Dims merged into one group must be contiguous with respect to each other.
+        if any(old[k][1] != old[k + 1][0] * old[k + 1][1] for k in range(i, end - 1)):
+            return False
+        i = end
+    return True
+
+
 broadcast_to.__doc__ = _not_supported_axis_order_doc
 moveaxis.__doc__ = _not_supported_axis_order_doc
 reshape.__doc__ = _not_supported_axis_order_doc
 
 
-def concat(arrays: tuple[DimArr, ...], /, *, dim: Dim | None = None) -> DimArr:
+def _common_dims(arrays: list[DimArr]) -> Dims:
+    if not arrays:
+        raise ValueError("Need at least one array")
+    dims = arrays[0].dims
+    if not all(set(arr.dims) == set(dims) for arr in arrays):
+        raise ValueError("All arrays must have the same dims")
+    return dims
+
+
+def _aligned(array: DimArr, dims: Dims, unit: Any) -> DimArr:
+    array = permute_dims(array, dims)
+    if array.unit == unit or array.unit is None or unit is None:
+        return array
+    return array.to(unit=unit, copy=False)
+
+
+def _assemble(
+    arrays: list[DimArr],
+    dims: Dims,
+    shape: Shape,
+    keys: Iterable[dict[Dim, int | slice]],
+) -> DimArr:
+    """Write arrays into the regions of a new array given by keys."""
+    first = arrays[0]
+    xp = array_api_compat.array_namespace(*(arr.values for arr in arrays))
+    dtype = xp.result_type(*{arr.dtype for arr in arrays})
+    out = xp.empty(shape, dtype=dtype, device=array_api_compat.device(first.values))
+    result = first.__class__(values=out, dims=dims, unit=first.unit)
+    for key, arr in zip(keys, arrays, strict=True):
+        result[key] = arr
+    return result
+
+
+def _is_writeable(arrays: list[DimArr]) -> bool:
+    return all(array_api_compat.is_writeable_array(arr.values) for arr in arrays)
+
+
+@instrumented('concat')
+def concat(arrays: Iterable[DimArr], /, *, dim: Dim | None = None) -> DimArr:
     """
     Concatenate arrays along a given dimension.
 
+    The arrays may have different dim orders and different but convertible units.
+    The result has the dim order and unit of the first array. The values are
+    written into a single preallocated output, without intermediate copies.
+
     Parameters
     ----------
     arrays:
-        Arrays to concatenate.
+        Arrays to concatenate. Can be any iterable, such as a generator.
     dim:
         Dimension along which to concatenate. If None, arrays must be 1-D.
 
@@ -76,21 +185,30 @@ def concat(arrays: tuple[DimArr, ...], /, *, dim: Dim | None = None) -> DimArr:
     :
         Concatenated array.
     """
+    arrays = list(arrays)
+    dims = _common_dims(arrays)
     first = arrays[0]
     dim = dim or first.dim
-    if not all(arr.dims == first.dims for arr in arrays):
-        raise ValueError("All arrays must have the same dims")
-    if not all(arr.unit == first.unit for arr in arrays):
-        raise ValueError("All arrays must have the same unit")
-    axis = first.dims.index(dim)
-    values = [arr.values for arr in arrays]
-    xp = array_api_compat.array_namespace(*values)
-    return first.__class__(
-        values=xp.concat(values, axis=axis), dims=first.dims, unit=first.unit
-    )
-
-
-def expand_dims(array: DimArr, /, sizes: dict[Dim, int]) -> DimArr:
+    axis = dims.index(dim)
+    record_copy()
+    if not _is_writeable(arrays):
+        values = [_aligned(arr, dims, first.unit).values for arr in arrays]
+        xp = array_api_compat.array_namespace(*values)
+        return first.__class__(
+            values=xp.concat(values, axis=axis), dims=dims, unit=first.unit
+        )
+    lengths = [arr.sizes[dim] for arr in arrays]
+    offsets = [0, *accumulate(lengths)]
+    shape = list(first.shape)
+    shape[axis] = offsets[-1]
+    keys = ({dim: slice(start, stop)} for start, stop in pairwise(offsets))
+    return _assemble(arrays, dims, tuple(shape), keys)
+
+
+@instrumented('expand_dims')
+def expand_dims(
+    array: DimArr, /, sizes: dict[Dim, int], *, copy: bool | None = None
+) -> DimArr:
     """
     Expand an array by adding new dimensions of the given sizes at the beginning.
 
@@ -106,6 +224,9 @@ def expand_dims(array: DimArr, /, sizes: dict[Dim, int]) -> DimArr:
         Array to expand.
     sizes:
         Ordered names and sizes of the new dimensions.
+    copy:
+        If True, return a copy with the broadcast values materialized. Otherwise
+        the result is a broadcast view of the input values.
 
     Returns
     -------
@@ -116,23 +237,29 @@ def expand_dims(array: DimArr, /, sizes: dict[Dim, int]) -> DimArr:
         raise ValueError("New dims must not overlap with old dims")
     shape = (*sizes.values(), *array.shape)
     dims = (*sizes.keys(), *array.dims)
-    return array.__class__(
-        values=array.array_namespace.broadcast_to(array.values, shape),
+    return _derived(
+        array,
+        values=_maybe_copy(
+            array.array_namespace.broadcast_to(array.values, shape), copy
+        ),
         dims=dims,
-        unit=array.unit,
     )
 
 
+@instrumented('flatten')
 def flatten(
     array: DimArr,
     /,
     *,
     dims: tuple[Dim, ...] | None = None,
     dim: Dim | None = None,
+    copy: bool | None = None,
 ) -> DimArr:
     """
     Flatten a set of dimensions into a single dimension.
 
+    The result is a view of the input values if the memory layout allows for this.
+
     Parameters
     ----------
     array:
@@ -141,6 +268,9 @@ def flatten(
         Dimensions to flatten.
     dim:
         Name of the new dimension.
+    copy:
+        If True, always copy. If False, never copy and raise ValueError if a copy
+        would be required. If None, copy only if required.
 
     Returns
     -------
@@ -161,14 +291,24 @@ def flatten(
     if dim in new_dims:
         raise ValueError("Output dim must not be in preserved dims")
     new_dims[min(axes) : min(axes)] = [dim]
-    values = array.array_namespace.reshape(array.values, shape)
-    return array.__class__(values=values, dims=new_dims, unit=array.unit)
+    values = _reshape('flatten', array.values, tuple(shape), copy)
+    return _derived(array, values=values, dims=new_dims)
 
 
-def fold(array: DimArr, /, dim: Dim, *, sizes: Mapping[Dim, int]) -> DimArr:
+@instrumented('fold')
+def fold(
+    array: DimArr,
+    /,
+    dim: Dim,
+    *,
+    sizes: Mapping[Dim, int],
+    copy: bool | None = None,
+) -> DimArr:
     """
     Fold a dimension of an array into a new set of dimensions.
 
+    The result is a view of the input values if the memory layout allows for this.
+
     Parameters
     ----------
     array:
@@ -177,6 +317,9 @@ def fold(array: DimArr, /, dim: Dim, *, sizes: Mapping[Dim, int]) -> DimArr:
         Dimension to fold.
     sizes:
         Sizes of the dimensions after folding.
+    copy:
+        If True, always copy. If False, never copy and raise ValueError if a copy
+        would be required. If None, copy only if required.
 
     Returns
     -------
@@ -192,20 +335,26 @@ def fold(array: DimArr, /, dim: Dim, *, sizes: Mapping[Dim, int]) -> DimArr:
     dims[axis : axis + 1] = sizes.keys()
     if len(dims) != len(set(dims)):
         raise ValueError("Duplicate dimensions")
-    values = array.array_namespace.reshape(array.values, shape)
-    return array.__class__(values=values, dims=dims, unit=array.unit)
+    values = _reshape('fold', array.values, tuple(shape), copy)
+    return _derived(array, values=values, dims=dims)
 
 
-def permute_dims(array: DimArr, /, dims: Dims) -> DimArr:
+@instrumented('permute_dims')
+def permute_dims(array: DimArr, /, dims: Dims, *, copy: bool | None = None) -> DimArr:
     """
     Permute the dimensions of an array.
 
+    Unless a copy is requested, the result is a view of the input values.
+
     Parameters
     ----------
     array:
         Array to permute.
     dims:
         New order of dimensions.
+    copy:
+        If True, return a copy with values contiguous in the new order. Otherwise
+        return a view.
 
     Returns
     -------
@@ -216,19 +365,30 @@ def permute_dims(array: DimArr, /, dims: Dims) -> DimArr:
         raise ValueError("New dims must contain all old dims")
     axes = [array.dims.index(dim) for dim in dims]
     values = array.array_namespace.permute_dims(array.values, axes=axes)
-    return array.__class__(values=values, dims=dims, unit=array.unit)
+    return _derived(array, values=_maybe_copy(values, copy), dims=dims)
 
 
-def squeeze(array: DimArr, /, dim: Dim | tuple[Dim, ...] | None = None) -> DimArr:
+@instrumented('squeeze')
+def squeeze(
+    array: DimArr,
+    /,
+    dim: Dim | tuple[Dim, ...] | None = None,
+    *,
+    copy: bool | None = None,
+) -> DimArr:
     """
     Remove dimensions of size 1.
 
+    Unless a copy is requested, the result is a view of the input values.
+
     Parameters
     ----------
     array:
         Array to squeeze.
     dim:
         Dimensions to remove. If None, remove all dimensions of size 1.
+    copy:
+        If True, return a copy. Otherwise return a view.
 
     Returns
     -------
@@ -244,11 +404,12 @@ def squeeze(array: DimArr, /, dim: Dim | tuple[Dim, ...] | None = None) -> DimAr
     dims = [d for d in array.dims if d not in dim]
     axis = tuple(array.dims.index(d) for d in dim)
     values = array.array_namespace.squeeze(array.values, axis=axis)
-    return array.__class__(values=values, dims=dims, unit=array.unit)
+    return _derived(array, values=_maybe_copy(values, copy), dims=dims)
 
 
+@instrumented('stack')
 def stack(
-    arrays: tuple[DimArr, ...] | list[DimArr],
+    arrays: Iterable[DimArr],
     /,
     *,
     dim: Dim,
@@ -257,10 +418,14 @@ def stack(
     """
     Stack arrays along a new dimension.
 
+    The arrays may have different dim orders and different but convertible units.
+    The result has the dim order and unit of the first array. The values are
+    written into a single preallocated output, without intermediate copies.
+
     Parameters
     ----------
     arrays:
-        Arrays to stack.
+        Arrays to stack. Can be any iterable, such as a generator.
     dim:
         Dimension along which to stack.
     axis:
@@ -271,20 +436,24 @@ def stack(
     :
         Stacked array.
     """
+    arrays = list(arrays)
+    first_dims = _common_dims(arrays)
     first = arrays[0]
-    if dim in first.dims:
+    if dim in first_dims:
         raise ValueError("Dimension already exists, did you mean to use `concat`?")
-    if not all(arr.dims == first.dims for arr in arrays):
-        raise ValueError("All arrays must have the same dims")
-    if not all(arr.unit == first.unit for arr in arrays):
-        raise ValueError("All arrays must have the same unit")
-    dims = list(first.dims)
+    dims = list(first_dims)
     dims.insert(axis if axis >= 0 else first.ndim + 1 + axis, dim)
-    values = [arr.values for arr in arrays]
-    xp = array_api_compat.array_namespace(*values)
-    return first.__class__(
-        values=xp.stack(values, axis=axis), dims=dims, unit=first.unit
-    )
+    record_copy()
+    if not _is_writeable(arrays):
+        values = [_aligned(arr, first_dims, first.unit).values for arr in arrays]
+        xp = array_api_compat.array_namespace(*values)
+        return first.__class__(
+            values=xp.stack(values, axis=axis), dims=dims, unit=first.unit
+        )
+    shape = list(first.shape)
+    shape.insert(dims.index(dim), len(arrays))
+    keys = ({dim: i} for i in range(len(arrays)))
+    return _assemble(arrays, tuple(dims), tuple(shape), keys)
 
 
 __all__ = [
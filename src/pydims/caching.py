@@ -0,0 +1,289 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Content fingerprints and memoization of functions of arrays.
+
+:py:func:`fingerprint` identifies an array by its dims, unit, dtype, shape, and
+values. :py:func:`memoize` uses it to cache the results of expensive functions:
+
+.. code-block:: python
+
+    @pydims.caching.memoize(maxsize=16, directory='~/.cache/my-pipeline')
+    def reduce_run(data):
+        return pydims.sum(data, dim='event')
+
+Arrays are not copied when they are cached, so inputs and results must not be
+modified in place after they were passed to or returned by a memoized function.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import numbers
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+# Bytes hashed per task. Hashing releases the GIL, so blocks are hashed in parallel.
+_BLOCK_SIZE = 1 << 22
+_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _hash_block(block: memoryview) -> bytes:
+    return hashlib.blake2b(block, digest_size=16).digest()
+
+
+def _values_token(values: Any) -> str:
+    from array_api_compat import is_dask_array, is_lazy_array
+
+    if is_dask_array(values):
+        from dask.base import tokenize
+
+        return f'dask-{tokenize(values)}'
+    if is_lazy_array(values):
+        raise TypeError(
+            f"Cannot fingerprint lazy array of type {type(values).__name__}"
+        )
+    import numpy as np
+
+    data = np.ascontiguousarray(np.asarray(values)).reshape(-1).view(np.uint8).data
+    blocks = [
+        data[start : start + _BLOCK_SIZE] for start in range(0, len(data), _BLOCK_SIZE)
+    ]
+    if len(blocks) > 1:
+        with ThreadPoolExecutor(min(_MAX_WORKERS, len(blocks))) as pool:
+            digests = list(pool.map(_hash_block, blocks))
+    else:
+        digests = [_hash_block(block) for block in blocks]
+    return hashlib.blake2b(b''.join(digests), digest_size=16).hexdigest()
+
+
+def fingerprint(x: Any) -> str:
+    """
+    Return a fingerprint of the dims, unit, dtype, shape, indexes, and values.
+
+    Equal arrays have equal fingerprints, across processes and sessions. Values
+    are hashed in blocks in parallel. For Dask arrays the token of the task graph
+    is used, so the values are not computed.
+
+    Parameters
+    ----------
+    x:
+        Input array.
+
+    Returns
+    -------
+    :
+        Hexadecimal digest.
+    """
+    header = (
+        type(x).__name__,
+        x.dims,
+        type(x.unit).__name__,
+        str(x.unit),
+        str(x.dtype),
+        x.shape,
+        tuple(
+            (dim, fingerprint(index.coord)) for dim, index in sorted(x.indexes.items())
+        ),
+    )
+    digest = hashlib.blake2b(repr(header).encode(), digest_size=16)
+    digest.update(_values_token(x.values).encode())
+    return digest.hexdigest()
+
+
+def _key_part(value: Any) -> Any:
+    from .dimensioned_array import DimensionedArray
+
+    if isinstance(value, DimensionedArray):
+        return ('array', fingerprint(value))
+    if value is None or isinstance(value, str | bytes | bool | numbers.Number):
+        return (type(value).__name__, repr(value))
+    if isinstance(value, tuple | list):
+        return (type(value).__name__, tuple(_key_part(item) for item in value))
+    if isinstance(value, dict):
+        return ('dict', tuple(sorted((k, _key_part(v)) for k, v in value.items())))
+    raise TypeError(f"Cannot memoize argument of type {type(value).__name__}")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics returned by ``cache_info()`` of memoized functions."""
+
+    hits: int
+    disk_hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    disk_bytes: int
+
+
+class _Cache:
+    """Least recently used in-memory cache, spilling evicted entries to disk."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        directory: str | os.PathLike[str] | None,
+        max_disk_bytes: int,
+    ) -> None:
+        self._maxsize = maxsize
+        self._directory = None if directory is None else Path(directory).expanduser()
+        self._max_disk_bytes = max_disk_bytes
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _path(directory: Path, key: str) -> Path:
+        return directory / f'{key}.pkl'
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+        if self._directory is not None:
+            path = self._path(self._directory, key)
+            try:
+                with path.open('rb') as f:
+                    value = pickle.load(f)  # noqa: S301
+            except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+                pass
+            else:
+                path.touch()
+                with self._lock:
+                    self.disk_hits += 1
+                self.put(key, value)
+                return True, value
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            evicted = []
+            while len(self._entries) > self._maxsize:
+                evicted.append(self._entries.popitem(last=False))
+        for item in evicted:
+            self._spill(*item)
+
+    def _spill(self, key: str, value: Any) -> None:
+        if self._directory is None:
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(self._directory, key)
+        tmp = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        with tmp.open('wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+        self._evict_disk(self._directory)
+
+    @staticmethod
+    def _files(directory: Path) -> list[tuple[float, int, Path]]:
+        files = []
+        for path in directory.glob('*.pkl'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _evict_disk(self, directory: Path) -> None:
+        files = sorted(self._files(directory))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self._max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def disk_bytes(self) -> int:
+        if self._directory is None or not self._directory.exists():
+            return 0
+        return sum(size for _, size, _ in self._files(self._directory))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if self._directory is not None and self._directory.exists():
+            for path in self._directory.glob('*.pkl'):
+                path.unlink(missing_ok=True)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            counts = (self.hits, self.disk_hits, self.misses)
+            currsize = len(self._entries)
+        return CacheInfo(*counts, self._maxsize, currsize, self.disk_bytes())
+
+
+def memoize(
+    func: _F | None = None,
+    *,
+    maxsize: int = 128,
+    directory: str | os.PathLike[str] | None = None,
+    max_disk_bytes: int = 1 << 30,
+) -> Any:
+    """
+    Decorator caching the results of a function of arrays.
+
+    Arguments are identified by their :py:func:`fingerprint` for arrays, and by
+    value for strings, numbers, None, and tuples, lists, and dicts thereof. Other
+    arguments raise TypeError.
+
+    The decorated function has ``cache_info()`` and ``cache_clear()`` methods,
+    like functions decorated with :py:func:`functools.lru_cache`.
+
+    Parameters
+    ----------
+    func:
+        Function to decorate. Can be omitted to pass options.
+    maxsize:
+        Maximum number of results kept in memory. The least recently used result
+        is evicted first.
+    directory:
+        If given, results evicted from memory are pickled to files in this
+        directory, where they are found also by later sessions.
+    max_disk_bytes:
+        Maximum total size of the files in ``directory``. The least recently used
+        files are deleted first.
+    """
+    if maxsize < 1:
+        raise ValueError("maxsize must be positive")
+
+    def decorator(func: _F) -> _F:
+        cache = _Cache(maxsize, directory, max_disk_bytes)
+        name = f'{func.__module__}.{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            parts = (name, _key_part(args), _key_part(kwargs))
+            key = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+            found, result = cache.get(key)
+            if not found:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache_info = cache.info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator if func is None else decorator(func)
+
+
+__all__ = ['CacheInfo', 'fingerprint', 'memoize']
@@ -2,16 +2,20 @@
 # Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
 from __future__ import annotations
 
-from collections.abc import Callable
+import numbers
+from collections.abc import Callable, Mapping
+from typing import Any
 
 from .dimensioned_array import (
     ArrayImplementation,
+    Dim,
     DimArr,
     DimensionedArray,
     DimensionError,
     Dims,
     UnitImplementation,
 )
+from .profiling import record_strided_operand
 
 _pretty_project = "PyDims"
 
@@ -31,18 +35,22 @@ def broadcast_and_transpose_values(
             values = array.array_namespace.expand_dims(values, axis=0)
     new_dims = (*(set(dims) - set(array.dims)), *array.dims)
     axes = tuple(new_dims.index(dim) for dim in dims)
+    if [dim for dim in dims if dim in array.dims] != list(array.dims):
+        # The library iterates over the permuted values with strided access.
+        record_strided_operand()
     return array.array_namespace.permute_dims(values, axes=axes)
 
 
 def check_compatible_dims_and_shape(x: DimensionedArray, y: DimensionedArray) -> None:
-    shared = set(x.dims) & set(y.dims)
+    check_compatible_sizes(x.sizes, y.sizes)
+
+
+def check_compatible_sizes(x: Mapping[Dim, int], y: Mapping[Dim, int]) -> None:
+    shared = [dim for dim in x if dim in y]
     for dim in shared:
-        if x.sizes[dim] != y.sizes[dim]:
-            msg = (
-                f"Sizes of dimension '{dim}' do not match: "
-                f"{x.sizes[dim]} != {y.sizes[dim]}."
-            )
-            if x.sizes[dim] == 1 or y.sizes[dim] == 1:
+        if x[dim] != y[dim]:
+            msg = f"Sizes of dimension '{dim}' do not match: {x[dim]} != {y[dim]}."
+            if x[dim] == 1 or y[dim] == 1:
                 msg += f" Note: {_pretty_project} never broadcasts dims of size 1."
             raise DimensionError(msg)
 
@@ -60,6 +68,127 @@ def unary(
     )
 
 
+def scalar_operand(value: Any) -> tuple[Any, UnitImplementation | None] | None:
+    """
+    Return the magnitude and unit of a scalar operand, or None if it is not one.
+
+    Scalar operands are Python and NumPy scalars, and scalar quantities with a
+    ``magnitude`` and ``units`` (Pint) or a ``value`` and ``unit`` (Astropy).
+    Magnitudes are returned as Python scalars, which array libraries treat as
+    weakly typed.
+    """
+    if isinstance(value, numbers.Number):
+        return _python_scalar(value), None
+    if hasattr(value, 'magnitude') and hasattr(value, 'units'):
+        magnitude, unit = value.magnitude, value.units
+    elif hasattr(value, 'value') and hasattr(value, 'unit'):
+        magnitude, unit = value.value, value.unit
+    else:
+        return None
+    if not isinstance(magnitude, numbers.Number):
+        return None
+    return _python_scalar(magnitude), unit
+
+
+def _python_scalar(value: numbers.Number) -> numbers.Number:
+    item = getattr(value, 'item', None)
+    return value if item is None else item()
+
+
+def elemwise_scalar(
+    x: DimArr,
+    /,
+    y: Any,
+    *,
+    values_op: Callable[[Any, Any], ArrayImplementation],
+    unit_op: Callable[[UnitImplementation, UnitImplementation], UnitImplementation],
+    reflected: bool = False,
+) -> DimArr:
+    """
+    Apply a binary operation to an array and a scalar operand.
+
+    The unit operation is applied once and the values operation uses the
+    backend's scalar kernel, without broadcasting or transposing. Returns
+    NotImplemented if y is not a scalar operand, see :py:func:`scalar_operand`.
+    A scalar without unit is dimensionless, unless x has no unit.
+    """
+    operand = scalar_operand(y)
+    if operand is None:
+        return NotImplemented
+    scalar, unit = operand
+    if unit is None and x.unit is not None:
+        unit = x.units_namespace.dimensionless
+    if reflected:
+        values = values_op(scalar, x.values)
+        new_unit = None if unit is None and x.unit is None else unit_op(unit, x.unit)
+    else:
+        values = values_op(x.values, scalar)
+        new_unit = None if unit is None and x.unit is None else unit_op(x.unit, unit)
+    return x._new(values, x.dims, new_unit)
+
+
+def promote_values(
+    a: ArrayImplementation, b: ArrayImplementation
+) -> tuple[ArrayImplementation, ArrayImplementation]:
+    """
+    Convert values of different array libraries to a common library.
+
+    The arrays must have the same number of dimensions. Lazy arrays take precedence,
+    so that mixing, e.g., a small NumPy array with a large Dask array does not
+    trigger a computation. Otherwise NumPy arrays are converted to the other
+    library, e.g., to move a calibration table to the device of a GPU array.
+    NumPy arrays combined with Dask arrays become a Dask array with chunks aligned
+    to those of the other operand.
+    """
+    if a.__class__ is b.__class__:
+        return a, b
+    from array_api_compat import (
+        array_namespace,
+        is_dask_array,
+        is_lazy_array,
+        is_numpy_array,
+    )
+
+    try:
+        array_namespace(a, b)
+    except TypeError:
+        pass
+    else:
+        return a, b
+    if is_lazy_array(a) != is_lazy_array(b):
+        swap = is_lazy_array(a)
+    elif is_numpy_array(a) != is_numpy_array(b):
+        swap = not is_numpy_array(a)
+    else:
+        raise TypeError(
+            f"Cannot combine arrays of types {a.__class__} and {b.__class__}"
+        )
+    # Convert `a` to the library of `b`.
+    if swap:
+        a, b = b, a
+    if is_dask_array(b) and is_numpy_array(a):
+        a = _as_dask_array(a, template=b)
+    else:
+        a = array_namespace(b).asarray(a)
+    return (b, a) if swap else (a, b)
+
+
+def _as_dask_array(
+    values: ArrayImplementation, template: ArrayImplementation
+) -> ArrayImplementation:
+    import dask.array as da
+
+    # Use the chunks of template along shared dims and one chunk along broadcast
+    # dims, so no rechunking is needed to combine the arrays.
+    chunks = tuple(
+        chunk if size == template_size else size
+        for chunk, size, template_size in zip(
+            template.chunks, values.shape, template.shape, strict=True
+        )
+    )
+    return da.from_array(values, chunks=chunks)
+
+
 def elemwise_binary(
     x: DimArr,
     /,
@@ -70,19 +199,30 @@ def elemwise_binary(
     ],
     unit_op: Callable[[UnitImplementation, UnitImplementation], UnitImplementation],
 ) -> DimArr:
+    if not x.dims and not y.dims:
+        # Nothing to align for 0-d operands, e.g., results of full reductions.
+        values = values_op(*promote_values(x.values, y.values))
+        return x._new(values, (), _binary_unit(x, y, unit_op))
     check_compatible_dims_and_shape(x, y)
     dims = _merge_dims(x.dims, y.dims)
-    # TODO What if y.__class__ != x.__class__?
     return x.__class__(
         values=values_op(
-            broadcast_and_transpose_values(array=x, dims=dims),
-            broadcast_and_transpose_values(array=y, dims=dims),
+            *promote_values(
+                broadcast_and_transpose_values(array=x, dims=dims),
+                broadcast_and_transpose_values(array=y, dims=dims),
+            )
         ),
         dims=dims,
-        unit=(
-            None
-            # TODO do not mix unit with None
-            if x.unit is None and y.unit is None
-            else unit_op(x.unit, y.unit)
-        ),
+        unit=_binary_unit(x, y, unit_op),
     )
+
+
+def _binary_unit(
+    x: DimensionedArray,
+    y: DimensionedArray,
+    unit_op: Callable[[UnitImplementation, UnitImplementation], UnitImplementation],
+) -> UnitImplementation | None:
+    # TODO do not mix unit with None
+    if x.unit is None and y.unit is None:
+        return None
+    return unit_op(x.unit, y.unit)
@@ -0,0 +1,272 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Coordinate index for label-based selection.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+from .dimensioned_array import (
+    Dim,
+    DimensionedArray,
+    DimensionError,
+    UnitImplementation,
+    UnitsError,
+)
+
+_UNIFORM_RTOL = 1e-9
+
+
+class CoordinateIndex:
+    """
+    Index mapping coordinate values (labels) of a dimension to positions.
+
+    The index wraps a 1-D coordinate array. Whether the coordinate is sorted and
+    whether it is uniformly spaced is computed once, on first use, and cached.
+    Lookups then use arithmetic for uniform coordinates, binary search for sorted
+    coordinates, and a linear scan otherwise.
+    """
+
+    def __init__(self, coord: DimensionedArray):
+        """
+        Parameters
+        ----------
+        coord:
+            1-D array of coordinate values.
+        """
+        if coord.ndim != 1:
+            raise DimensionError("Coordinate of an index must be 1-D")
+        self._coord = coord
+        self._is_sorted: bool | None = None
+        self._step: float | None = None
+        self._step_known = False
+
+    def __len__(self) -> int:
+        return self._coord.shape[0]
+
+    def __getitem__(self, key: slice) -> CoordinateIndex:
+        """Return the index of a positional slice of the coordinate."""
+        index = CoordinateIndex(self._coord[key])
+        if key.step is None or key.step > 0:
+            index._is_sorted = self._is_sorted
+        return index
+
+    @property
+    def coord(self) -> DimensionedArray:
+        """The underlying coordinate."""
+        return self._coord
+
+    @property
+    def dim(self) -> Dim:
+        return self._coord.dim
+
+    @property
+    def unit(self) -> UnitImplementation | None:
+        return self._coord.unit
+
+    @property
+    def is_sorted(self) -> bool:
+        """True if the coordinate is sorted in ascending order."""
+        if self._is_sorted is None:
+            values = self._coord.values
+            xp = self._coord.array_namespace
+            self._is_sorted = bool(xp.all(values[1:] >= values[:-1]))
+        return self._is_sorted
+
+    @property
+    def step(self) -> float | None:
+        """Spacing of a sorted, uniformly spaced coordinate, None otherwise."""
+        if not self._step_known:
+            self._step = self._compute_step()
+            self._step_known = True
+        return self._step
+
+    def _compute_step(self) -> float | None:
+        if len(self) < 2 or not self.is_sorted:
+            return None
+        values = self._coord.values
+        xp = self._coord.array_namespace
+        step = (float(values[-1]) - float(values[0])) / (len(self) - 1)
+        if step <= 0:
+            return None
+        diff = values[1:] - values[:-1]
+        if float(xp.max(diff)) - float(xp.min(diff)) > _UNIFORM_RTOL * step:
+            return None
+        return step
+
+    def _in_index_unit(self, label: Any) -> Any:
+        if isinstance(label, DimensionedArray):
+            if (label.unit is None) != (self.unit is None):
+                raise UnitsError(
+                    f"Unit of label ({label.unit}) is incompatible with unit of "
+                    f"index ({self.unit})"
+                )
+            if label.unit is not None and label.unit != self.unit:
+                label = label.to(unit=self.unit)
+            return label.values
+        if self.unit is not None:
+            raise UnitsError(
+                f"Label for index with unit {self.unit} must be a DimensionedArray "
+                "with a unit"
+            )
+        return label
+
+    def _label_value(self, label: Any) -> float | int:
+        if isinstance(label, DimensionedArray) and label.ndim != 0:
+            raise DimensionError("Label must be a scalar (0-D) array")
+        label = self._in_index_unit(label)
+        xp = self._coord.array_namespace
+        value = float(label)
+        if xp.isdtype(self._coord.dtype, 'integral') and value.is_integer():
+            # Convert the label, not value, to stay exact beyond 2**53.
+            return int(label)
+        return value
+
+    def _searchsorted(self, value: float) -> int:
+        """Return the position of the first coordinate value not less than value."""
+        values = self._coord.values
+        xp = self._coord.array_namespace
+        if xp.isdtype(values.dtype, 'integral'):
+            # Labels must neither overflow nor be truncated to the integer dtype.
+            # For fractional labels, the first integer not less than the label has
+            # the same position.
+            info = xp.iinfo(values.dtype)
+            if not value <= info.max:
+                return len(self)
+            if value < info.min:
+                return 0
+            value = math.ceil(value)
+        return int(xp.searchsorted(values, xp.asarray(value, dtype=values.dtype)))
+
+    def _not_found(self, label: Any) -> KeyError:
+        return KeyError(f"Label {label} not found in index of dimension '{self.dim}'")
+
+    def position(self, label: Any, *, method: str | None = None) -> int:
+        """
+        Return the position of a label.
+
+        Parameters
+        ----------
+        label:
+            Scalar label. Must be a 0-D array with a unit convertible to the unit of
+            the index, or a plain number if the index has no unit.
+        method:
+            None for an exact match, or ``'nearest'`` for the position of the
+            closest coordinate value.
+
+        Returns
+        -------
+        :
+            Position of the label along the dimension of the index.
+        """
+        if method not in (None, 'nearest'):
+            raise ValueError(f"Unknown method '{method}', expected None or 'nearest'")
+        value = self._label_value(label)
+        values = self._coord.values
+        xp = self._coord.array_namespace
+        if (step := self.step) is not None:
+            pos = round((value - float(values[0])) / step)
+            pos = min(max(pos, 0), len(self) - 1)
+            if method is None and abs(float(values[pos]) - value) > (
+                _UNIFORM_RTOL * step
+            ):
+                raise self._not_found(label)
+            return pos
+        if self.is_sorted:
+            pos = self._searchsorted(value)
+            if method is None:
+                if pos == len(self) or values[pos] != value:
+                    raise self._not_found(label)
+                return pos
+            if pos == len(self):
+                return pos - 1
+            if pos > 0 and value - values[pos - 1] <= values[pos] - value:
+                return pos - 1
+            return pos
+        if method is None:
+            (matches,) = xp.nonzero(values == value)
+            if matches.shape[0] == 0:
+                raise self._not_found(label)
+            return int(matches[0])
+        return int(xp.argmin(xp.abs(values - value)))
+
+    def positions(
+        self, labels: DimensionedArray, *, method: str | None = None
+    ) -> DimensionedArray:
+        """
+        Return the positions of a 1-D array of labels.
+
+        Parameters
+        ----------
+        labels:
+            1-D array of labels with a unit convertible to the unit of the index.
+        method:
+            None for exact matches, or ``'nearest'`` for the positions of the
+            closest coordinate values.
+
+        Returns
+        -------
+        :
+            Integer array of positions with the dimension of ``labels``.
+        """
+        if labels.ndim != 1:
+            raise DimensionError("Labels must be 1-D")
+        if not self.is_sorted:
+            positions = [
+                self.position(labels[i], method=method) for i in range(labels.shape[0])
+            ]
+            return DimensionedArray(
+                dims=labels.dims,
+                values=self._coord.array_namespace.asarray(positions),
+                unit=None,
+            )
+        if method not in (None, 'nearest'):
+            raise ValueError(f"Unknown method '{method}', expected None or 'nearest'")
+        values = self._coord.values
+        xp = self._coord.array_namespace
+        query = self._in_index_unit(labels)
+        pos = xp.searchsorted(values, query)
+        right = xp.clip(pos, max=len(self) - 1)
+        if method is None:
+            found = (pos < len(self)) & (xp.take(values, right) == query)
+            if not bool(xp.all(found)):
+                (missing,) = xp.nonzero(~found)
+                raise self._not_found(labels[int(missing[0])].values)
+            return DimensionedArray(dims=labels.dims, values=pos, unit=None)
+        left = xp.clip(pos - 1, min=0)
+        closer_left = query - xp.take(values, left) <= xp.take(values, right) - query
+        return DimensionedArray(
+            dims=labels.dims, values=xp.where(closer_left, left, right), unit=None
+        )
+
+    def slice(self, start: Any = None, stop: Any = None) -> slice:
+        """
+        Return the positional slice for a half-open label range [start, stop).
+
+        Parameters
+        ----------
+        start:
+            Lower bound of the label range, None for an open lower bound.
+        stop:
+            Upper bound of the label range (excluded), None for an open upper bound.
+
+        Returns
+        -------
+        :
+            Positional slice selecting all coordinate values in the label range.
+        """
+        if not self.is_sorted:
+            raise ValueError(
+                f"Label-based slicing requires a sorted index, but the index of "
+                f"dimension '{self.dim}' is not sorted"
+            )
+        return slice(
+            None if start is None else self._searchsorted(self._label_value(start)),
+            None if stop is None else self._searchsorted(self._label_value(stop)),
+        )
+
+
+__all__ = ['CoordinateIndex']
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Opt-in copy-on-write mode.
+
+In copy-on-write mode, :py:meth:`DimensionedArray.astype` and
+:py:meth:`DimensionedArray.to` with ``copy=True`` and nothing to convert, as well
+as :py:meth:`DimensionedArray.__getitem__`, return arrays that share their values
+with the original. The values are copied only when one of the sharing arrays is
+modified with :py:meth:`DimensionedArray.__setitem__`.
+
+NumPy values returned by :py:attr:`DimensionedArray.values` are read-only views.
+Arrays created from such views by other operations, e.g., :py:func:`permute_dims`,
+copy their values before they are modified. They are not tracked by the original
+array, so they reflect modifications of the original made with ``__setitem__``.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from .dimensioned_array import ArrayImplementation, DimensionedArray
+
+_options = {'enabled': False}
+
+
+def set_copy_on_write(enabled: bool) -> bool:
+    """
+    Enable or disable copy-on-write mode.
+
+    Parameters
+    ----------
+    enabled:
+        If True, arrays share values until they are modified.
+
+    Returns
+    -------
+    :
+        The previous setting, which can be passed back to restore it.
+    """
+    previous = _options['enabled']
+    _options['enabled'] = bool(enabled)
+    return previous
+
+
+def is_enabled() -> bool:
+    """Return True if copy-on-write mode is enabled."""
+    return _options['enabled']
+
+
+def read_only(values: ArrayImplementation) -> ArrayImplementation:
+    """Return a read-only view of NumPy values, other values unchanged."""
+    flags = getattr(values, 'flags', None)
+    if flags is None or not flags.writeable or not hasattr(values, 'view'):
+        return values
+    view = values.view()
+    view.flags.writeable = False
+    return cast('ArrayImplementation', view)
+
+
+def is_read_only(values: ArrayImplementation) -> bool:
+    flags = getattr(values, 'flags', None)
+    return flags is not None and not flags.writeable
+
+
+def join(source: DimensionedArray, target: DimensionedArray) -> None:
+    """Record that target shares the values of source."""
+    if source._shared is None:
+        source._shared = weakref.WeakSet([source])
+    source._shared.add(target)
+    target._shared = source._shared
+
+
+def join_view(source: DimensionedArray, target: DimensionedArray) -> None:
+    """Record that target shares the values of source if it may be a view of them."""
+    if not _options['enabled']:
+        return
+    from array_api_compat import is_numpy_array
+
+    a, b = source._values, target._values
+    if is_numpy_array(a) and is_numpy_array(b):
+        import numpy as np
+
+        if not np.may_share_memory(a, b):
+            return
+    join(source, target)
+
+
+def must_copy(x: DimensionedArray) -> bool:
+    """
+    Leave the share group of x and return True if its values must be copied.
+
+    This must be called before modifying the values of x in place.
+    """
+    group: Any = x._shared
+    x._shared = None
+    if group is not None:
+        group.discard(x)
+        if len(group) > 0:
+            return True
+    return _options['enabled'] and is_read_only(x._values)
+
+
+__all__ = ['set_copy_on_write']
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from types import ModuleType
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from array_api_compat import array_namespace
 
@@ -17,6 +17,9 @@ from .dimensioned_array import (
 )
 from .units_api_compat import units_namespace
 
+if TYPE_CHECKING:
+    from .random_functions import RandomFunctions
+
 _default_unit = object()
 
 
@@ -25,6 +28,13 @@ class CreationFunctions:
         self._array_api = array_namespace(array.zeros(0))
         self._unit_api = None if units is None else units_namespace(units.Unit(''))
 
+    @property
+    def random(self) -> RandomFunctions:
+        """Functions creating arrays of random values."""
+        from .random_functions import RandomFunctions
+
+        return RandomFunctions(self)
+
     def _maybe_unit(
         self, unit: Any | UnitImplementation | None, values: ArrayImplementation
     ) -> UnitImplementation | None:
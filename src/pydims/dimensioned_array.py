@@ -2,14 +2,20 @@
 # Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
 from __future__ import annotations
 
+import numbers
 import operator
+import sys
+import time
 from collections.abc import Hashable, Iterator, Mapping
-from types import EllipsisType
-from typing import Any, Protocol, TypeVar
+from fractions import Fraction
+from types import EllipsisType, MappingProxyType
+from typing import TYPE_CHECKING, Any, NoReturn, Protocol, TypeVar
 
-import array_api_compat
+from . import copy_on_write, units_api_compat
+from .profiling import instrumented, record_unit_conversion
 
-from . import units_api_compat
+if TYPE_CHECKING:
+    from .coordinate_index import CoordinateIndex
 
 DType = Any  # Is the array API standard defining a DType type?
 
@@ -54,17 +60,41 @@ class Sizes(Mapping):
 DimArr = TypeVar('DimArr', bound='DimensionedArray')
 
 
+# True once DimensionedArray is registered as an upcast type of Pint.
+_pint_upcast_registered = False
+
+
+def _register_pint_upcast_type() -> None:
+    # Arrays with Pint units exist only after Pint is imported, so registering on
+    # construction covers all of them without importing Pint eagerly.
+    global _pint_upcast_registered
+    if 'pint' in sys.modules:
+        from .units_api_compat.pint import register_upcast_type
+
+        register_upcast_type()
+        _pint_upcast_registered = True
+
+
 class DimensionedArray:
     """
     Array with named dimensions and optional unit.
     """
 
+    # Opt out of NumPy ufuncs, so that NumPy scalars and Astropy quantities return
+    # NotImplemented and reflected operators such as __rmul__ are used.
+    __array_ufunc__ = None
+    # Arrays sharing values with this array in copy-on-write mode, or None.
+    _shared: Any = None
+    # Maintained reductions updated by __setitem__, or None.
+    _maintained: Any = None
+
     def __init__(
         self,
         *,
         dims: Dims,
         values: ArrayImplementation,
         unit: UnitImplementation | None,
+        indexes: Mapping[Dim, CoordinateIndex] | None = None,
     ):
         """
         Parameters
@@ -75,6 +105,9 @@ class DimensionedArray:
             Array of values.
         unit:
             Optional unit.
+        indexes:
+            Optional coordinate indexes for label-based selection, see
+            :py:meth:`assign_indexes`.
         """
         if len(dims) != values.ndim:
             raise ValueError(
@@ -86,26 +119,55 @@ class DimensionedArray:
         self._values = values
         self._dims = tuple(dims)
         self._unit = unit
+        self._indexes = {} if indexes is None else dict(indexes)
+        if unit is not None and not _pint_upcast_registered:
+            _register_pint_upcast_type()
+        for dim, index in self._indexes.items():
+            if index.dim != dim:
+                raise DimensionError(
+                    f"Index for dimension '{dim}' has dimension '{index.dim}'"
+                )
+            if self.sizes.get(dim) != len(index):
+                raise DimensionError(
+                    f"Index for dimension '{dim}' has length {len(index)} but the "
+                    f"dimension has size {self.sizes.get(dim)}"
+                )
+
+    @classmethod
+    def _new(
+        cls: type[DimArr],
+        values: ArrayImplementation,
+        dims: Dims,
+        unit: UnitImplementation | None,
+    ) -> DimArr:
+        # Fast construction without validation, for hot paths whose dims are known
+        # to be valid for the values, e.g., 0-d results or elementwise results with
+        # the dims of an operand.
+        obj = object.__new__(cls)
+        obj._values = values
+        obj._dims = dims
+        obj._unit = unit
+        obj._indexes = {}
+        return obj
+
+    def __repr__(self) -> str:
+        from .formatting import format_summary
+
+        return format_summary(self)
 
     def __str__(self) -> str:
-        return (
-            f"dims={self.dims}\nshape={self.shape}\n"
-            f"values={self.values}\nunit={self.unit}"
-        )
+        return self.__repr__()
 
     def _repr_html_(self) -> str:
-        dims_str = ", ".join(f"{dim}: {size}" for dim, size in self.sizes.items())
-        return (
-            f"<table><tr>"
-            f"<td>DimensionedArray ({dims_str}):</td>"
-            f"<td>[{self.unit}]</td>"
-            f"<td>{self.values}</td>"
-            f"</tr></table>"
-        )
+        from .formatting import format_html
+
+        return format_html(self)
 
     @property
     def array_namespace(self) -> Any:
-        return array_api_compat.array_namespace(self.values)
+        from array_api_compat import array_namespace
+
+        return array_namespace(self.values)
 
     @property
     def units_namespace(self) -> Any:
@@ -147,25 +209,162 @@ class DimensionedArray:
 
     @property
     def values(self) -> ArrayImplementation:
+        if copy_on_write.is_enabled():
+            return copy_on_write.read_only(self._values)
         return self._values
 
-    def astype(self: DimArr, dtype: DType, copy: bool = True) -> DimArr:
+    def _share(self: DimArr, unit: UnitImplementation | None) -> DimArr:
+        """Return an array sharing the values of this array, copied on write."""
+        shared = self.__class__(
+            values=self._values, dims=self.dims, unit=unit, indexes=self._indexes
+        )
+        copy_on_write.join(self, shared)
+        return shared
+
+    @property
+    def indexes(self) -> Mapping[Dim, CoordinateIndex]:
+        """Coordinate indexes used for label-based selection with :py:func:`sel`."""
+        return MappingProxyType(self._indexes)
+
+    def assign_indexes(
+        self: DimArr, indexes: Mapping[Dim, DimensionedArray | CoordinateIndex]
+    ) -> DimArr:
+        """
+        Return a new array with coordinate indexes attached.
+
+        The values are shared with the original array, i.e., no copy is made.
+        Indexes are preserved by slicing with :py:meth:`__getitem__` but are not
+        propagated by other operations.
+
+        Parameters
+        ----------
+        indexes:
+            Dictionary of dimension names and 1-D coordinate arrays or indexes.
+            Existing indexes of the same dimensions are replaced.
+
+        Returns
+        -------
+        :
+            Array with the given indexes.
+        """
+        from .coordinate_index import CoordinateIndex
+
+        new = {
+            dim: index if isinstance(index, CoordinateIndex) else CoordinateIndex(index)
+            for dim, index in indexes.items()
+        }
         return self.__class__(
-            values=self.array_namespace.astype(self.values, dtype, copy=copy),
+            values=self.values,
             dims=self.dims,
             unit=self.unit,
+            indexes={**self._indexes, **new},
         )
 
-    def _to_unit(self: DimArr, unit: Any, copy: bool = True) -> DimArr:
+    @instrumented('DimensionedArray.astype')
+    def astype(self: DimArr, dtype: DType, copy: bool | None = True) -> DimArr:
+        """
+        Convert to a new dtype.
+
+        Parameters
+        ----------
+        dtype:
+            New dtype.
+        copy:
+            If True, always copy. If False, never copy and raise ValueError if the
+            dtype differs. If None, copy only if the dtype differs.
+
+        Returns
+        -------
+        :
+            Array with the requested dtype.
+        """
+        if copy is False and dtype != self.dtype:
+            raise ValueError(
+                "`astype` with copy=False is not possible, a copy is required"
+            )
+        if copy and dtype == self.dtype and copy_on_write.is_enabled():
+            return self._share(self.unit)
+        return self.__class__(
+            values=self.array_namespace.astype(self.values, dtype, copy=bool(copy)),
+            dims=self.dims,
+            unit=self.unit,
+        )
+
+    def _get_scale(self, unit: Any) -> float:
+        start = time.perf_counter()
         scale = self.units_namespace.get_scale(src=self.unit, dst=unit)
+        record_unit_conversion(time.perf_counter() - start)
+        return scale
+
+    def _to_unit(
+        self: DimArr, unit: Any, copy: bool = True, *, _inplace: bool = False
+    ) -> DimArr:
+        # _inplace may only be set by callers that own self.values, e.g., the
+        # intermediate result of a dtype conversion. It avoids temporaries.
+        scale = self._get_scale(unit)
         if scale == 1 and not copy:
             return self
+        if scale == 1 and copy_on_write.is_enabled():
+            return self._share(self.units_namespace.Unit(unit))
+        if not self._dims and _is_float_scalar(self._values):
+            # Python or NumPy scalar, e.g., the result of a full reduction.
+            return self._new(self._values * scale, (), self.units_namespace.Unit(unit))
+        xp = self.array_namespace
+        if xp.isdtype(self.dtype, 'integral'):
+            values = self._scale_integers(xp, scale, inplace=_inplace)
+        elif _inplace:
+            values = self._values
+            values *= scale
+        else:
+            values = self.values * scale
         return self.__class__(
-            values=self.values * scale,
+            values=values,
             dims=self.dims,
             unit=self.units_namespace.Unit(unit),
         )
 
+    def _scale_integers(
+        self, xp: Any, scale: float, *, inplace: bool
+    ) -> ArrayImplementation:
+        # Multiply by an exact rational scale without leaving the integer dtype.
+        ratio = _exact_ratio(scale)
+        if ratio is None:
+            raise UnitsError(
+                f"Conversion factor {scale} from unit '{self.unit}' cannot be "
+                f"applied exactly to dtype {self.dtype}, convert to a floating-point "
+                "dtype first"
+            )
+        num, den = ratio.numerator, ratio.denominator
+        from array_api_compat import is_lazy_array
+
+        values = self._values
+        check = not is_lazy_array(values) and values.size != 0
+        if den != 1:
+            if check and bool(xp.any(values % den != 0)):
+                raise UnitsError(
+                    f"Conversion from unit '{self.unit}' by factor {scale} would "
+                    f"lose precision in dtype {self.dtype}"
+                )
+            values = values // den
+            inplace = True
+        if num == 1:
+            return values
+        if check:
+            info = xp.iinfo(self.dtype)
+            lo, hi = int(xp.min(values)), int(xp.max(values))
+            if not info.min <= lo * num <= info.max or not (
+                info.min <= hi * num <= info.max
+            ):
+                raise UnitsError(
+                    f"Conversion from unit '{self.unit}' by factor {scale} would "
+                    f"overflow dtype {self.dtype}"
+                )
+        if inplace:
+            values *= num
+            return values
+        return values * num
+
+    @instrumented('DimensionedArray.to')
     def to(
         self: DimArr,
         *,
@@ -176,12 +375,19 @@ class DimensionedArray:
         """
         Convert to a new dtype and/or unit.
 
+        If both are given, the values are scaled in the more precise of the two
+        dtypes. For floating-point results the cast and the scaling are done in a
+        single pass, without a full-size temporary.
+
         Parameters
         ----------
         dtype:
             New dtype, None if no conversion is needed.
         unit:
-            New unit, None if no conversion is needed.
+            New unit, None if no conversion is needed. Integer values keep their
+            dtype if the conversion factor is an exact ratio of integers. If the
+            factor is not, or if the result would be inexact or overflow,
+            :py:class:`UnitsError` is raised.
         copy:
             If True, a copy of the values is made, even if no conversion is needed.
 
@@ -199,27 +405,30 @@ class DimensionedArray:
         if unit is None:
             return self.astype(dtype, copy=copy)
 
-        # TODO Logic copied from Scipp. Probably not complete with the Array API dtypes
-        api = self.array_namespace
-        if dtype == api.float64:
-            convert_dtype_first = True
-        elif self.dtype == api.float64:
-            convert_dtype_first = False
-        elif dtype == api.float32:
-            convert_dtype_first = True
-        elif self.dtype == api.float32:
-            convert_dtype_first = False
-        elif self.dtype == api.int64 and dtype == api.int32:
-            convert_dtype_first = False
-        elif self.dtype == api.int32 and dtype == api.int64:
-            convert_dtype_first = True
-        else:
-            convert_dtype_first = True
+        if dtype == self.dtype:
+            return self._to_unit(unit, copy=copy)
 
-        if convert_dtype_first:
-            return self.to(dtype=dtype, copy=copy).to(unit=unit, copy=False)
+        # Scale in the more precise of the two dtypes.
+        xp = self.array_namespace
+        cast_first = _cast_before_scale(xp, self.dtype, dtype)
+        scale_dtype = dtype if cast_first else self.dtype
+        from array_api_compat import is_lazy_array
+
+        if is_lazy_array(self.values) or not xp.isdtype(
+            scale_dtype, ('real floating', 'complex floating')
+        ):
+            if cast_first:
+                return self.astype(dtype)._to_unit(unit, copy=False, _inplace=True)
+            return self._to_unit(unit, copy=copy).astype(dtype, copy=None)
+
+        scale = self._get_scale(unit)
+        if scale == 1:
+            values = xp.astype(self.values, dtype)
         else:
-            return self.to(unit=unit, copy=copy).to(dtype=dtype, copy=False)
+            values = _cast_and_scale(xp, self.values, dtype, scale, cast_first)
+        return self.__class__(
+            values=values, dims=self.dims, unit=self.units_namespace.Unit(unit)
+        )
 
     def _parse_key(
         self, key: int | slice | dict[Dim, int | slice] | EllipsisType
@@ -237,12 +446,29 @@ class DimensionedArray:
             raise DimensionError(f"Unknown dimensions: {tuple(key.keys())}")
         return dims, values_key
 
+    def _key_sizes(self, values_key: tuple[int | slice, ...] | EllipsisType) -> Sizes:
+        """Sizes of the sub-array selected by a key returned by _parse_key."""
+        if values_key is Ellipsis:
+            return self.sizes
+        dims = []
+        shape = []
+        for dim, size, index in zip(self.dims, self.shape, values_key, strict=True):
+            if isinstance(index, slice):
+                dims.append(dim)
+                shape.append(len(range(*index.indices(size))))
+        return Sizes(tuple(dims), tuple(shape))
+
+    @instrumented('DimensionedArray.__getitem__')
     def __getitem__(
         self: DimArr, key: int | slice | dict[Dim, int | slice] | EllipsisType
     ) -> DimArr:
         """
         Get a sub-array identified by key.
 
+        Indexing with integers and slices never copies, the result is a view of the
+        values of this array. In copy-on-write mode the values are copied when
+        either array is modified, see :py:func:`set_copy_on_write`.
+
         Parameters
         ----------
         key:
@@ -254,8 +480,23 @@ class DimensionedArray:
             Sub-array.
         """
         dims, values_key = self._parse_key(key)
-        return self.__class__(values=self.values[values_key], dims=dims, unit=self.unit)
+        if values_key is Ellipsis:
+            indexes = self._indexes
+        else:
+            keys = dict(zip(self.dims, values_key, strict=True))
+            indexes = {
+                dim: index[keys[dim]]
+                for dim, index in self._indexes.items()
+                if isinstance(keys[dim], slice)
+            }
+        result = self.__class__(
+            values=self.values[values_key], dims=dims, unit=self.unit, indexes=indexes
+        )
+        if copy_on_write.is_enabled():
+            copy_on_write.join(self, result)
+        return result
 
+    @instrumented('DimensionedArray.__setitem__')
     def __setitem__(
         self: DimArr,
         key: int | slice | dict[Dim, int | slice] | EllipsisType,
@@ -265,7 +506,10 @@ class DimensionedArray:
         Set a sub-array identified by key to the values of array.
 
         The array to set will be automatically transposed and/or broadcast to match the
-        dimensions of the sub-array, using the named dimensions.
+        dimensions of the sub-array, using the named dimensions. Values are written
+        directly from a transposed and/or broadcast view, without a temporary copy.
+        If the dtype or the unit of array differs, the values are cast and scaled
+        chunk by chunk while writing.
 
         Parameters
         ----------
@@ -274,20 +518,133 @@ class DimensionedArray:
         array:
             Array to set.
         """
-        from .common import (
-            broadcast_and_transpose_values,
-            check_compatible_dims_and_shape,
-        )
-
-        check_compatible_dims_and_shape(self, array)
+        from .common import check_compatible_sizes
 
         dims, values_key = self._parse_key(key)
         if any(dim not in dims for dim in array.dims):
             raise DimensionError("Value has extra dimensions")
-        if array.unit != self.unit:
-            raise UnitsError("Units must be identical")
-        self.values[values_key] = broadcast_and_transpose_values(array=array, dims=dims)
+        check_compatible_sizes(self._key_sizes(values_key), array.sizes)
+        scale = self._assignment_scale(array)
+        xp = self.array_namespace
+        if copy_on_write.must_copy(self):
+            self._values = xp.asarray(self._values, copy=True)
+        if self._maintained:
+            from .maintained_reduction import updating
+
+            with updating(self, values_key):
+                self._assign(values_key, dims, array, scale)
+        else:
+            self._assign(values_key, dims, array, scale)
 
+    def _assign(
+        self,
+        values_key: tuple[int | slice, ...] | EllipsisType,
+        dims: Dims,
+        array: DimensionedArray,
+        scale: float,
+    ) -> None:
+        from .common import broadcast_and_transpose_values
+
+        xp = self.array_namespace
+        if scale != 1 and not xp.isdtype(
+            self.dtype, ('real floating', 'complex floating')
+        ):
+            # Integer scaling needs the exact checks of `to`.
+            array = array.to(unit=self.unit, copy=False)
+            scale = 1
+        if array.ndim == 0:
+            # Fill without broadcasting or chunking.
+            values = array.values
+            if values.dtype != self.dtype:
+                values = xp.astype(values, self.dtype)
+            self._values[values_key] = values if scale == 1 else values * scale
+            return
+        values = broadcast_and_transpose_values(array=array, dims=dims)
+        if values.dtype == self.dtype and scale == 1:
+            self._values[values_key] = values
+            return
+        # Cast and scale chunks of the view, so no full-size temporary is made and
+        # each chunk is written while in cache.
+        length = values.shape[0]
+        rows = max(1, _CHUNK_SIZE // max(1, values.size // max(1, length)))
+        for start in range(0, length, rows):
+            stop = min(start + rows, length)
+            chunk = values[start:stop, ...]
+            self._values[_rows_key(values_key, self.shape, start, stop)] = (
+                _cast_and_scale_chunk(xp, chunk, self.dtype, scale, cast_first=True)
+            )
+
+    def _assignment_scale(self, array: DimensionedArray) -> float:
+        if array.unit == self.unit:
+            return 1
+        msg = (
+            f"Units must be identical or convertible, got '{array.unit}' and "
+            f"'{self.unit}'"
+        )
+        if array.unit is None or self.unit is None:
+            raise UnitsError(msg)
+        try:
+            return array._get_scale(self.unit)
+        except Exception as err:
+            # Unit libraries raise different exception types.
+            raise UnitsError(msg) from err
+
+    def expand_dims(
+        self: DimArr, sizes: dict[Dim, int], *, copy: bool | None = None
+    ) -> DimArr:
+        """See :py:func:`pydims.expand_dims`."""
+        from .array_api_manipulation_functions import expand_dims
+
+        return expand_dims(self, sizes, copy=copy)
+
+    def flatten(
+        self: DimArr,
+        *,
+        dims: Dims | None = None,
+        dim: Dim | None = None,
+        copy: bool | None = None,
+    ) -> DimArr:
+        """See :py:func:`pydims.flatten`."""
+        from .array_api_manipulation_functions import flatten
+
+        return flatten(self, dims=dims, dim=dim, copy=copy)
+
+    def fold(
+        self: DimArr,
+        dim: Dim,
+        *,
+        sizes: Mapping[Dim, int],
+        copy: bool | None = None,
+    ) -> DimArr:
+        """See :py:func:`pydims.fold`."""
+        from .array_api_manipulation_functions import fold
+
+        return fold(self, dim, sizes=sizes, copy=copy)
+
+    def permute_dims(self: DimArr, dims: Dims, *, copy: bool | None = None) -> DimArr:
+        """See :py:func:`pydims.permute_dims`."""
+        from .array_api_manipulation_functions import permute_dims
+
+        return permute_dims(self, dims, copy=copy)
+
+    def reshape(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """See :py:func:`pydims.reshape`."""
+        from .array_api_manipulation_functions import reshape
+
+        reshape(self, *args, **kwargs)
+
+    def squeeze(
+        self: DimArr,
+        dim: Dim | tuple[Dim, ...] | None = None,
+        *,
+        copy: bool | None = None,
+    ) -> DimArr:
+        """See :py:func:`pydims.squeeze`."""
+        from .array_api_manipulation_functions import squeeze
+
+        return squeeze(self, dim, copy=copy)
+
+    @instrumented('DimensionedArray.__neg__')
     def __neg__(self: DimArr) -> DimArr:
         from .common import unary
 
@@ -295,27 +652,149 @@ class DimensionedArray:
             self, values_op=self.values.__class__.__neg__, unit_op=_unchanged_unit
         )
 
-    def __add__(self: DimArr, other: DimArr) -> DimArr:
+    @instrumented('DimensionedArray.__add__')
+    def __add__(self: DimArr, other: DimArr | Any) -> DimArr:
+        from .common import elemwise_binary, elemwise_scalar
+
+        if isinstance(other, DimensionedArray):
+            return elemwise_binary(
+                self, other, values_op=operator.add, unit_op=_same_unit
+            )
+        return elemwise_scalar(self, other, values_op=operator.add, unit_op=_same_unit)
+
+    @instrumented('DimensionedArray.__radd__')
+    def __radd__(self: DimArr, other: Any) -> DimArr:
+        from .common import elemwise_scalar
+
+        return elemwise_scalar(
+            self, other, values_op=operator.add, unit_op=_same_unit, reflected=True
+        )
+
+    @instrumented('DimensionedArray.__mul__')
+    def __mul__(self: DimArr, other: DimArr | Any) -> DimArr:
+        from .common import elemwise_binary, elemwise_scalar
+
+        if isinstance(other, DimensionedArray):
+            return elemwise_binary(
+                self, other, values_op=operator.mul, unit_op=operator.mul
+            )
+        return elemwise_scalar(
+            self, other, values_op=operator.mul, unit_op=operator.mul
+        )
+
+    @instrumented('DimensionedArray.__rmul__')
+    def __rmul__(self: DimArr, other: Any) -> DimArr:
+        from .common import elemwise_scalar
+
+        return elemwise_scalar(
+            self, other, values_op=operator.mul, unit_op=operator.mul, reflected=True
+        )
+
+    @instrumented('DimensionedArray.__invert__')
+    def __invert__(self: DimArr) -> DimArr:
+        from .common import unary
+
+        return unary(self, values_op=operator.invert, unit_op=_unit_must_be_none)
+
+    @instrumented('DimensionedArray.__and__')
+    def __and__(self: DimArr, other: DimArr) -> DimArr:
+        from .common import elemwise_binary
+
+        return elemwise_binary(
+            self, other, values_op=operator.and_, unit_op=_units_must_be_none
+        )
+
+    @instrumented('DimensionedArray.__or__')
+    def __or__(self: DimArr, other: DimArr) -> DimArr:
         from .common import elemwise_binary
 
         return elemwise_binary(
-            self,
-            other,
-            values_op=self.values.__class__.__add__,
-            unit_op=_same_unit,
+            self, other, values_op=operator.or_, unit_op=_units_must_be_none
         )
 
-    def __mul__(self: DimArr, other: DimArr) -> DimArr:
+    @instrumented('DimensionedArray.__xor__')
+    def __xor__(self: DimArr, other: DimArr) -> DimArr:
         from .common import elemwise_binary
 
         return elemwise_binary(
-            self,
-            other,
-            values_op=self.values.__class__.__mul__,
-            unit_op=operator.mul,
+            self, other, values_op=operator.xor, unit_op=_units_must_be_none
         )
 
 
+def _is_float_scalar(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, numbers.Integral)
+
+
+def _cast_before_scale(xp: Any, src: DType, dst: DType) -> bool:
+    """Return True if values should be cast to dst before scaling them."""
+    floating = ('real floating', 'complex floating')
+    if xp.isdtype(dst, floating) != xp.isdtype(src, floating):
+        return xp.isdtype(dst, floating)
+    return xp.result_type(src, dst) == dst
+
+
+# Number of elements converted per chunk in _cast_and_scale, chosen such that a
+# chunk of float64 and its cast fit in a typical L2 cache.
+_CHUNK_SIZE = 1 << 15
+
+
+def _cast_and_scale_chunk(
+    xp: Any, values: ArrayImplementation, dtype: DType, scale: float, cast_first: bool
+) -> ArrayImplementation:
+    if cast_first:
+        values = xp.astype(values, dtype)
+        if scale != 1:
+            values *= scale
+        return values
+    return xp.astype(values * scale, dtype, copy=False)
+
+
+def _cast_and_scale(
+    xp: Any, values: ArrayImplementation, dtype: DType, scale: float, cast_first: bool
+) -> ArrayImplementation:
+    """
+    Cast and scale values in a single pass into one output buffer.
+
+    Large arrays are processed in chunks along the first axis, so temporaries stay
+    small and in cache.
+    """
+    if values.ndim == 0 or values.size <= _CHUNK_SIZE:
+        return _cast_and_scale_chunk(xp, values, dtype, scale, cast_first)
+    from array_api_compat import device
+
+    out = xp.empty(values.shape, dtype=dtype, device=device(values))
+    length = values.shape[0]
+    rows = max(1, _CHUNK_SIZE // (values.size // length))
+    for start in range(0, length, rows):
+        key = (slice(start, min(start + rows, length)), ...)
+        out[key] = _cast_and_scale_chunk(xp, values[key], dtype, scale, cast_first)
+    return out
+
+
+def _rows_key(
+    values_key: tuple[int | slice, ...] | EllipsisType,
+    shape: Shape,
+    start: int,
+    stop: int,
+) -> tuple[int | slice, ...]:
+    """Key selecting rows start:stop of the first dim of the sub-array at values_key."""
+    key = [slice(None)] * len(shape) if values_key is Ellipsis else list(values_key)
+    for i, index in enumerate(key):
+        if isinstance(index, slice):
+            rows = range(*index.indices(shape[i]))[start:stop]
+            key[i] = slice(rows.start, None if rows.stop < 0 else rows.stop, rows.step)
+            break
+    return tuple(key)
+
+
+def _exact_ratio(scale: float) -> Fraction | None:
+    """Return scale as a ratio of small integers, or None if there is none."""
+    ratio = Fraction(scale).limit_denominator(2**32)
+    if ratio.numerator == 0 or float(ratio) != scale:
+        return None
+    return ratio
+
+
 def _unchanged_unit(unit: UnitImplementation) -> UnitImplementation:
     return unit
 
@@ -326,12 +805,23 @@ def _same_unit(a: UnitImplementation, b: UnitImplementation) -> UnitImplementati
     return a
 
 
+def _unit_must_be_none(unit: UnitImplementation) -> UnitImplementation:
+    raise ValueError("Logical operations require arrays without unit")
+
+
+def _units_must_be_none(
+    a: UnitImplementation | None, b: UnitImplementation | None
+) -> UnitImplementation:
+    raise ValueError("Logical operations require arrays without unit")
+
+
 def _unit_must_be_dimensionless(unit: UnitImplementation) -> UnitImplementation:
     if unit * unit != unit:
         raise ValueError("Unit must be dimensionless")
     return unit
 
 
+@instrumented('exp')
 def exp(x: DimArr, /) -> DimArr:
     from .common import unary
 
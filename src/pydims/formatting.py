@@ -0,0 +1,196 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Summary representations of arrays.
+
+The cost of formatting does not depend on the array size: only a few elements at
+the edges are gathered by slicing, and lazy arrays are not computed unless
+configured with :py:func:`set_repr_options`.
+"""
+
+from __future__ import annotations
+
+import html
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .dimensioned_array import ArrayImplementation, DimensionedArray
+
+_options = {'edge_items': 3, 'compute_lazy': False}
+
+
+def set_repr_options(
+    *, edge_items: int | None = None, compute_lazy: bool | None = None
+) -> dict[str, Any]:
+    """
+    Configure the string and HTML representations of arrays.
+
+    Parameters
+    ----------
+    edge_items:
+        Number of elements shown at the beginning and end of the values preview.
+    compute_lazy:
+        If True, compute the preview elements of lazy arrays such as Dask arrays.
+        Only the sliced preview is computed, not the full array.
+
+    Returns
+    -------
+    :
+        The previous options, which can be passed back to restore them.
+    """
+    previous = dict(_options)
+    if edge_items is not None:
+        if edge_items < 1:
+            raise ValueError("edge_items must be positive")
+        _options['edge_items'] = edge_items
+    if compute_lazy is not None:
+        _options['compute_lazy'] = compute_lazy
+    return previous
+
+
+def _backend(values: ArrayImplementation) -> str:
+    return values.__class__.__module__.split('.')[0]
+
+
+def _nbytes(x: DimensionedArray) -> int | None:
+    if (nbytes := getattr(x.values, 'nbytes', None)) is not None:
+        return int(nbytes)
+    xp = x.array_namespace
+    if xp.isdtype(x.dtype, 'bool'):
+        itemsize = 1
+    elif xp.isdtype(x.dtype, 'integral'):
+        itemsize = xp.iinfo(x.dtype).bits // 8
+    elif xp.isdtype(x.dtype, ('real floating', 'complex floating')):
+        itemsize = xp.finfo(x.dtype).bits // 8
+        if xp.isdtype(x.dtype, 'complex floating'):
+            itemsize *= 2
+    else:
+        return None
+    size = 1
+    for length in x.shape:
+        size *= length
+    return size * itemsize
+
+
+def _format_bytes(nbytes: int | None) -> str:
+    if nbytes is None:
+        return '?'
+    if nbytes < 1024:
+        return f'{nbytes} B'
+    size = nbytes / 1024
+    for unit in ('KiB', 'MiB', 'GiB'):
+        if size < 1024:
+            return f'{size:.2f} {unit}'
+        size /= 1024
+    return f'{size:.2f} TiB'
+
+
+def _chunks(x: DimensionedArray) -> str | None:
+    chunks = getattr(x.values, 'chunks', None)
+    if chunks is None:
+        return None
+    sizes = ', '.join(
+        f'{dim}: {max(c) if c else 0}' for dim, c in zip(x.dims, chunks, strict=True)
+    )
+    return f'({sizes})'
+
+
+def _to_python(value: Any) -> Any:
+    if (item := getattr(value, 'item', None)) is not None:
+        return item()
+    from array_api_compat import array_namespace
+
+    xp = array_namespace(value)
+    for kind, convert in (('bool', bool), ('integral', int), ('real floating', float)):
+        if xp.isdtype(value.dtype, kind):
+            return convert(value)
+    return complex(value)
+
+
+def _format_element(value: Any) -> str:
+    value = _to_python(value)
+    if isinstance(value, complex):
+        return f'{value:.6g}'
+    if isinstance(value, float):
+        text = f'{value:.6g}'
+        # Distinguish floats from integers, like NumPy.
+        return text if any(c in text for c in '.ena') else f'{text}.'
+    return str(value)
+
+
+def _maybe_compute(values: ArrayImplementation) -> ArrayImplementation | None:
+    from array_api_compat import is_lazy_array
+
+    if not is_lazy_array(values):
+        return values
+    if not _options['compute_lazy'] or not hasattr(values, 'compute'):
+        return None
+    return values.compute()
+
+
+def _preview(x: DimensionedArray) -> str:
+    """Format the first and last elements along the last dim, at index 0 of others."""
+    if x.ndim == 0:
+        values = _maybe_compute(x.values)
+        return '...' if values is None else _format_element(values)
+    length = x.shape[-1]
+    edge = _options['edge_items']
+    prefix = (0,) * (x.ndim - 1)
+    if any(size == 0 for size in x.shape):
+        return '[]'
+    if length <= 2 * edge:
+        parts = [x.values[(*prefix, slice(None))]]
+    else:
+        parts = [
+            x.values[(*prefix, slice(0, edge))],
+            x.values[(*prefix, slice(length - edge, length))],
+        ]
+    formatted = []
+    for part in parts:
+        values = _maybe_compute(part)
+        if values is None:
+            return '[...]'
+        formatted.append(
+            ', '.join(_format_element(values[i]) for i in range(values.shape[0]))
+        )
+    return f"[{', ..., '.join(formatted)}]"
+
+
+def _fields(x: DimensionedArray) -> dict[str, str]:
+    fields = {
+        'dims': '(' + ', '.join(f'{d}: {s}' for d, s in x.sizes.items()) + ')',
+        'dtype': str(x.dtype),
+        'unit': str(x.unit),
+        'backend': _backend(x.values),
+    }
+    if (chunks := _chunks(x)) is not None:
+        fields['chunks'] = chunks
+    fields['nbytes'] = _format_bytes(_nbytes(x))
+    label = ', '.join(f'{dim}=0' for dim in x.dims[:-1])
+    fields[f'values[{label}]' if label else 'values'] = _preview(x)
+    return fields
+
+
+def format_summary(x: DimensionedArray) -> str:
+    """Return a summary string of dims, dtype, unit, storage, and edge values."""
+    fields = _fields(x)
+    width = max(len(name) for name in fields)
+    lines = [f'<{x.__class__.__name__}>']
+    lines += [f'  {name:<{width}}  {value}' for name, value in fields.items()]
+    return '\n'.join(lines)
+
+
+def format_html(x: DimensionedArray) -> str:
+    """Return an HTML table with the same content as :py:func:`format_summary`."""
+    rows = ''.join(
+        f'<tr><th style="text-align: left">{html.escape(name)}</th>'
+        f'<td style="text-align: left">{html.escape(value)}</td></tr>'
+        for name, value in _fields(x).items()
+    )
+    return (
+        f'<table><caption style="text-align: left">'
+        f'{html.escape(x.__class__.__name__)}</caption>{rows}</table>'
+    )
+
+
+__all__ = ['set_repr_options']
@@ -7,9 +7,14 @@ Includes functions from the "Indexing Functions" section of the Python Array API
 standard.
 """
 
-from .dimensioned_array import DimArr, DimensionedArray, DimensionError
+from collections.abc import Mapping
+from typing import Any
 
+from .dimensioned_array import Dim, DimArr, DimensionedArray, DimensionError
+from .profiling import instrumented
 
+
+@instrumented('take')
 def take(x: DimArr, /, indices: DimensionedArray) -> DimArr:
     """
     Returns elements of an array along an axis.
@@ -42,4 +47,57 @@ def take(x: DimArr, /, indices: DimensionedArray) -> DimArr:
     )
 
 
-__all__ = ['take']
+@instrumented('sel')
+def sel(
+    x: DimArr, /, labels: Mapping[Dim, Any], *, method: str | None = None
+) -> DimArr:
+    """
+    Select elements of an array by coordinate labels.
+
+    Labels are looked up in the coordinate indexes of the array, see
+    :py:meth:`DimensionedArray.assign_indexes`. Units of labels are converted to the
+    unit of the respective index.
+
+    Parameters
+    ----------
+    x:
+        Input array.
+    labels:
+        Dictionary of dimension names and labels. A label can be a scalar (0-D)
+        array, which selects a single position and removes the dimension, a 1-D
+        array of labels along the same dimension, or a slice of scalar labels,
+        which selects the half-open range ``[start, stop)``. Plain numbers can be
+        used as labels only for indexes without unit.
+    method:
+        None for exact matches, or ``'nearest'`` to select the closest coordinate
+        values. Does not apply to slices.
+
+    Returns
+    -------
+    :
+        Selected sub-array.
+    """
+    key = {}
+    takes = []
+    for dim, label in labels.items():
+        if (index := x.indexes.get(dim)) is None:
+            raise DimensionError(f"No index for dimension '{dim}'")
+        if isinstance(label, slice):
+            if label.step is not None:
+                raise ValueError("Label-based slicing does not support a step")
+            key[dim] = index.slice(label.start, label.stop)
+        elif isinstance(label, DimensionedArray) and label.ndim == 1:
+            if label.dim != dim:
+                raise DimensionError(
+                    f"Labels for dimension '{dim}' have dimension '{label.dim}'"
+                )
+            takes.append((dim, label))
+        else:
+            key[dim] = index.position(label, method=method)
+    result = x[key] if key else x
+    for dim, label in takes:
+        result = take(result, x.indexes[dim].positions(label, method=method))
+    return result
+
+
+__all__ = ['sel', 'take']
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Reductions that are updated incrementally when an array is modified.
+"""
+
+from __future__ import annotations
+
+import math
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import EllipsisType
+from typing import Any, Literal
+
+from array_api_compat import is_lazy_array
+
+from .dimensioned_array import (
+    Dim,
+    DimensionedArray,
+    Dims,
+    UnitImplementation,
+)
+
+Reduction = Literal['sum', 'mean', 'min', 'max']
+_REDUCTIONS = ('sum', 'mean', 'min', 'max')
+
+
+class MaintainedReduction:
+    """
+    Sum, mean, minimum, or maximum of an array, kept up to date under updates.
+
+    Every :py:meth:`DimensionedArray.__setitem__` of the array updates the
+    reduction from the modified region only. Sums and means add the difference
+    between the new and the old sum of the region. Minima and maxima are combined
+    from summaries of blocks of roughly the square root of the reduced size, and
+    only the blocks overlapping the region are rescanned. Reading :py:attr:`result`
+    therefore never scans the full array.
+
+    Floating-point sums accumulate rounding errors of the individual updates, and
+    may thus differ slightly from a full :py:func:`sum`. Writes that bypass
+    ``__setitem__``, e.g., through views or :py:attr:`DimensionedArray.values`, are
+    not tracked.
+
+    The array backend must support in-place assignment, so this is not supported
+    for lazy backends such as Dask.
+    """
+
+    # Reduced values and reductions of blocks. Values are typed as Any in this
+    # class since the array API does not provide static types for indexing.
+    _total: Any
+    _summaries: Any
+
+    def __init__(
+        self,
+        x: DimensionedArray,
+        reduction: Reduction,
+        /,
+        *,
+        dim: Dim | Dims | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        x:
+            Array to reduce. The reduction is updated when ``x`` is modified.
+        reduction:
+            One of ``'sum'``, ``'mean'``, ``'min'``, or ``'max'``.
+        dim:
+            Dimension(s) to reduce. If None, all dimensions are reduced.
+        """
+        from .reduction_functions import _axis_dims_for_reduce
+
+        if reduction not in _REDUCTIONS:
+            raise ValueError(
+                f"Reduction must be one of {_REDUCTIONS}, got '{reduction}'"
+            )
+        if is_lazy_array(x.values):
+            raise ValueError("Maintained reductions require in-place assignment")
+        self._x = x
+        self._reduction = reduction
+        self._axis, self._dims = _axis_dims_for_reduce(x, dim)
+        self._kept = tuple(i for i in range(x.ndim) if i not in self._axis)
+        self._xp = x.array_namespace
+        self._is_sum = reduction in ('sum', 'mean')
+        self._op = getattr(self._xp, 'sum' if self._is_sum else reduction)
+        self._edges = tuple(
+            max(1, math.isqrt(x.shape[i])) if i in self._axis else 1
+            for i in range(x.ndim)
+        )
+        self._rebuild()
+        if x._maintained is None:
+            x._maintained = weakref.WeakSet()
+        x._maintained.add(self)
+
+    @property
+    def dims(self) -> Dims:
+        return self._dims
+
+    @property
+    def unit(self) -> UnitImplementation | None:
+        return self._x.unit
+
+    @property
+    def result(self) -> DimensionedArray:
+        """Current value of the reduction."""
+        if self._stale:
+            self._rebuild()
+        if self._reduction == 'mean':
+            count = math.prod(self._x.shape[i] for i in self._axis)
+            values = self._total / count
+        else:
+            values = self._xp.asarray(self._total, copy=True)
+        if not self._dims:
+            return self._x._new(values, (), self.unit)
+        return self._x.__class__(values=values, dims=self._dims, unit=self.unit)
+
+    def _rebuild(self) -> None:
+        values = self._x.values
+        if self._is_sum:
+            total = self._xp.sum(values, axis=self._axis)
+        else:
+            self._summaries = self._block_reduce(values)
+            total = self._op(self._summaries, axis=self._axis)
+        self._total = self._xp.asarray(total, copy=True)
+        self._stale = False
+
+    def _block_reduce(self, values: Any) -> Any:
+        """Reduce each block of values, keeping the block grid as dims."""
+        xp = self._xp
+        for axis in self._axis:
+            edge = self._edges[axis]
+            size = values.shape[axis]
+            full = size - size % edge
+            head = (slice(None),) * axis
+            parts = []
+            if full:
+                shape = list(values.shape)
+                shape[axis : axis + 1] = [full // edge, edge]
+                blocks = xp.reshape(values[(*head, slice(0, full))], tuple(shape))
+                parts.append(self._op(blocks, axis=axis + 1))
+            if full < size:
+                tail = values[(*head, slice(full, size))]
+                parts.append(self._op(tail, axis=axis, keepdims=True))
+            values = parts[0] if len(parts) == 1 else xp.concat(parts, axis=axis)
+        return values
+
+    def _before_write(self, key: tuple[slice, ...] | None) -> Any:
+        if key is None or self._stale or not self._is_sum:
+            return None
+        values: Any = self._x.values
+        return self._xp.sum(values[key], axis=self._axis)
+
+    def _after_write(self, key: tuple[slice, ...] | None, old: Any) -> None:
+        if key is None or self._stale:
+            return
+        xp = self._xp
+        values: Any = self._x.values
+        kept_key = tuple(key[i] for i in self._kept)
+        if self._is_sum:
+            new = xp.sum(values[key], axis=self._axis)
+            if xp.isdtype(old.dtype, ('real floating', 'complex floating')) and not (
+                xp.all(xp.isfinite(old))
+            ):
+                # Non-finite old values cannot be subtracted, rescan the slab.
+                slab = self._slab(key)
+                self._total[kept_key] = xp.sum(values[slab], axis=self._axis)
+            else:
+                # Index with an ellipsis and subtract 0-d arrays, since arithmetic
+                # on scalars warns about integer wraparound, which cancels here.
+                delta = xp.asarray(new) - xp.asarray(old)
+                self._total[(*kept_key, ...)] += delta
+            return
+        block_key = list(key)
+        for axis in self._axis:
+            edge = self._edges[axis]
+            size = values.shape[axis]
+            indices = range(*key[axis].indices(size))
+            start = min(indices[0], indices[-1]) // edge
+            stop = -(-(max(indices[0], indices[-1]) + 1) // edge)
+            block_key[axis] = slice(start, stop)
+            key = (*key[:axis], slice(start * edge, stop * edge), *key[axis + 1 :])
+        self._summaries[tuple(block_key)] = self._block_reduce(values[key])
+        self._total[kept_key] = self._op(
+            self._summaries[self._slab(key)], axis=self._axis
+        )
+
+    def _slab(self, key: tuple[slice, ...]) -> tuple[slice, ...]:
+        """Key selecting everything along the reduced dims."""
+        return tuple(slice(None) if i in self._axis else k for i, k in enumerate(key))
+
+
+def _normalize(
+    x: DimensionedArray, values_key: tuple[int | slice, ...] | EllipsisType
+) -> tuple[slice, ...] | None:
+    """Return the key as slices keeping all dims, or None if it is empty."""
+    if values_key is Ellipsis:
+        return (slice(None),) * x.ndim
+    key = []
+    for index, size in zip(values_key, x.shape, strict=True):
+        if isinstance(index, slice):
+            if not range(*index.indices(size)):
+                return None
+            key.append(index)
+        else:
+            index = index % size
+            key.append(slice(index, index + 1))
+    return tuple(key)
+
+
+@contextmanager
+def updating(
+    x: DimensionedArray, values_key: tuple[int | slice, ...] | EllipsisType
+) -> Iterator[None]:
+    """Update the maintained reductions of x around a write to values_key."""
+    reductions = list(x._maintained)
+    key = _normalize(x, values_key)
+    old = [r._before_write(key) for r in reductions]
+    try:
+        yield
+    except BaseException:
+        # The write may have been partial, rebuild on the next read.
+        for r in reductions:
+            r._stale = True
+        raise
+    for r, o in zip(reductions, old, strict=True):
+        r._after_write(key, o)
+
+
+__all__ = ['MaintainedReduction']
@@ -0,0 +1,268 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Functions for inspecting and controlling the memory layout of arrays.
+
+The Python array API standard does not expose memory layout. The functions in this
+module use strides where the backend provides them (e.g. NumPy and CuPy) and are
+conservative otherwise.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import array_api_compat
+
+from .dimensioned_array import ArrayImplementation, DimArr, DimensionedArray, Dims
+from .profiling import instrumented, record_copy, record_transpose
+
+
+def _strides(values: ArrayImplementation) -> tuple[int, ...] | None:
+    strides = getattr(values, 'strides', None)
+    return None if strides is None else tuple(strides)
+
+
+def _itemsize(values: ArrayImplementation) -> int | None:
+    return getattr(values, 'itemsize', None)
+
+
+def _is_c_contiguous(
+    shape: tuple[int, ...], strides: tuple[int, ...], itemsize: int
+) -> bool:
+    expected = itemsize
+    for size, stride in reversed(tuple(zip(shape, strides, strict=True))):
+        if size == 1:
+            continue
+        if stride != expected:
+            return False
+        expected *= size
+    return True
+
+
+# Bytes per tile of a copy that changes the memory order, such that a source and a
+# destination tile fit in a typical L1 cache.
+_TILE_BYTES = 1 << 15
+# Arrays with fewer elements are copied in one go.
+_MIN_TILED_SIZE = 1 << 16
+# Reads with a stride that is a multiple of this many bytes map to few cache sets,
+# so a naive copy along such a stride evicts its own cache lines.
+_ALIASING_STRIDE = 1 << 10
+
+
+def _tiles(values: ArrayImplementation) -> list[tuple[slice, ...]] | None:
+    """
+    Return keys of tiles for a C-contiguous copy of values, None if not useful.
+
+    Tiling is used if the innermost axis of values in memory is not the last axis
+    and the stride of the last axis causes cache aliasing. Otherwise the copy of
+    the backend is as fast. Tiles are short along both of these axes, so reads and
+    writes of a tile stay in cache, and grow along the remaining axes up to the
+    tile size.
+    """
+    strides = _strides(values)
+    itemsize = _itemsize(values)
+    if (
+        not array_api_compat.is_numpy_array(values)
+        or strides is None
+        or itemsize is None
+        or values.size < _MIN_TILED_SIZE
+    ):
+        return None
+    shape = values.shape
+    last = values.ndim - 1
+    inner = min(
+        (axis for axis in range(values.ndim) if shape[axis] > 1),
+        key=lambda axis: abs(strides[axis]),
+        default=last,
+    )
+    if inner == last or abs(strides[last]) % _ALIASING_STRIDE:
+        return None
+    budget = max(1, _TILE_BYTES // itemsize)
+    edge = max(8, math.isqrt(budget))
+    block = [1] * values.ndim
+    block[inner] = min(shape[inner], edge)
+    block[last] = min(shape[last], edge)
+    remaining = max(1, budget // (block[inner] * block[last]))
+    for axis in reversed(range(last)):
+        if axis != inner:
+            block[axis] = min(shape[axis], remaining)
+            remaining = max(1, remaining // block[axis])
+    return [
+        tuple(
+            slice(start, start + size)
+            for start, size in zip(starts, block, strict=True)
+        )
+        for starts in itertools.product(
+            *(range(0, length, size) for length, size in zip(shape, block, strict=True))
+        )
+    ]
+
+
+def _changes_memory_order(values: ArrayImplementation) -> bool:
+    """Return True if a C-contiguous copy of strided values reorders their axes."""
+    if (strides := getattr(values, 'strides', None)) is None:
+        return False
+    strides = [
+        abs(stride)
+        for size, stride in zip(values.shape, strides, strict=True)
+        if size > 1
+    ]
+    return strides != sorted(strides, reverse=True)
+
+
+def _copy_values(
+    values: ArrayImplementation, *, workers: int | None = 1
+) -> ArrayImplementation:
+    """
+    Return a C-contiguous copy of values, or values if the backend is lazy.
+
+    Copies that change the memory order, e.g., of transposed NumPy arrays, are
+    done tile by tile, which avoids cache misses of a naive strided copy.
+    """
+    if array_api_compat.is_lazy_array(values):
+        return values
+    record_copy()
+    if _changes_memory_order(values):
+        record_transpose()
+    xp = array_api_compat.array_namespace(values)
+    out = xp.empty(
+        values.shape, dtype=values.dtype, device=array_api_compat.device(values)
+    )
+    workers = workers or os.cpu_count() or 1
+    tiles = _tiles(values)
+    if tiles is None and workers > 1 and values.ndim > 0:
+        step = -(-values.shape[0] // workers)
+        tiles = [
+            (slice(start, start + step),) for start in range(0, values.shape[0], step)
+        ]
+    if tiles is None:
+        out[...] = values
+        return out
+
+    def copy(keys: list[tuple[slice, ...]]) -> None:
+        for key in keys:
+            out[key] = values[key]
+
+    if workers == 1:
+        copy(tiles)
+    else:
+        with ThreadPoolExecutor(workers) as pool:
+            list(pool.map(copy, (tiles[i::workers] for i in range(workers))))
+    return out
+
+
+def _copy_required_error(name: str) -> ValueError:
+    return ValueError(f"`{name}` with copy=False is not possible, a copy is required")
+
+
+def shares_memory(a: DimensionedArray, b: DimensionedArray, /) -> bool:
+    """
+    Return True if the values of two arrays share memory.
+
+    For NumPy arrays this is exact. For other backends only identical value
+    buffers are detected.
+
+    Parameters
+    ----------
+    a:
+        First array.
+    b:
+        Second array.
+
+    Returns
+    -------
+    :
+        True if the arrays share memory.
+    """
+    if a.values is b.values:
+        return True
+    if array_api_compat.is_numpy_array(a.values) and array_api_compat.is_numpy_array(
+        b.values
+    ):
+        import numpy as np
+
+        return bool(np.shares_memory(a.values, b.values))
+    return False
+
+
+def is_contiguous(x: DimensionedArray, /, dims: Dims | None = None) -> bool:
+    """
+    Return True if the values are contiguous in memory in the given dim order.
+
+    Contiguous means that the last of ``dims`` is the fastest-changing in memory
+    and that there are no gaps, i.e., the values in that order are stored like a
+    C-contiguous array.
+
+    Returns False if the backend does not expose the memory layout.
+
+    Parameters
+    ----------
+    x:
+        Input array.
+    dims:
+        Order of dimensions. Defaults to the dims of ``x``.
+
+    Returns
+    -------
+    :
+        True if the values are known to be contiguous in the given order.
+    """
+    dims = x.dims if dims is None else tuple(dims)
+    if set(dims) != set(x.dims) or len(dims) != x.ndim:
+        raise ValueError("Dims must contain all dims of the array")
+    strides = _strides(x.values)
+    itemsize = _itemsize(x.values)
+    if strides is None or itemsize is None:
+        return False
+    axes = [x.dims.index(dim) for dim in dims]
+    return _is_c_contiguous(
+        tuple(x.shape[axis] for axis in axes),
+        tuple(strides[axis] for axis in axes),
+        itemsize,
+    )
+
+
+@instrumented('ascontiguous')
+def ascontiguous(
+    x: DimArr, /, dims: Dims | None = None, *, workers: int | None = 1
+) -> DimArr:
+    """
+    Return an array with values contiguous in memory in the given dim order.
+
+    If the values are already contiguous in this order this returns a view,
+    otherwise the values are copied. Copies that transpose NumPy values are
+    cache-blocked. For lazy backends this only permutes the dims.
+
+    Parameters
+    ----------
+    x:
+        Input array.
+    dims:
+        Order of dimensions of the result. Defaults to the dims of ``x``.
+    workers:
+        Number of threads used to copy values. None uses one thread per CPU.
+
+    Returns
+    -------
+    :
+        Array with dims in the given order and contiguous values.
+    """
+    from .array_api_manipulation_functions import permute_dims
+
+    dims = x.dims if dims is None else tuple(dims)
+    contiguous = is_contiguous(x, dims)
+    result = permute_dims(x, dims)
+    if contiguous:
+        return result
+    return result.__class__(
+        values=_copy_values(result.values, workers=workers),
+        dims=result.dims,
+        unit=result.unit,
+    )
+
+
+__all__ = ['ascontiguous', 'is_contiguous', 'shares_memory']
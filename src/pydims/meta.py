@@ -0,0 +1,554 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Metadata-only execution for validating pipelines without computing.
+
+A :py:class:`MetaArray` is a stand-in for array values that has a shape and a
+dtype but no storage. It implements the parts of the Python array API used by
+PyDims, so operations on arrays with meta values check dims, shapes, and units
+and propagate them, without touching any data:
+
+.. code-block:: python
+
+    run = pydims.meta.dry_run(pipeline, data)
+    print(run.summary())
+
+Operations whose result depends on the values, such as label-based selection
+with :py:func:`pydims.sel`, raise TypeError.
+"""
+
+from __future__ import annotations
+
+import builtins
+import math
+import numbers
+import operator
+import weakref
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from . import profiling
+
+if TYPE_CHECKING:
+    from .dimensioned_array import DimensionedArray
+
+Shape = tuple[int, ...]
+
+
+class _Tracker:
+    """Estimate of the memory held by live meta arrays."""
+
+    def __init__(self) -> None:
+        self.live = 0
+        self.peak = 0
+        self.stages: dict[str, int] = {}
+
+    def allocate(self, array: MetaArray) -> None:
+        nbytes = array.nbytes
+        self.live += nbytes
+        self.peak = max(self.peak, self.live)
+        if frames := profiling._frames():
+            stage = frames[0].name
+            self.stages[stage] = max(self.stages.get(stage, 0), self.live)
+        weakref.finalize(array, self.free, nbytes)
+
+    def free(self, nbytes: int) -> None:
+        self.live -= nbytes
+
+
+_tracker: _Tracker | None = None
+
+
+class MetaArray:
+    """
+    Array values without storage.
+
+    Views, e.g., results of slicing or transposing, keep a reference to their base
+    array and do not count as allocations in :py:func:`dry_run`.
+    """
+
+    __slots__ = ('__weakref__', '_base', 'dtype', 'shape')
+
+    shape: Shape
+    dtype: np.dtype[Any]
+    _base: MetaArray | None
+
+    def __init__(self, shape: Shape, dtype: Any, *, base: MetaArray | None = None):
+        self.shape = tuple(int(size) for size in shape)
+        self.dtype = np.dtype(dtype)
+        self._base = base if base is None or base._base is None else base._base
+        if base is None and _tracker is not None:
+            _tracker.allocate(self)
+
+    def _view(self, shape: Shape, dtype: Any = None) -> MetaArray:
+        return MetaArray(shape, self.dtype if dtype is None else dtype, base=self)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    @property
+    def itemsize(self) -> int:
+        return self.dtype.itemsize
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.itemsize
+
+    @property
+    def device(self) -> str:
+        return 'meta'
+
+    def __array_namespace__(self, api_version: str | None = None) -> _MetaNamespace:
+        return _namespace
+
+    def __repr__(self) -> str:
+        return f'MetaArray(shape={self.shape}, dtype={self.dtype})'
+
+    def _no_values(self, *args: Any) -> Any:
+        raise TypeError("MetaArray has no values")
+
+    __bool__ = __int__ = __float__ = __complex__ = __index__ = _no_values
+
+    def __getitem__(self, key: Any) -> MetaArray:
+        shape, is_view = _index_shape(self.shape, key)
+        return self._view(shape) if is_view else MetaArray(shape, self.dtype)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        shape, _ = _index_shape(self.shape, key)
+        np.broadcast_shapes(_shape_of(value), shape)
+
+    def take(self, indices: Any, axis: int | None = None) -> MetaArray:
+        return _namespace.take(self, indices, axis=axis)
+
+    def _binary(
+        self, other: Any, op: Callable[[Any, Any], Any], reflected: bool = False
+    ) -> MetaArray:
+        if not isinstance(other, MetaArray | numbers.Number | np.ndarray | np.generic):
+            return NotImplemented
+        a, b = (other, self) if reflected else (self, other)
+        dtype = op(_sample(a), _sample(b)).dtype
+        return MetaArray(np.broadcast_shapes(_shape_of(a), _shape_of(b)), dtype)
+
+    def _inplace(self, other: Any, op: Callable[[Any, Any], Any]) -> MetaArray:
+        result = self._binary(other, op)
+        if result is NotImplemented:
+            return result
+        if result.shape != self.shape:
+            raise ValueError(f"Cannot broadcast {result.shape} to {self.shape}")
+        return self
+
+    def _unary(self, op: Callable[[Any], Any]) -> MetaArray:
+        return MetaArray(self.shape, op(_sample(self)).dtype)
+
+    def __neg__(self) -> MetaArray:
+        return self._unary(operator.neg)
+
+    def __pos__(self) -> MetaArray:
+        return self._unary(operator.pos)
+
+    def __abs__(self) -> MetaArray:
+        return self._unary(operator.abs)
+
+    def __invert__(self) -> MetaArray:
+        return self._unary(operator.invert)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _make_binary(op: Callable[[Any, Any], Any]) -> tuple[Any, Any, Any]:
+    def forward(self: MetaArray, other: Any) -> MetaArray:
+        return self._binary(other, op)
+
+    def reflected(self: MetaArray, other: Any) -> MetaArray:
+        return self._binary(other, op, reflected=True)
+
+    def inplace(self: MetaArray, other: Any) -> MetaArray:
+        return self._inplace(other, op)
+
+    return forward, reflected, inplace
+
+
+for _name in (
+    'add',
+    'sub',
+    'mul',
+    'truediv',
+    'floordiv',
+    'mod',
+    'pow',
+    'and',
+    'or',
+    'xor',
+    'lshift',
+    'rshift',
+):
+    _op = getattr(operator, f'{_name}_' if _name in ('and', 'or') else _name)
+    _forward, _reflected, _in = _make_binary(_op)
+    setattr(MetaArray, f'__{_name}__', _forward)
+    setattr(MetaArray, f'__r{_name}__', _reflected)
+    setattr(MetaArray, f'__i{_name}__', _in)
+for _name in ('eq', 'ne', 'lt', 'le', 'gt', 'ge'):
+    setattr(MetaArray, f'__{_name}__', _make_binary(getattr(operator, _name))[0])
+
+
+def _shape_of(value: Any) -> Shape:
+    return tuple(getattr(value, 'shape', ()))
+
+
+def _sample(value: Any) -> Any:
+    """Return a single-element NumPy stand-in for dtype inference."""
+    if isinstance(value, MetaArray):
+        return np.ones((), dtype=value.dtype)
+    if isinstance(value, np.ndarray):
+        return np.ones((), dtype=value.dtype)
+    return value
+
+
+def _dtype_of(func: Callable[..., Any], *args: Any, **kwargs: Any) -> np.dtype[Any]:
+    """Result dtype of a NumPy function applied to samples of the arguments."""
+    samples = [np.ones((1,), dtype=a.dtype) if hasattr(a, 'dtype') else a for a in args]
+    return np.asarray(func(*samples, **kwargs)).dtype
+
+
+def _index_shape(shape: Shape, key: Any) -> tuple[Shape, bool]:
+    """Return the shape selected by key and whether the result is a view."""
+    key = key if isinstance(key, tuple) else (key,)
+    explicit = sum(1 for k in key if k is not None and k is not Ellipsis)
+    if explicit > len(shape):
+        raise IndexError(f"Too many indices for array with {len(shape)} dimensions")
+    fill = (slice(None),) * (len(shape) - explicit)
+    ellipsis = [i for i, k in enumerate(key) if k is Ellipsis]
+    if ellipsis:
+        key = (*key[: ellipsis[0]], *fill, *key[ellipsis[0] + 1 :])
+    else:
+        key = (*key, *fill)
+    result: list[int] = []
+    is_view = True
+    axis = 0
+    for k in key:
+        if k is None:
+            result.append(1)
+            continue
+        size = shape[axis]
+        axis += 1
+        if isinstance(k, slice):
+            result.append(len(range(*k.indices(size))))
+        elif isinstance(k, numbers.Integral):
+            if not -size <= int(k) < size:
+                raise IndexError(f"Index {k} out of bounds for size {size}")
+        elif hasattr(k, 'shape') and np.dtype(k.dtype) != np.bool_:
+            result.extend(k.shape)
+            is_view = False
+        else:
+            raise TypeError(f"Indexing a MetaArray with {k!r} depends on values")
+    return tuple(result), is_view
+
+
+def _normalize_axis(axis: int | Sequence[int] | None, ndim: int) -> tuple[int, ...]:
+    if axis is None:
+        return tuple(range(ndim))
+    axes = tuple(axis) if isinstance(axis, Sequence) else (axis,)
+    return tuple(a % ndim if ndim else a for a in axes)
+
+
+def _reduction(func: Callable[..., Any]) -> Callable[..., MetaArray]:
+    def reduce(
+        x: MetaArray,
+        /,
+        *,
+        axis: int | Sequence[int] | None = None,
+        keepdims: bool = False,
+        dtype: Any = None,
+        **kwargs: Any,
+    ) -> MetaArray:
+        axes = _normalize_axis(axis, x.ndim)
+        shape = tuple(
+            1 if i in axes else size
+            for i, size in enumerate(x.shape)
+            if keepdims or i not in axes
+        )
+        extra = {} if dtype is None else {'dtype': dtype}
+        return MetaArray(shape, _dtype_of(func, x, **extra))
+
+    return reduce
+
+
+def _elementwise(func: Callable[..., Any]) -> Callable[..., MetaArray]:
+    def apply(*args: Any, **kwargs: Any) -> MetaArray:
+        shape = np.broadcast_shapes(*(_shape_of(a) for a in args))
+        return MetaArray(shape, _dtype_of(func, *args, **kwargs))
+
+    return apply
+
+
+def _data_dependent(name: str) -> Callable[..., Any]:
+    def raise_error(*args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"Result of {name} depends on values, not available for meta")
+
+    return raise_error
+
+
+class _MetaNamespace:
+    """Array API namespace of :py:class:`MetaArray`."""
+
+    __name__ = 'pydims.meta'
+
+    bool = np.bool_
+    int8, int16, int32, int64 = np.int8, np.int16, np.int32, np.int64
+    uint8, uint16, uint32, uint64 = np.uint8, np.uint16, np.uint32, np.uint64
+    float32, float64 = np.float32, np.float64
+    complex64, complex128 = np.complex64, np.complex128
+
+    isdtype = staticmethod(np.isdtype)
+    iinfo = staticmethod(np.iinfo)
+    finfo = staticmethod(np.finfo)
+
+    @staticmethod
+    def result_type(*arrays_and_dtypes: Any) -> np.dtype[Any]:
+        return np.result_type(
+            *(
+                a.dtype if isinstance(a, MetaArray | np.ndarray) else a
+                for a in arrays_and_dtypes
+            )
+        )
+
+    @staticmethod
+    def asarray(
+        obj: Any, /, *, dtype: Any = None, device: Any = None, copy: Any = None
+    ) -> MetaArray:
+        if isinstance(obj, MetaArray):
+            if dtype is None or np.dtype(dtype) == obj.dtype:
+                return MetaArray(obj.shape, obj.dtype) if copy else obj
+            return MetaArray(obj.shape, dtype)
+        values = np.asarray(obj, dtype=dtype)
+        return MetaArray(values.shape, values.dtype)
+
+    @staticmethod
+    def empty(
+        shape: int | Shape, *, dtype: Any = None, device: Any = None
+    ) -> MetaArray:
+        shape = tuple(shape) if isinstance(shape, Sequence) else (shape,)
+        return MetaArray(shape, np.float64 if dtype is None else dtype)
+
+    zeros = ones = empty
+
+    @staticmethod
+    def arange(
+        start: float,
+        /,
+        stop: float | None = None,
+        step: float = 1,
+        *,
+        dtype: Any = None,
+        device: Any = None,
+    ) -> MetaArray:
+        if stop is None:
+            start, stop = 0, start
+        length = max(0, math.ceil((stop - start) / step))
+        return MetaArray((length,), np.arange(start, start + step, step).dtype)
+
+    @staticmethod
+    def linspace(
+        start: complex, stop: complex, /, num: int, *, dtype: Any = None, **kwargs: Any
+    ) -> MetaArray:
+        return MetaArray((num,), np.float64 if dtype is None else dtype)
+
+    @staticmethod
+    def astype(
+        x: MetaArray, dtype: Any, /, *, copy: builtins.bool = True, device: Any = None
+    ) -> MetaArray:
+        if not copy and np.dtype(dtype) == x.dtype:
+            return x
+        return MetaArray(x.shape, dtype)
+
+    @staticmethod
+    def reshape(
+        x: MetaArray, /, shape: Shape, *, copy: builtins.bool | None = None
+    ) -> MetaArray:
+        shape = tuple(shape)
+        if -1 in shape:
+            known = math.prod(size for size in shape if size != -1)
+            shape = tuple(x.size // known if size == -1 else size for size in shape)
+        if math.prod(shape) != x.size:
+            raise ValueError(f"Cannot reshape array of size {x.size} into {shape}")
+        return MetaArray(shape, x.dtype) if copy else x._view(shape)
+
+    @staticmethod
+    def permute_dims(x: MetaArray, /, axes: Sequence[int]) -> MetaArray:
+        return x._view(tuple(x.shape[axis] for axis in axes))
+
+    @staticmethod
+    def expand_dims(x: MetaArray, /, *, axis: int = 0) -> MetaArray:
+        axis = axis % (x.ndim + 1)
+        return x._view((*x.shape[:axis], 1, *x.shape[axis:]))
+
+    @staticmethod
+    def squeeze(x: MetaArray, /, axis: int | Sequence[int]) -> MetaArray:
+        axes = _normalize_axis(axis, x.ndim)
+        if any(x.shape[a] != 1 for a in axes):
+            raise ValueError("Cannot squeeze axis with size other than one")
+        return x._view(tuple(s for i, s in enumerate(x.shape) if i not in axes))
+
+    @staticmethod
+    def broadcast_to(x: MetaArray, /, shape: Shape) -> MetaArray:
+        np.broadcast_shapes(x.shape, tuple(shape))
+        return x._view(tuple(shape))
+
+    @staticmethod
+    def concat(arrays: Sequence[MetaArray], /, *, axis: int = 0) -> MetaArray:
+        first = arrays[0]
+        axis = axis % first.ndim
+        shape = list(first.shape)
+        shape[axis] = sum(a.shape[axis] for a in arrays)
+        return MetaArray(tuple(shape), np.result_type(*(a.dtype for a in arrays)))
+
+    @staticmethod
+    def stack(arrays: Sequence[MetaArray], /, *, axis: int = 0) -> MetaArray:
+        first = arrays[0]
+        axis = axis % (first.ndim + 1)
+        shape = (*first.shape[:axis], len(arrays), *first.shape[axis:])
+        return MetaArray(shape, np.result_type(*(a.dtype for a in arrays)))
+
+    @staticmethod
+    def take(x: MetaArray, indices: Any, /, *, axis: int | None = None) -> MetaArray:
+        if axis is None:
+            return MetaArray(_shape_of(indices), x.dtype)
+        axis = axis % x.ndim
+        shape = (*x.shape[:axis], *_shape_of(indices), *x.shape[axis + 1 :])
+        return MetaArray(shape, x.dtype)
+
+
+for _name in (
+    'sum',
+    'prod',
+    'mean',
+    'std',
+    'var',
+    'min',
+    'max',
+    'all',
+    'any',
+    'count_nonzero',
+):
+    setattr(_MetaNamespace, _name, staticmethod(_reduction(getattr(np, _name))))
+for _name in (
+    'abs',
+    'clip',
+    'cos',
+    'exp',
+    'isfinite',
+    'isinf',
+    'isnan',
+    'log',
+    'logical_not',
+    'sin',
+    'sqrt',
+    'where',
+):
+    setattr(_MetaNamespace, _name, staticmethod(_elementwise(getattr(np, _name))))
+for _name in ('argmax', 'argmin', 'nonzero', 'searchsorted', 'unique_values'):
+    setattr(_MetaNamespace, _name, staticmethod(_data_dependent(_name)))
+
+_namespace = _MetaNamespace()
+
+
+def as_meta(x: DimensionedArray) -> DimensionedArray:
+    """
+    Return an array with the dims, shape, dtype, and unit of x, but no values.
+
+    Parameters
+    ----------
+    x:
+        Input array.
+
+    Returns
+    -------
+    :
+        Array with :py:class:`MetaArray` values.
+    """
+    return x.__class__(
+        values=MetaArray(x.shape, np.dtype(str(x.dtype))), dims=x.dims, unit=x.unit
+    )
+
+
+def _to_meta(value: Any) -> Any:
+    from .dimensioned_array import DimensionedArray
+
+    if isinstance(value, DimensionedArray) and not isinstance(value.values, MetaArray):
+        return as_meta(value)
+    if isinstance(value, list | tuple):
+        return value.__class__(_to_meta(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _to_meta(item) for key, item in value.items()}
+    return value
+
+
+class DryRun:
+    """Result and memory estimates of :py:func:`dry_run`."""
+
+    def __init__(
+        self, result: Any, peak_bytes: int, stages: dict[str, int], profile: Any
+    ) -> None:
+        self.result = result
+        """Return value of the function, with meta values."""
+        self.peak_bytes = peak_bytes
+        """Estimated peak memory of all arrays alive at the same time."""
+        self.stages = stages
+        """Estimated peak memory while each operation was running, by name."""
+        self.profile = profile
+        """Profile of the operations, see :py:mod:`pydims.profiling`."""
+
+    def summary(self) -> str:
+        """Return a table of the estimated peak memory by operation."""
+        header = f"{'operation':<32} {'peak MB':>10}"
+        lines = [header, '-' * len(header)]
+        lines += [
+            f"{name:<32} {nbytes / 1e6:>10.3f}" for name, nbytes in self.stages.items()
+        ]
+        lines.append(f"{'total':<32} {self.peak_bytes / 1e6:>10.3f}")
+        return '\n'.join(lines)
+
+
+def dry_run(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> DryRun:
+    """
+    Run a function on arrays with meta values, without computing.
+
+    Arrays in the arguments, including in lists, tuples, and dicts, are replaced
+    by :py:func:`as_meta`. Dimension and unit errors are raised as in a real run.
+
+    Parameters
+    ----------
+    func:
+        Function to run.
+    *args:
+        Positional arguments of func.
+    **kwargs:
+        Keyword arguments of func.
+
+    Returns
+    -------
+    :
+        Result and estimated peak memory, including the inputs.
+    """
+    global _tracker
+    if _tracker is not None:
+        raise RuntimeError("dry_run cannot be nested")
+    _tracker = tracker = _Tracker()
+    try:
+        args = _to_meta(args)
+        kwargs = _to_meta(kwargs)
+        with profiling.profile() as prof:
+            result = func(*args, **kwargs)
+    finally:
+        _tracker = None
+    return DryRun(result, tracker.peak, tracker.stages, prof)
+
+
+__all__ = ['DryRun', 'MetaArray', 'as_meta', 'dry_run']
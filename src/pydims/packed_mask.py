@@ -0,0 +1,482 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Bit-packed boolean masks.
+
+A :py:class:`PackedMask` stores a boolean array with one bit per element, in C
+order, using 8x less memory than NumPy booleans. It can be used as values of a
+:py:class:`DimensionedArray`:
+
+.. code-block:: python
+
+    mask = pydims.packed_mask.pack(data > threshold)
+    valid = mask & ~bad
+    pydims.any(valid, dim='x')
+
+Logical operations act on whole bytes of 8 elements. Reductions over leading or
+trailing dims, and over all dims, also operate on bytes if the non-reduced or
+reduced block spans a multiple of 8 elements. Other operations unpack the bits,
+e.g., transposing, and conversion to other dtypes.
+"""
+
+from __future__ import annotations
+
+import builtins
+import math
+import numbers
+import operator
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from .dimensioned_array import DimensionedArray
+
+Shape = tuple[int, ...]
+
+# Number of bytes unpacked at once when counting along leading dims.
+_CHUNK_BYTES = 1 << 16
+
+
+def _clear_padding(words: npt.NDArray[np.uint8], size: int) -> npt.NDArray[np.uint8]:
+    if (remainder := size % 8) and len(words):
+        words[-1] &= (1 << remainder) - 1
+    return words
+
+
+class PackedMask:
+    """
+    Boolean array storing one bit per element.
+
+    Indexing returns a packed copy, not a view.
+    """
+
+    __slots__ = ('_words', 'shape')
+
+    _words: npt.NDArray[np.uint8]
+    shape: Shape
+
+    def __init__(self, words: npt.NDArray[np.uint8], shape: Shape):
+        """
+        Parameters
+        ----------
+        words:
+            1-D uint8 array of bits in C order and little bit order, with unused
+            bits in the last byte set to zero. Use :py:meth:`pack` to create it.
+        shape:
+            Shape of the boolean array.
+        """
+        self._words = words
+        self.shape = tuple(shape)
+
+    @classmethod
+    def pack(cls, values: Any) -> PackedMask:
+        """Pack a boolean array."""
+        values = np.asarray(values, dtype=bool)
+        return cls(np.packbits(values.reshape(-1), bitorder='little'), values.shape)
+
+    @classmethod
+    def _full(cls, shape: Shape, value: bool) -> PackedMask:
+        size = math.prod(shape)
+        words = np.full((size + 7) // 8, 0xFF if value else 0, dtype=np.uint8)
+        return cls(_clear_padding(words, size), shape)
+
+    def unpack(self) -> npt.NDArray[np.bool_]:
+        """Return the values as a NumPy boolean array."""
+        bits = np.unpackbits(self._words, count=self.size, bitorder='little')
+        return bits.view(bool).reshape(self.shape)
+
+    def _unpack_range(self, lo: int, hi: int) -> npt.NDArray[np.bool_]:
+        first = lo // 8
+        bits = np.unpackbits(self._words[first : (hi + 7) // 8], bitorder='little')
+        return bits[lo - 8 * first : hi - 8 * first].view(bool)
+
+    def _write_range(self, lo: int, hi: int, bits: npt.NDArray[np.bool_]) -> None:
+        first, last = lo // 8, (hi + 7) // 8
+        current = np.unpackbits(self._words[first:last], bitorder='little')
+        current[lo - 8 * first : hi - 8 * first] = bits
+        self._words[first:last] = np.packbits(current, bitorder='little')
+
+    def _count(self) -> int:
+        return int(np.bitwise_count(self._words).sum(dtype=np.int64))
+
+    @property
+    def dtype(self) -> np.dtype[np.bool_]:
+        return np.dtype(bool)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    @property
+    def nbytes(self) -> int:
+        return self._words.nbytes
+
+    @property
+    def device(self) -> str:
+        return 'cpu'
+
+    def __array_namespace__(self, api_version: str | None = None) -> _PackedNamespace:
+        return _namespace
+
+    def __array__(
+        self, dtype: Any = None, copy: bool | None = None
+    ) -> npt.NDArray[Any]:
+        values = self.unpack()
+        return values if dtype is None else values.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f'PackedMask(shape={self.shape})'
+
+    def __bool__(self) -> bool:
+        if self.size != 1:
+            raise ValueError(
+                "The truth value of a mask with more than one element is ambiguous"
+            )
+        return bool(self._words[0] & 1)
+
+    def _binary(self, other: Any, op: Callable[[Any, Any], Any]) -> PackedMask:
+        if isinstance(other, bool | np.bool_):
+            other = PackedMask._full((), bool(other))
+        elif isinstance(other, np.ndarray) and other.dtype == bool:
+            other = PackedMask.pack(other)
+        elif not isinstance(other, PackedMask):
+            return NotImplemented
+        a, b = self, other
+        if a.shape != b.shape:
+            shape = np.broadcast_shapes(a.shape, b.shape)
+            a = _namespace.broadcast_to(a, shape)
+            b = _namespace.broadcast_to(b, shape)
+        return PackedMask(_clear_padding(op(a._words, b._words), a.size), a.shape)
+
+    def __and__(self, other: Any) -> PackedMask:
+        return self._binary(other, operator.and_)
+
+    def __or__(self, other: Any) -> PackedMask:
+        return self._binary(other, operator.or_)
+
+    def __xor__(self, other: Any) -> PackedMask:
+        return self._binary(other, operator.xor)
+
+    __rand__, __ror__, __rxor__ = __and__, __or__, __xor__
+    __ne__ = __xor__  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> PackedMask:  # type: ignore[override]
+        result = self._binary(other, operator.xor)
+        return result if result is NotImplemented else ~result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __invert__(self) -> PackedMask:
+        return PackedMask(_clear_padding(~self._words, self.size), self.shape)
+
+    def _flat_range(self, key: Any) -> tuple[int, int, Shape] | None:
+        """Return the flat bit range and shape selected by key, None if irregular."""
+        key = key if isinstance(key, tuple) else (key,)
+        if any(k is Ellipsis for k in key):
+            i = next(i for i, k in enumerate(key) if k is Ellipsis)
+            fill = (slice(None),) * (self.ndim - len(key) + 1)
+            key = (*key[:i], *fill, *key[i + 1 :])
+        if len(key) > self.ndim:
+            raise IndexError(f"Too many indices for array with {self.ndim} dimensions")
+        key = (*key, *(slice(None),) * (self.ndim - len(key)))
+        if not all(isinstance(k, numbers.Integral | slice) for k in key):
+            return None
+        strides = [math.prod(self.shape[i + 1 :]) for i in range(self.ndim)]
+        lo = 0
+        axis = 0
+        while axis < self.ndim and isinstance(key[axis], numbers.Integral):
+            size = self.shape[axis]
+            index = int(key[axis])
+            if not -size <= index < size:
+                raise IndexError(f"Index {index} out of bounds for size {size}")
+            lo += (index % size) * strides[axis]
+            axis += 1
+        if axis == self.ndim:
+            return lo, lo + 1, ()
+        start, stop, step = key[axis].indices(self.shape[axis])
+        if step != 1 or any(
+            not isinstance(key[j], slice)
+            or key[j].indices(self.shape[j]) != (0, self.shape[j], 1)
+            for j in range(axis + 1, self.ndim)
+        ):
+            return None
+        length = max(0, stop - start)
+        lo += start * strides[axis]
+        return lo, lo + length * strides[axis], (length, *self.shape[axis + 1 :])
+
+    def __getitem__(self, key: Any) -> PackedMask:
+        if (selected := self._flat_range(key)) is None:
+            return PackedMask.pack(self.unpack()[key])
+        lo, hi, shape = selected
+        return PackedMask.pack(self._unpack_range(lo, hi).reshape(shape))
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if isinstance(value, PackedMask):
+            value = value.unpack()
+        if (selected := self._flat_range(key)) is None:
+            values = self.unpack().copy()
+            values[key] = value
+            self._words = PackedMask.pack(values)._words
+            return
+        lo, hi, shape = selected
+        bits = np.broadcast_to(np.asarray(value, dtype=bool), shape)
+        self._write_range(lo, hi, bits.reshape(-1))
+
+
+def _normalize_axes(axis: int | Sequence[int] | None, ndim: int) -> tuple[int, ...]:
+    if axis is None:
+        return tuple(range(ndim))
+    axes = axis if isinstance(axis, Sequence) else (axis,)
+    return tuple(sorted({a % ndim for a in axes}))
+
+
+def _count_rows(words: npt.NDArray[np.uint8]) -> npt.NDArray[np.int64]:
+    """Count set bits per bit position, summing over the rows of 2-D words."""
+    counts = np.zeros(words.shape[1] * 8, dtype=np.int64)
+    rows = max(1, _CHUNK_BYTES // max(1, words.shape[1]))
+    for start in range(0, words.shape[0], rows):
+        chunk = np.unpackbits(words[start : start + rows], axis=1, bitorder='little')
+        counts += chunk.sum(axis=0, dtype=np.int64)
+    return counts
+
+
+def _reduce(x: PackedMask, axis: Any, kind: str) -> Any:
+    axes = _normalize_axes(axis, x.ndim)
+    ndim = x.ndim
+    if len(axes) == ndim:
+        if kind == 'any':
+            return np.bool_(x._words.any())
+        count = x._count()
+        return np.bool_(count == x.size) if kind == 'all' else np.int64(count)
+    n = len(axes)
+    if axes == tuple(range(ndim - n, ndim)):
+        # Trailing dims: reduce each row of bytes.
+        inner = math.prod(x.shape[ndim - n :])
+        if inner % 8 == 0:
+            words = x._words.reshape(-1, inner // 8)
+            shape = x.shape[: ndim - n]
+            if kind == 'any':
+                return PackedMask.pack(words.any(axis=1).reshape(shape))
+            if kind == 'all':
+                return PackedMask.pack((words == 0xFF).all(axis=1).reshape(shape))
+            return np.bitwise_count(words).sum(axis=1, dtype=np.int64).reshape(shape)
+    if axes == tuple(range(n)):
+        # Leading dims: combine rows of bytes.
+        outer = math.prod(x.shape[:n])
+        inner = x.size // outer if outer else 0
+        if inner % 8 == 0 and outer:
+            words = x._words.reshape(outer, inner // 8)
+            shape = x.shape[n:]
+            if kind == 'any':
+                return PackedMask(np.bitwise_or.reduce(words, axis=0), shape)
+            if kind == 'all':
+                return PackedMask(np.bitwise_and.reduce(words, axis=0), shape)
+            return _count_rows(words).reshape(shape)
+    values = x.unpack()
+    if kind == 'count':
+        return np.asarray(np.count_nonzero(values, axis=axes), dtype=np.int64)
+    return PackedMask.pack(getattr(np, kind)(values, axis=axes))
+
+
+def _reduction(kind: str) -> Callable[..., Any]:
+    def reduce(
+        x: PackedMask,
+        /,
+        *,
+        axis: int | Sequence[int] | None = None,
+        keepdims: bool = False,
+        dtype: Any = None,
+    ) -> Any:
+        if keepdims:
+            raise ValueError("keepdims is not supported for packed masks")
+        result = _reduce(x, axis, kind)
+        return result if dtype is None else np.asarray(result, dtype=dtype)
+
+    return reduce
+
+
+class _PackedNamespace:
+    """Array API namespace of :py:class:`PackedMask`."""
+
+    __name__ = 'pydims.packed_mask'
+
+    bool = np.bool_
+    int8, int16, int32, int64 = np.int8, np.int16, np.int32, np.int64
+    uint8, uint16, uint32, uint64 = np.uint8, np.uint16, np.uint32, np.uint64
+    float32, float64 = np.float32, np.float64
+    complex64, complex128 = np.complex64, np.complex128
+
+    isdtype = staticmethod(np.isdtype)
+    iinfo = staticmethod(np.iinfo)
+    finfo = staticmethod(np.finfo)
+
+    any = staticmethod(_reduction('any'))
+    all = staticmethod(_reduction('all'))
+    sum = count_nonzero = staticmethod(_reduction('count'))
+    logical_and = staticmethod(operator.and_)
+    logical_or = staticmethod(operator.or_)
+    logical_xor = staticmethod(operator.xor)
+    logical_not = staticmethod(operator.invert)
+
+    @staticmethod
+    def result_type(*arrays_and_dtypes: Any) -> np.dtype[Any]:
+        return np.result_type(
+            *(
+                a.dtype if isinstance(a, PackedMask | np.ndarray) else a
+                for a in arrays_and_dtypes
+            )
+        )
+
+    @staticmethod
+    def asarray(
+        obj: Any, /, *, dtype: Any = None, device: Any = None, copy: Any = None
+    ) -> Any:
+        if isinstance(obj, PackedMask) and dtype in (None, bool, np.bool_):
+            return PackedMask(obj._words.copy(), obj.shape) if copy else obj
+        values = np.asarray(obj, dtype=dtype)
+        return PackedMask.pack(values) if values.dtype == bool else values
+
+    @staticmethod
+    def empty(shape: int | Shape, *, dtype: Any = None, device: Any = None) -> Any:
+        shape = tuple(shape) if isinstance(shape, Sequence) else (shape,)
+        if dtype is None or np.dtype(dtype) == bool:
+            return PackedMask._full(shape, False)
+        return np.zeros(shape, dtype=dtype)
+
+    zeros = empty
+
+    @staticmethod
+    def ones(shape: int | Shape, *, dtype: Any = None, device: Any = None) -> Any:
+        shape = tuple(shape) if isinstance(shape, Sequence) else (shape,)
+        if dtype is None or np.dtype(dtype) == bool:
+            return PackedMask._full(shape, True)
+        return np.ones(shape, dtype=dtype)
+
+    @staticmethod
+    def astype(
+        x: PackedMask, dtype: Any, /, *, copy: builtins.bool = True, device: Any = None
+    ) -> Any:
+        if np.dtype(dtype) == bool:
+            return PackedMask(x._words.copy(), x.shape) if copy else x
+        return x.unpack().astype(dtype)
+
+    @staticmethod
+    def reshape(
+        x: PackedMask, /, shape: Shape, *, copy: builtins.bool | None = None
+    ) -> PackedMask:
+        shape = tuple(shape)
+        if -1 in shape:
+            known = math.prod(size for size in shape if size != -1)
+            shape = tuple(x.size // known if size == -1 else size for size in shape)
+        if math.prod(shape) != x.size:
+            raise ValueError(f"Cannot reshape array of size {x.size} into {shape}")
+        return PackedMask(x._words.copy() if copy else x._words, shape)
+
+    @staticmethod
+    def expand_dims(x: PackedMask, /, *, axis: int = 0) -> PackedMask:
+        axis = axis % (x.ndim + 1)
+        return PackedMask(x._words, (*x.shape[:axis], 1, *x.shape[axis:]))
+
+    @staticmethod
+    def squeeze(x: PackedMask, /, axis: int | Sequence[int]) -> PackedMask:
+        axes = _normalize_axes(axis, x.ndim)
+        if any(x.shape[a] != 1 for a in axes):
+            raise ValueError("Cannot squeeze axis with size other than one")
+        return PackedMask(
+            x._words, tuple(s for i, s in enumerate(x.shape) if i not in axes)
+        )
+
+    @staticmethod
+    def permute_dims(x: PackedMask, /, axes: Sequence[int]) -> PackedMask:
+        moved = [axis for axis in axes if x.shape[axis] != 1]
+        if moved == sorted(moved):
+            # Only size-1 dims move, so the order of bits is unchanged.
+            return PackedMask(x._words, tuple(x.shape[axis] for axis in axes))
+        return PackedMask.pack(np.permute_dims(x.unpack(), axes))
+
+    @staticmethod
+    def broadcast_to(x: PackedMask, /, shape: Shape) -> PackedMask:
+        shape = tuple(shape)
+        if shape == x.shape:
+            return x
+        lead = len(shape) - x.ndim
+        if shape[lead:] == x.shape and x.size % 8 == 0:
+            # New leading dims repeat whole bytes.
+            return PackedMask(np.tile(x._words, math.prod(shape[:lead])), shape)
+        return PackedMask.pack(np.broadcast_to(x.unpack(), shape))
+
+    @staticmethod
+    def concat(arrays: Sequence[PackedMask], /, *, axis: int = 0) -> PackedMask:
+        first = arrays[0]
+        axis = axis % first.ndim
+        if axis == 0 and all(a.size % 8 == 0 for a in arrays[:-1]):
+            shape = (sum(a.shape[0] for a in arrays), *first.shape[1:])
+            return PackedMask(np.concatenate([a._words for a in arrays]), shape)
+        return PackedMask.pack(np.concatenate([a.unpack() for a in arrays], axis=axis))
+
+    @staticmethod
+    def stack(arrays: Sequence[PackedMask], /, *, axis: int = 0) -> PackedMask:
+        if axis == 0:
+            return _namespace.concat(
+                [_namespace.expand_dims(a, axis=0) for a in arrays], axis=0
+            )
+        return PackedMask.pack(np.stack([a.unpack() for a in arrays], axis=axis))
+
+    @staticmethod
+    def nonzero(x: PackedMask, /) -> tuple[npt.NDArray[np.intp], ...]:
+        return np.nonzero(x.unpack())
+
+    @staticmethod
+    def where(condition: PackedMask, x1: Any, x2: Any, /) -> Any:
+        values = np.where(np.asarray(condition), np.asarray(x1), np.asarray(x2))
+        return PackedMask.pack(values) if values.dtype == bool else values
+
+
+_namespace = _PackedNamespace()
+
+
+def pack(x: DimensionedArray) -> DimensionedArray:
+    """
+    Return a boolean array with values stored as a :py:class:`PackedMask`.
+
+    Parameters
+    ----------
+    x:
+        Boolean array with NumPy values.
+
+    Returns
+    -------
+    :
+        Array with packed values.
+    """
+    if x.dtype != bool:
+        raise TypeError(f"Only boolean arrays can be packed, got dtype {x.dtype}")
+    return x.__class__(values=PackedMask.pack(x.values), dims=x.dims, unit=x.unit)
+
+
+def unpack(x: DimensionedArray) -> DimensionedArray:
+    """
+    Return a boolean array with values stored as a NumPy array.
+
+    Parameters
+    ----------
+    x:
+        Array with packed values.
+
+    Returns
+    -------
+    :
+        Array with unpacked values.
+    """
+    values = x.values.unpack() if isinstance(x.values, PackedMask) else x.values
+    return x.__class__(values=values, dims=x.dims, unit=x.unit)
+
+
+__all__ = ['PackedMask', 'pack', 'unpack']
@@ -0,0 +1,286 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Opt-in instrumentation of PyDims operations.
+
+Use :py:func:`profile` to record, for each public operation, the wall time, the
+number of bytes allocated for results, and the number of copies, transposing
+copies, operands passed out of memory order, and unit conversions performed
+internally:
+
+.. code-block:: python
+
+    with pydims.profiling.profile() as prof:
+        run_pipeline()
+    print(prof.summary())
+
+When no profile is active the instrumentation only costs a check of a global list.
+This module does not import any other PyDims module, so it can be used by all of
+them.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+# Active profiles. Operations are only instrumented if this is non-empty.
+_profiles: list[Profile] = []
+_local = threading.local()
+
+
+class OpStats:
+    """Accumulated statistics of one operation."""
+
+    __slots__ = (
+        'bytes_allocated',
+        'calls',
+        'copies',
+        'get_scale_time',
+        'strided_operands',
+        'transposes',
+        'unit_conversions',
+        'wall_time',
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.wall_time = 0.0
+        """Inclusive wall time in seconds."""
+        self.bytes_allocated = 0
+        """Bytes of result values that do not share memory with the inputs."""
+        self.copies = 0
+        self.transposes = 0
+        """Number of copies that change the memory order, e.g., of transposed values."""
+        self.strided_operands = 0
+        """Number of operands passed to the array library out of memory order."""
+        self.unit_conversions = 0
+        self.get_scale_time = 0.0
+        """Time in seconds spent computing unit conversion factors."""
+
+    def __repr__(self) -> str:
+        args = ', '.join(f'{name}={getattr(self, name)}' for name in self.__slots__)
+        return f'OpStats({args})'
+
+
+# Counters accumulated per call, in addition to calls and wall_time.
+_COUNTERS = (
+    'bytes_allocated',
+    'copies',
+    'transposes',
+    'strided_operands',
+    'unit_conversions',
+    'get_scale_time',
+)
+
+
+class _Frame:
+    __slots__ = ('counters', 'name', 'start')
+
+    def __init__(self, name: str, start: float) -> None:
+        self.name = name
+        self.start = start
+        self.counters = OpStats()
+
+
+class Profile:
+    """Statistics and trace events recorded by :py:func:`profile`."""
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stats: dict[str, OpStats] = {}
+        """Statistics by operation name."""
+        self._events: list[dict[str, Any]] = []
+
+    def _record(self, frame: _Frame, end: float) -> None:
+        counters = frame.counters
+        with self._lock:
+            stats = self.stats.setdefault(frame.name, OpStats())
+            stats.calls += 1
+            stats.wall_time += end - frame.start
+            for name in _COUNTERS:
+                setattr(stats, name, getattr(stats, name) + getattr(counters, name))
+            self._events.append(
+                {
+                    'name': frame.name,
+                    'ph': 'X',
+                    'ts': (frame.start - self._start) * 1e6,
+                    'dur': (end - frame.start) * 1e6,
+                    'pid': 0,
+                    'tid': threading.get_ident(),
+                    'args': {name: getattr(counters, name) for name in _COUNTERS},
+                }
+            )
+
+    def trace_events(self) -> list[dict[str, Any]]:
+        """
+        Return the recorded operations as trace events.
+
+        The events use the Chrome trace event format and can be viewed, e.g., with
+        Perfetto after writing ``{"traceEvents": events}`` to a JSON file.
+
+        Returns
+        -------
+        :
+            List of complete ('X') events with timestamps in microseconds.
+        """
+        with self._lock:
+            return list(self._events)
+
+    def summary(self) -> str:
+        """
+        Return a table of statistics by operation, sorted by total wall time.
+
+        Returns
+        -------
+        :
+            Formatted table.
+        """
+        header = (
+            f"{'operation':<32} {'calls':>7} {'time [ms]':>10} {'MB alloc':>10} "
+            f"{'copies':>7} {'transp.':>7} {'strided':>7} {'unit conv.':>10} "
+            f"{'scale [ms]':>10}"
+        )
+        lines = [header, '-' * len(header)]
+        with self._lock:
+            items = sorted(
+                self.stats.items(), key=lambda item: item[1].wall_time, reverse=True
+            )
+        for name, s in items:
+            lines.append(
+                f"{name:<32} {s.calls:>7} {s.wall_time * 1e3:>10.3f} "
+                f"{s.bytes_allocated / 1e6:>10.3f} {s.copies:>7} {s.transposes:>7} "
+                f"{s.strided_operands:>7} {s.unit_conversions:>10} "
+                f"{s.get_scale_time * 1e3:>10.3f}"
+            )
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        return self.summary()
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """
+    Context manager recording statistics of PyDims operations.
+
+    Profiles can be nested, in which case operations are recorded in all active
+    profiles.
+
+    Returns
+    -------
+    :
+        Profile that is filled while the context is active.
+    """
+    prof = Profile()
+    _profiles.append(prof)
+    try:
+        yield prof
+    finally:
+        _profiles.remove(prof)
+
+
+def _frames() -> list[_Frame]:
+    frames = getattr(_local, 'frames', None)
+    if frames is None:
+        frames = _local.frames = []
+    return frames
+
+
+def _current() -> OpStats | None:
+    if not _profiles:
+        return None
+    frames = _frames()
+    return frames[-1].counters if frames else None
+
+
+def _nbytes(values: Any) -> int:
+    if (nbytes := getattr(values, 'nbytes', None)) is not None:
+        return int(nbytes)
+    itemsize = getattr(getattr(values, 'dtype', None), 'itemsize', None)
+    size = getattr(values, 'size', None)
+    if itemsize is None or size is None:
+        return 0
+    return int(itemsize * size)
+
+
+def _shares_memory(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    if type(a).__module__ == 'numpy' and type(b).__module__ == 'numpy':
+        import numpy as np
+
+        return bool(np.may_share_memory(a, b))
+    return False
+
+
+def _allocated_bytes(result: Any, args: tuple[Any, ...]) -> int:
+    values = getattr(result, 'values', None)
+    if values is None or not hasattr(values, 'shape'):
+        return 0
+    for arg in args:
+        if _shares_memory(values, getattr(arg, 'values', None)):
+            return 0
+    return _nbytes(values)
+
+
+def instrumented(name: str) -> Callable[[_F], _F]:
+    """Decorator recording calls of a public operation in active profiles."""
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _profiles:
+                return func(*args, **kwargs)
+            frames = _frames()
+            frame = _Frame(name=name, start=time.perf_counter())
+            frames.append(frame)
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                frames.pop()
+            frame.counters.bytes_allocated += _allocated_bytes(result, args)
+            end = time.perf_counter()
+            for prof in _profiles:
+                prof._record(frame, end)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def record_copy() -> None:
+    if (counters := _current()) is not None:
+        counters.copies += 1
+
+
+def record_transpose() -> None:
+    if (counters := _current()) is not None:
+        counters.transposes += 1
+
+
+def record_strided_operand() -> None:
+    if (counters := _current()) is not None:
+        counters.strided_operands += 1
+
+
+def record_unit_conversion(get_scale_time: float) -> None:
+    if (counters := _current()) is not None:
+        counters.unit_conversions += 1
+        counters.get_scale_time += get_scale_time
+
+
+def is_enabled() -> bool:
+    """Return True if a profile is active."""
+    return bool(_profiles)
+
+
+__all__ = ['OpStats', 'Profile', 'profile']
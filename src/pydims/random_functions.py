@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Parallel, reproducible creation of random arrays.
+
+The output is split into blocks along the first axis. Each block is filled by a
+NumPy generator seeded with its own child of a :py:class:`numpy.random.SeedSequence`,
+so blocks can be filled in parallel and the result only depends on the seed, not on
+the number of workers. For Dask the blocks are the chunks, filled lazily, and the
+values are the same as for NumPy.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import numpy.typing as npt
+from array_api_compat import is_dask_namespace, is_numpy_namespace
+
+from .creation_functions import _default_unit
+from .dimensioned_array import DimensionedArray, Dims, Shape, UnitImplementation
+
+if TYPE_CHECKING:
+    from .creation_functions import CreationFunctions
+
+Seed = int | np.random.SeedSequence | None
+Fill = Callable[[np.random.Generator, tuple[int, ...]], npt.NDArray[Any]]
+
+# Number of elements per block. Must not change, since it determines the values.
+_BLOCK_SIZE = 1 << 16
+
+
+def _block_rows(shape: Shape) -> int:
+    per_row = math.prod(shape[1:])
+    return max(1, _BLOCK_SIZE // per_row) if per_row else max(1, shape[0])
+
+
+def _block_shapes(shape: Shape) -> list[tuple[int, ...]]:
+    if not shape:
+        return [()]
+    rows = _block_rows(shape)
+    return [
+        (min(rows, shape[0] - start), *shape[1:]) for start in range(0, shape[0], rows)
+    ] or [shape]
+
+
+def _seed_sequences(seed: Seed, count: int) -> list[np.random.SeedSequence]:
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(count)
+
+
+class RandomFunctions:
+    """
+    Random array creation, available as :py:attr:`CreationFunctions.random`.
+
+    All functions take a ``seed`` and a ``workers`` argument. Arrays created with
+    the same seed are identical, for any number of workers.
+    """
+
+    def __init__(self, creation: CreationFunctions):
+        self._creation = creation
+
+    def _create(
+        self,
+        dims: Dims,
+        shape: Shape,
+        fill: Fill,
+        *,
+        dtype: Any,
+        unit: Any,
+        seed: Seed,
+        workers: int | None,
+    ) -> DimensionedArray:
+        shape = tuple(shape)
+        xp = self._creation._array_api
+        blocks = _block_shapes(shape)
+        seeds = _seed_sequences(seed, len(blocks))
+
+        def block(index: int) -> npt.NDArray[Any]:
+            return fill(np.random.default_rng(seeds[index]), blocks[index]).astype(
+                dtype, copy=False
+            )
+
+        if is_dask_namespace(xp):
+            import dask.array as da
+
+            chunks = (
+                tuple(b[0] for b in blocks),
+                *((size,) for size in shape[1:]),
+            )
+            values = da.map_blocks(  # type: ignore[no-untyped-call]
+                lambda block_id: block(block_id[0] if block_id else 0),
+                chunks=chunks if shape else (),
+                dtype=dtype,
+                meta=np.empty((0,) * len(shape), dtype=dtype),
+            )
+        else:
+            out = np.empty(shape, dtype=dtype)
+            if not shape:
+                out[...] = block(0)
+            else:
+                rows = _block_rows(shape)
+
+                def fill_block(index: int) -> None:
+                    start = index * rows
+                    out[start : start + blocks[index][0]] = block(index)
+
+                with ThreadPoolExecutor(workers) as pool:
+                    list(pool.map(fill_block, range(len(blocks))))
+            values = out if is_numpy_namespace(xp) else xp.asarray(out)
+        return DimensionedArray(
+            values=values, dims=dims, unit=self._creation._maybe_unit(unit, values)
+        )
+
+    def uniform(
+        self,
+        dims: Dims,
+        shape: Shape,
+        *,
+        low: float = 0.0,
+        high: float = 1.0,
+        unit: Any | UnitImplementation | None = _default_unit,
+        dtype: Any = np.float64,
+        seed: Seed = None,
+        workers: int | None = None,
+    ) -> DimensionedArray:
+        """Return values drawn from a uniform distribution over [low, high)."""
+
+        def fill(rng: np.random.Generator, shape: tuple[int, ...]) -> npt.NDArray[Any]:
+            return rng.uniform(low, high, size=shape)
+
+        return self._create(
+            dims,
+            shape,
+            fill,
+            dtype=dtype,
+            unit=unit,
+            seed=seed,
+            workers=workers,
+        )
+
+    def normal(
+        self,
+        dims: Dims,
+        shape: Shape,
+        *,
+        loc: float = 0.0,
+        scale: float = 1.0,
+        unit: Any | UnitImplementation | None = _default_unit,
+        dtype: Any = np.float64,
+        seed: Seed = None,
+        workers: int | None = None,
+    ) -> DimensionedArray:
+        """Return values drawn from a normal distribution."""
+
+        def fill(rng: np.random.Generator, shape: tuple[int, ...]) -> npt.NDArray[Any]:
+            return rng.normal(loc, scale, size=shape)
+
+        return self._create(
+            dims,
+            shape,
+            fill,
+            dtype=dtype,
+            unit=unit,
+            seed=seed,
+            workers=workers,
+        )
+
+    def poisson(
+        self,
+        dims: Dims,
+        shape: Shape,
+        *,
+        lam: float = 1.0,
+        unit: Any | UnitImplementation | None = _default_unit,
+        dtype: Any = np.int64,
+        seed: Seed = None,
+        workers: int | None = None,
+    ) -> DimensionedArray:
+        """Return values drawn from a Poisson distribution, e.g., counts."""
+
+        def fill(rng: np.random.Generator, shape: tuple[int, ...]) -> npt.NDArray[Any]:
+            return rng.poisson(lam, size=shape)
+
+        return self._create(
+            dims,
+            shape,
+            fill,
+            dtype=dtype,
+            unit=unit,
+            seed=seed,
+            workers=workers,
+        )
+
+
+__all__ = ['RandomFunctions']
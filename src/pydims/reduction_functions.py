@@ -7,17 +7,21 @@ Includes functions from the "Utility Functions" and "Statistical Functions" sect
 of the Python Array API standard.
 """
 
-from collections.abc import Callable
-from typing import Any
+import builtins
+from collections.abc import Callable, Iterator
+from math import prod as _prod
+from typing import Any, Literal
 
 from .dimensioned_array import (
     ArrayImplementation,
     Dim,
     DimArr,
+    DimensionedArray,
     Dims,
     DType,
     UnitImplementation,
 )
+from .profiling import instrumented
 
 
 def _reduce(
@@ -32,22 +36,238 @@ def _reduce(
     if 'keepdims' in kwargs:
         raise ValueError("keepdims is not supported")
     axis, dims = _axis_dims_for_reduce(x, dim)
-    return x.__class__(
-        values=values_op(x.values, axis=axis, **kwargs), dims=dims, unit=unit_op(x.unit)
-    )
+    values = values_op(x.values, axis=axis, **kwargs)
+    if not dims:
+        return x._new(values, (), unit_op(x.unit))
+    return x.__class__(values=values, dims=dims, unit=unit_op(x.unit))
 
 
-def _axis_dims_for_reduce(x, dim):
+def _axis_dims_for_reduce(
+    x: DimensionedArray, dim: Dim | Dims | None
+) -> tuple[tuple[int, ...], Dims]:
     dim = dim or x.dims
     if not isinstance(dim, tuple):
         dim = (dim,)
 
-    axis = tuple(x.dims.index(d) for d in dim)
+    axis = tuple(sorted(x.dims.index(d) for d in dim))
     dims = tuple(d for d in x.dims if d not in dim)
     return axis, dims
 
 
-def _reduce_docstring(short: str, op: str) -> str:
+def _memory_order(values: ArrayImplementation) -> list[int] | None:
+    """
+    Return the axes of values ordered by decreasing stride.
+
+    Returns None if values have no strides or are already in memory order.
+    """
+    from array_api_compat import is_numpy_array
+
+    if not is_numpy_array(values) or values.ndim < 2 or values.size == 0:
+        return None
+    order = sorted(range(values.ndim), key=lambda i: -builtins.abs(values.strides[i]))
+    return None if order == sorted(order) else order
+
+
+def _reduce_in_memory_order(
+    xp: Any,
+    values: ArrayImplementation,
+    axis: tuple[int, ...],
+    op: Callable[..., ArrayImplementation],
+) -> ArrayImplementation:
+    """
+    Apply op to a view of values with axes in memory order.
+
+    The result is a view with the kept axes in their original order.
+    """
+    order = _memory_order(values)
+    if order is None:
+        return op(values, axis=axis)
+    result = op(
+        xp.permute_dims(values, tuple(order)),
+        axis=tuple(sorted(order.index(i) for i in axis)),
+    )
+    kept = [i for i in order if i not in axis]
+    perm = tuple(kept.index(i) for i in sorted(kept))
+    if perm == tuple(range(len(perm))):
+        return result
+    return xp.permute_dims(result, perm)
+
+
+Accumulation = Literal['blocked', 'kahan', 'pairwise']
+
+# Number of elements summed per block, chosen such that a block of float32 and its
+# float64 cast fit in a typical L2 cache.
+_BLOCK_SIZE = 1 << 16
+# Width of tiles along a kept innermost axis, such that blocks span many rows.
+_TILE_WIDTH = _BLOCK_SIZE // 16
+
+
+def _blocks(
+    values: ArrayImplementation, axis: tuple[int, ...]
+) -> Iterator[ArrayImplementation]:
+    """Split values into blocks along the first reduced axis."""
+    first = axis[0]
+    length = values.shape[first]
+    per_index = _prod(values.shape) // length
+    rows = builtins.max(1, _BLOCK_SIZE // per_index) if per_index else length
+    prefix = (slice(None),) * first
+    for start in range(0, length, rows):
+        yield values[(*prefix, slice(start, builtins.min(start + rows, length)), ...)]
+
+
+def _kahan(partials: Iterator[ArrayImplementation]) -> ArrayImplementation:
+    total = next(partials)
+    compensation = total * 0
+    for partial in partials:
+        y = partial - compensation
+        t = total + y
+        compensation = (t - total) - y
+        total = t
+    return total
+
+
+def _pairwise(partials: Iterator[ArrayImplementation]) -> ArrayImplementation:
+    # Binary counter: at most log2(n) partial sums are alive at any time.
+    stack: list[tuple[int, ArrayImplementation]] = []
+    for partial in partials:
+        level = 0
+        while stack and stack[-1][0] == level:
+            partial = stack.pop()[1] + partial
+            level += 1
+        stack.append((level, partial))
+    total = stack.pop()[1]
+    while stack:
+        total = stack.pop()[1] + total
+    return total
+
+
+def _accumulated_sum(
+    xp: Any,
+    values: ArrayImplementation,
+    axis: tuple[int, ...],
+    dtype: DType | None,
+    accumulation: Accumulation,
+) -> ArrayImplementation:
+    """
+    Sum values in blocks, returning the sum in the accumulation dtype.
+
+    'blocked' sums each block in double precision, 'kahan' and 'pairwise' combine
+    per-block sums in the input dtype with compensated or pairwise summation.
+    """
+    if accumulation not in ('blocked', 'kahan', 'pairwise'):
+        raise ValueError(f"Unknown accumulation '{accumulation}'")
+    if xp.isdtype(values.dtype, 'complex floating'):
+        wide = xp.complex128
+    else:
+        wide = xp.float64
+    from array_api_compat import is_lazy_array
+
+    if is_lazy_array(values) or values.size == 0 or not axis:
+        # Lazy backends sum chunk by chunk, without a full-size temporary.
+        return xp.sum(values, axis=axis, dtype=wide)
+    block_dtype = wide if accumulation == 'blocked' else dtype
+
+    def op(
+        values: ArrayImplementation, *, axis: tuple[int, ...]
+    ) -> ArrayImplementation:
+        return _tiled_sum(xp, values, axis, block_dtype, accumulation)
+
+    # Blocks are slices along the outermost reduced axis in memory, rows of the
+    # leading axis, or tiles of the innermost axis, so they are contiguous.
+    return _reduce_in_memory_order(xp, values, axis, op)
+
+
+def _tiled_sum(
+    xp: Any,
+    values: ArrayImplementation,
+    axis: tuple[int, ...],
+    block_dtype: DType | None,
+    accumulation: Accumulation,
+) -> ArrayImplementation:
+    if axis[0] > 0:
+        # The leading axis is not reduced. Sum cache-sized groups of its rows, so
+        # blocks are contiguous instead of strided slices along an inner axis.
+        return xp.concat(
+            [
+                _blocked_sum(xp, rows, axis, block_dtype, accumulation)
+                for rows in _blocks(values, (0,))
+            ],
+            axis=0,
+        )
+    last = values.ndim - 1
+    if axis[-1] < last and values.shape[last] > _TILE_WIDTH:
+        # The innermost axis is not reduced and long. Sum tiles of its columns, so
+        # each block spans many rows and few partial sums need to be combined.
+        return xp.concat(
+            [
+                _blocked_sum(
+                    xp,
+                    values[..., start : start + _TILE_WIDTH],
+                    axis,
+                    block_dtype,
+                    accumulation,
+                )
+                for start in range(0, values.shape[last], _TILE_WIDTH)
+            ],
+            axis=-1,
+        )
+    return _blocked_sum(xp, values, axis, block_dtype, accumulation)
+
+
+def _blocked_sum(
+    xp: Any,
+    values: ArrayImplementation,
+    axis: tuple[int, ...],
+    block_dtype: DType | None,
+    accumulation: Accumulation,
+) -> ArrayImplementation:
+    partials = (
+        xp.sum(block, axis=axis, dtype=block_dtype) for block in _blocks(values, axis)
+    )
+    if accumulation == 'kahan':
+        return _kahan(partials)
+    if accumulation == 'pairwise':
+        return _pairwise(partials)
+    total = next(partials)
+    for partial in partials:
+        total = total + partial
+    return total
+
+
+def _is_floating(xp: Any, dtype: DType) -> bool:
+    return xp.isdtype(dtype, ('real floating', 'complex floating'))
+
+
+def _sum_op(
+    xp: Any, accumulation: Accumulation | None
+) -> Callable[..., ArrayImplementation]:
+    def op(
+        values: ArrayImplementation, *, axis: tuple[int, ...], dtype: DType | None
+    ) -> ArrayImplementation:
+        if accumulation is None or not _is_floating(xp, values.dtype):
+            return xp.sum(values, axis=axis, dtype=dtype)
+        total = _accumulated_sum(xp, values, axis, dtype, accumulation)
+        return xp.astype(total, values.dtype if dtype is None else dtype)
+
+    return op
+
+
+def _mean_op(
+    xp: Any, accumulation: Accumulation | None
+) -> Callable[..., ArrayImplementation]:
+    def op(
+        values: ArrayImplementation, *, axis: tuple[int, ...], **kwargs: Any
+    ) -> ArrayImplementation:
+        if accumulation is None or not _is_floating(xp, values.dtype):
+            return xp.mean(values, axis=axis, **kwargs)
+        total = _accumulated_sum(xp, values, axis, None, accumulation)
+        count = _prod(values.shape[i] for i in axis)
+        return xp.astype(total / count, values.dtype)
+
+    return op
+
+
+def _reduce_docstring(short: str, op: str, extra: str = '') -> str:
     return f"""
     {short} along one or multiple dimensions.
 
@@ -56,7 +276,7 @@ def _reduce_docstring(short: str, op: str) -> str:
     x:
         Input array
     dim:
-        Dimension or dimensions along which to perform {op}.
+        Dimension or dimensions along which to perform {op}.{extra}
 
     Returns
     -------
@@ -75,6 +295,10 @@ def _keep_unit(unit: UnitImplementation | None) -> UnitImplementation | None:
     return unit
 
 
+def _count_unit(unit: UnitImplementation | None) -> UnitImplementation | None:
+    return None if unit is None else unit / unit
+
+
 def _unit_must_be_idempotent(
     unit: UnitImplementation | None,
 ) -> UnitImplementation | None:
@@ -85,6 +309,7 @@ def _unit_must_be_idempotent(
     return unit
 
 
+@instrumented('all')
 def all(x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any) -> DimArr:
     return _reduce(
         x,
@@ -95,6 +320,7 @@ def all(x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any) -> DimArr
     )
 
 
+@instrumented('any')
 def any(x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any) -> DimArr:
     return _reduce(
         x,
@@ -105,6 +331,20 @@ def any(x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any) -> DimArr
     )
 
 
+@instrumented('count_nonzero')
+def count_nonzero(
+    x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any
+) -> DimArr:
+    return _reduce(
+        x,
+        dim=dim,
+        values_op=x.array_namespace.count_nonzero,
+        unit_op=_count_unit,
+        **kwargs,
+    )
+
+
+@instrumented('max')
 def max(x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any) -> DimArr:
     return _reduce(
         x,
@@ -115,6 +355,7 @@ def max(x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any) -> DimArr
     )
 
 
+@instrumented('min')
 def min(x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any) -> DimArr:
     return _reduce(
         x,
@@ -125,34 +366,45 @@ def min(x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any) -> DimArr
     )
 
 
+@instrumented('sum')
 def sum(
     x: DimArr,
     /,
     *,
     dim: Dim | Dims | None = None,
     dtype: DType | None = None,
+    accumulation: Accumulation | None = None,
     **kwargs: Any,
 ) -> DimArr:
     return _reduce(
         x,
         dim=dim,
-        values_op=x.array_namespace.sum,
+        values_op=_sum_op(x.array_namespace, accumulation),
         unit_op=_keep_unit,
         dtype=dtype,
         **kwargs,
     )
 
 
-def mean(x: DimArr, /, *, dim: Dim | Dims | None = None, **kwargs: Any) -> DimArr:
+@instrumented('mean')
+def mean(
+    x: DimArr,
+    /,
+    *,
+    dim: Dim | Dims | None = None,
+    accumulation: Accumulation | None = None,
+    **kwargs: Any,
+) -> DimArr:
     return _reduce(
         x,
         dim=dim,
-        values_op=x.array_namespace.mean,
+        values_op=_mean_op(x.array_namespace, accumulation),
         unit_op=_keep_unit,
         **kwargs,
     )
 
 
+@instrumented('prod')
 def prod(
     x: DimArr,
     /,
@@ -171,6 +423,7 @@ def prod(
     )
 
 
+@instrumented('std')
 def std(
     x: DimArr,
     /,
@@ -189,6 +442,7 @@ def std(
     )
 
 
+@instrumented('var')
 def var(
     x: DimArr,
     /,
@@ -213,14 +467,40 @@ all.__doc__ = _reduce_docstring(
 any.__doc__ = _reduce_docstring(
     short="Test whether any elements are true", op="a logical OR reduction"
 )
+count_nonzero.__doc__ = _reduce_docstring(
+    short="Number of nonzero or true elements", op="a count reduction"
+)
 max.__doc__ = _reduce_docstring(short="Maximum value", op="a maximum reduction")
-mean.__doc__ = _reduce_docstring(short="Mean", op="a mean reduction")
+_accumulation_docstring = """
+    accumulation:
+        Accumulation method for floating-point values. None uses the backend
+        implementation. ``'blocked'`` sums cache-sized blocks in double precision,
+        which gives float64 accuracy for float32 data without a full-size float64
+        temporary. ``'kahan'`` and ``'pairwise'`` combine per-block sums in the
+        input dtype with compensated or pairwise summation."""
+
+mean.__doc__ = _reduce_docstring(
+    short="Mean", op="a mean reduction", extra=_accumulation_docstring
+)
 min.__doc__ = _reduce_docstring(short="Minimum value", op="a minimum reduction")
 prod.__doc__ = _reduce_docstring(short="Product", op="a product reduction")
 std.__doc__ = _reduce_docstring(
     short="Standard deviation", op="a standard deviation reduction"
 )
-sum.__doc__ = _reduce_docstring(short="Sum", op="a sum reduction")
+sum.__doc__ = _reduce_docstring(
+    short="Sum", op="a sum reduction", extra=_accumulation_docstring
+)
 var.__doc__ = _reduce_docstring(short="Variance", op="a variance reduction")
 
-__all__ = ['all', 'any', 'max', 'min', 'sum', 'mean', 'prod', 'std', 'var']
+__all__ = [
+    'all',
+    'any',
+    'count_nonzero',
+    'max',
+    'min',
+    'sum',
+    'mean',
+    'prod',
+    'std',
+    'var',
+]
@@ -1,17 +1,342 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Lightweight, dependency-free units.
+
+Units are parsed from strings such as ``'m'``, ``'km/s'``, or ``'kg*m^2/s^2'`` into
+a canonical form: a scale factor relative to SI base units and a map from base
+unit to exponent. Units with the same canonical form are interned, i.e., they are
+the same object, so hashing and equality are O(1). For example
+``Unit('m*s') is Unit('s*m')`` and ``Unit('J') == Unit('kg*m^2/s^2')``. The
+string of a unit is derived from the canonical form as well, so it does not depend
+on the spelling that was parsed first, e.g., ``str(Unit('N*m')) == 'J'``.
+
+Symbols that are not known are treated as base units of their own, e.g.,
+``Unit('counts')``.
+"""
+
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from fractions import Fraction
+from math import pi
+from typing import Any, final
+
+Exponents = tuple[tuple[str, int], ...]
+
+_PREFIXES: dict[str, Fraction] = {
+    'Y': Fraction(10) ** 24,
+    'Z': Fraction(10) ** 21,
+    'E': Fraction(10) ** 18,
+    'P': Fraction(10) ** 15,
+    'T': Fraction(10) ** 12,
+    'G': Fraction(10) ** 9,
+    'M': Fraction(10) ** 6,
+    'k': Fraction(10) ** 3,
+    'h': Fraction(10) ** 2,
+    'da': Fraction(10),
+    'd': Fraction(10) ** -1,
+    'c': Fraction(10) ** -2,
+    'm': Fraction(10) ** -3,
+    'u': Fraction(10) ** -6,
+    'µ': Fraction(10) ** -6,
+    'n': Fraction(10) ** -9,
+    'p': Fraction(10) ** -12,
+    'f': Fraction(10) ** -15,
+    'a': Fraction(10) ** -18,
+    'z': Fraction(10) ** -21,
+    'y': Fraction(10) ** -24,
+}
+
+# Symbol -> (scale, exponents of SI base units). Angles are treated as a base unit
+# so that, e.g., rad and counts/s are not confused.
+_SYMBOLS: dict[str, tuple[Fraction, dict[str, int]]] = {
+    'm': (Fraction(1), {'m': 1}),
+    'g': (Fraction(1, 1000), {'kg': 1}),
+    's': (Fraction(1), {'s': 1}),
+    'A': (Fraction(1), {'A': 1}),
+    'K': (Fraction(1), {'K': 1}),
+    'mol': (Fraction(1), {'mol': 1}),
+    'cd': (Fraction(1), {'cd': 1}),
+    'rad': (Fraction(1), {'rad': 1}),
+    'sr': (Fraction(1), {'rad': 2}),
+    'deg': (Fraction(pi) / 180, {'rad': 1}),
+    'Hz': (Fraction(1), {'s': -1}),
+    'N': (Fraction(1), {'kg': 1, 'm': 1, 's': -2}),
+    'Pa': (Fraction(1), {'kg': 1, 'm': -1, 's': -2}),
+    'bar': (Fraction(10) ** 5, {'kg': 1, 'm': -1, 's': -2}),
+    'J': (Fraction(1), {'kg': 1, 'm': 2, 's': -2}),
+    'eV': (Fraction('1.602176634e-19'), {'kg': 1, 'm': 2, 's': -2}),
+    'W': (Fraction(1), {'kg': 1, 'm': 2, 's': -3}),
+    'C': (Fraction(1), {'A': 1, 's': 1}),
+    'V': (Fraction(1), {'kg': 1, 'm': 2, 's': -3, 'A': -1}),
+    'ohm': (Fraction(1), {'kg': 1, 'm': 2, 's': -3, 'A': -2}),
+    'T': (Fraction(1), {'kg': 1, 's': -2, 'A': -1}),
+    'L': (Fraction(1, 1000), {'m': 3}),
+    'Å': (Fraction(10) ** -10, {'m': 1}),
+    'angstrom': (Fraction(10) ** -10, {'m': 1}),
+    'min': (Fraction(60), {'s': 1}),
+    'h': (Fraction(3600), {'s': 1}),
+    'day': (Fraction(86400), {'s': 1}),
+    '%': (Fraction(1, 100), {}),
+    'dimensionless': (Fraction(1), {}),
+}
+
+_TOKEN = re.compile(
+    r'\s*(?:(?P<number>-?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)'
+    r'|(?P<symbol>[^\W\d][\w]*|%|Å)'
+    r'|(?P<op>\*\*|[*/^()]))'
+)
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    tokens = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None or match.end() == pos or match.lastgroup is None:
+            raise ValueError(f"Invalid unit string '{text}' at position {pos}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+def _lookup_symbol(symbol: str) -> tuple[Fraction, dict[str, int]]:
+    if symbol in _SYMBOLS:
+        return _SYMBOLS[symbol]
+    for length in (2, 1):
+        prefix, base = symbol[:length], symbol[length:]
+        if prefix in _PREFIXES and base in _SYMBOLS:
+            scale, exponents = _SYMBOLS[base]
+            return _PREFIXES[prefix] * scale, exponents
+    return Fraction(1), {symbol: 1}
+
+
+class _Parser:
+    """Recursive descent parser for unit strings."""
+
+    def __init__(self, text: str):
+        self._text = text
+        self._tokens = _tokenize(text)
+        self._pos = 0
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _next(self) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of unit string '{self._text}'")
+        self._pos += 1
+        return token
+
+    def parse(self) -> tuple[Fraction, dict[str, int]]:
+        if not self._tokens:
+            return Fraction(1), {}
+        result = self._product()
+        if self._peek() is not None:
+            raise ValueError(f"Invalid unit string '{self._text}'")
+        return result
+
+    def _product(self) -> tuple[Fraction, dict[str, int]]:
+        scale, exponents = self._power()
+        while (token := self._peek()) is not None and token[1] in ('*', '/'):
+            self._next()
+            other_scale, other = self._power()
+            sign = 1 if token[1] == '*' else -1
+            scale *= other_scale**sign
+            exponents = _combine(exponents, other, sign)
+        return scale, exponents
+
+    def _power(self) -> tuple[Fraction, dict[str, int]]:
+        scale, exponents = self._atom()
+        if (token := self._peek()) is not None and token[1] in ('^', '**'):
+            self._next()
+            kind, value = self._next()
+            if kind == 'op' and value == '(':
+                kind, value = self._next()
+                self._expect(')')
+            if kind != 'number' or not value.lstrip('-').isdigit():
+                raise ValueError(f"Invalid exponent in unit string '{self._text}'")
+            power = int(value)
+            scale = scale**power
+            exponents = {base: exp * power for base, exp in exponents.items()}
+        return scale, exponents
+
+    def _expect(self, op: str) -> None:
+        if self._next() != ('op', op):
+            raise ValueError(f"Expected '{op}' in unit string '{self._text}'")
+
+    def _atom(self) -> tuple[Fraction, dict[str, int]]:
+        kind, value = self._next()
+        if kind == 'number':
+            return Fraction(value), {}
+        if kind == 'symbol':
+            return _lookup_symbol(value)
+        if value == '(':
+            result = self._product()
+            self._expect(')')
+            return result
+        raise ValueError(f"Invalid unit string '{self._text}'")
+
+
+def _combine(a: dict[str, int], b: dict[str, int], sign: int = 1) -> dict[str, int]:
+    result = dict(a)
+    for base, exp in b.items():
+        result[base] = result.get(base, 0) + sign * exp
+    return {base: exp for base, exp in result.items() if exp != 0}
+
 
+# Symbols whose prefixed forms are not used as names, e.g., 'kh' or 'mdeg'.
+_UNPREFIXED_NAMES = ('min', 'h', 'day', 'deg', '%', 'dimensionless')
+_names: dict[tuple[Fraction, Exponents], str] = {}
 
-@dataclass(frozen=True)
+
+def _name(scale: Fraction, exponents: Exponents) -> str:
+    """
+    Return the name of a unit in canonical form.
+
+    The name depends only on the canonical form, not on how the unit was spelled.
+    Units equal to a single, optionally prefixed, symbol use the first such symbol,
+    e.g., 'Hz' for '1/s'. Others are formatted from the canonical form.
+    """
+    if not _names:
+        for symbol, (factor, base) in _SYMBOLS.items():
+            if symbol != 'dimensionless':
+                _names.setdefault((factor, tuple(sorted(base.items()))), symbol)
+        for symbol, (factor, base) in _SYMBOLS.items():
+            if symbol not in _UNPREFIXED_NAMES:
+                for prefix, prefix_factor in _PREFIXES.items():
+                    key = (prefix_factor * factor, tuple(sorted(base.items())))
+                    _names.setdefault(key, prefix + symbol)
+    return _names.get((scale, exponents)) or _format(scale, exponents)
+
+
+def _format(scale: Fraction, exponents: Exponents) -> str:
+    terms = [] if scale == 1 else [str(float(scale))]
+    terms += [
+        base if exp == 1 else f'{base}^{exp}' for base, exp in exponents if exp > 0
+    ]
+    numerator = '*'.join(terms)
+    denominator = [
+        base if exp == -1 else f'{base}^{-exp}' for base, exp in exponents if exp < 0
+    ]
+    if not denominator:
+        return numerator
+    if len(denominator) > 1:
+        return f"{numerator or '1'}/({'*'.join(denominator)})"
+    return f"{numerator or '1'}/{denominator[0]}"
+
+
+@final
 class Unit:
-    """Very simple unit class that stores a unit as a string."""
+    """
+    Physical unit in canonical form.
+
+    Instances are interned and immutable, so the class cannot be subclassed.
+    """
+
+    __slots__ = ('_exponents', '_hash', '_scale', 'value')
+
+    _by_string: dict[str, Unit] = {}  # noqa: RUF012
+    _by_key: dict[tuple[Fraction, Exponents], Unit] = {}  # noqa: RUF012
+    _products: dict[tuple[Unit, Unit], Unit] = {}  # noqa: RUF012
+
+    _scale: Fraction
+    _exponents: Exponents
+    _hash: int
+    value: str
+
+    def __new__(cls, value: str | Unit = '') -> Unit:
+        if isinstance(value, Unit):
+            return value
+        if (unit := cls._by_string.get(value)) is not None:
+            return unit
+        scale, exponents = _Parser(value).parse()
+        unit = cls._from_canonical(scale, exponents)
+        cls._by_string[value] = unit
+        return unit
+
+    @classmethod
+    def _from_canonical(cls, scale: Fraction, exponents: dict[str, int]) -> Unit:
+        key = (scale, tuple(sorted(exponents.items())))
+        if (unit := cls._by_key.get(key)) is not None:
+            return unit
+        unit = object.__new__(cls)
+        object.__setattr__(unit, '_scale', scale)
+        object.__setattr__(unit, '_exponents', key[1])
+        object.__setattr__(unit, '_hash', hash(key))
+        object.__setattr__(unit, 'value', _name(*key))
+        cls._by_key[key] = unit
+        return unit
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("Unit is immutable")
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        return Unit._from_canonical, (self._scale, dict(self._exponents))
+
+    @property
+    def scale(self) -> Fraction:
+        """Scale factor relative to the SI base units."""
+        return self._scale
+
+    @property
+    def exponents(self) -> Exponents:
+        """Exponents of the base units, sorted by base unit."""
+        return self._exponents
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Unit):
+            return NotImplemented
+        return self._hash == other._hash and (
+            self._scale == other._scale and self._exponents == other._exponents
+        )
+
+    def __repr__(self) -> str:
+        return f"Unit('{self.value}')"
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __mul__(self, other: object) -> Unit:
+        if not isinstance(other, Unit):
+            return NotImplemented
+        # Units are interned, so products can be cached by identity.
+        if (product := Unit._products.get((self, other))) is None:
+            product = Unit._from_canonical(
+                self._scale * other._scale,
+                _combine(dict(self._exponents), dict(other._exponents)),
+            )
+            Unit._products[(self, other)] = product
+        return product
+
+    def __truediv__(self, other: object) -> Unit:
+        if not isinstance(other, Unit):
+            return NotImplemented
+        return Unit._from_canonical(
+            self._scale / other._scale,
+            _combine(dict(self._exponents), dict(other._exponents), -1),
+        )
+
+    def __pow__(self, power: object) -> Unit:
+        if not isinstance(power, int):
+            return NotImplemented
+        return Unit._from_canonical(
+            self._scale**power,
+            {base: exp * power for base, exp in self._exponents if power != 0},
+        )
+
+    def is_convertible_to(self, other: Unit) -> bool:
+        """Return True if the units differ at most by a scale factor."""
+        return self._exponents == other._exponents
 
-    value: str = ''
 
-    def __mul__(self, other: Unit) -> Unit:
-        if other.value == '':
-            return self
-        return Unit(f'({self.value})*({other.value})')
+__all__ = ['Unit']
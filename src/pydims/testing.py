@@ -1,13 +1,260 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+"""
+Assertions for testing.
+
+Values are compared in cache-sized chunks, without a full-size boolean temporary,
+and the comparison stops at the first chunk with a mismatch. Dask arrays are
+compared blockwise in parallel, and only the first mismatching block is
+gathered to report the location of the differences.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from itertools import accumulate
+from typing import Any
 
 import pydims as dms
 
+from .common import promote_values, scalar_operand
+from .formatting import _format_element
+
+Mismatch = Callable[[Any, Any], Any]
+
+# Number of elements compared per chunk.
+_CHUNK_SIZE = 1 << 16
+# Number of differences reported in error messages.
+_MAX_REPORTED = 5
+
+
+def _chunks(shape: tuple[int, ...]) -> Iterator[tuple[int, tuple[slice, ...]]]:
+    """Yield offset and key of chunks along the first axis."""
+    length = shape[0]
+    per_index = 1
+    for size in shape[1:]:
+        per_index *= size
+    rows = max(1, _CHUNK_SIZE // per_index) if per_index else length
+    for start in range(0, length, rows):
+        yield start, (slice(start, min(start + rows, length)), ...)
+
+
+def _locations(
+    xp: Any, mask: Any, offsets: tuple[int, ...]
+) -> list[tuple[int, ...]] | None:
+    """Return up to _MAX_REPORTED indices where mask is True, None if there are none."""
+    if mask.ndim == 0:
+        return [()] if bool(mask) else None
+    if not bool(xp.any(mask)):
+        return None
+    indices = xp.nonzero(mask)
+    count = min(_MAX_REPORTED, indices[0].shape[0])
+    return [
+        tuple(
+            int(index[i]) + offset
+            for index, offset in zip(indices, offsets, strict=True)
+        )
+        for i in range(count)
+    ]
+
+
+def _find_eager(a: Any, b: Any, mismatch: Mismatch) -> list[tuple[int, ...]] | None:
+    from array_api_compat import array_namespace
+
+    xp = array_namespace(a, b)
+    if a.ndim == 0:
+        return _locations(xp, mismatch(a, b), ())
+    for start, key in _chunks(a.shape):
+        offsets = (start,) + (0,) * (a.ndim - 1)
+        if (found := _locations(xp, mismatch(a[key], b[key]), offsets)) is not None:
+            return found
+    return None
+
+
+def _find_dask(a: Any, b: Any, mismatch: Mismatch) -> list[tuple[int, ...]] | None:
+    import dask
+    import numpy as np
+
+    mask = mismatch(a, b)
+    if mask.ndim == 0:
+        return _locations(np, np.asarray(mask.compute()), ())
+    # One flag per block, computed in parallel without gathering the blocks.
+    flags = mask.map_blocks(
+        lambda block: np.asarray(block.any()).reshape((1,) * block.ndim),
+        chunks=(1,) * mask.ndim,
+        dtype=bool,
+    )
+    (flags,) = dask.compute(flags)
+    bad = np.argwhere(flags)
+    if len(bad) == 0:
+        return None
+    block_index = tuple(int(i) for i in bad[0])
+    starts = [(0, *accumulate(chunks)) for chunks in mask.chunks]
+    offsets = tuple(start[i] for start, i in zip(starts, block_index, strict=True))
+    block = np.asarray(mask.blocks[block_index].compute())
+    return _locations(np, block, offsets)
+
+
+def _find_mismatches(
+    a: Any, b: Any, mismatch: Mismatch
+) -> list[tuple[int, ...]] | None:
+    from array_api_compat import is_dask_array, is_lazy_array
+
+    a, b = promote_values(a, b)
+    if is_dask_array(a):
+        return _find_dask(a, b, mismatch)
+    if is_lazy_array(a):
+        from array_api_compat import array_namespace
+
+        xp = array_namespace(a, b)
+        mask = mismatch(a, b)
+        # Locations are unknown without computing the full mask.
+        return None if not bool(xp.any(mask)) else []
+    return _find_eager(a, b, mismatch)
+
+
+def _element(values: Any, index: tuple[int, ...]) -> str:
+    from array_api_compat import is_lazy_array
+
+    value = values[index]
+    if is_lazy_array(value):
+        if not hasattr(value, 'compute'):
+            return '?'
+        value = value.compute()
+    return _format_element(value)
+
+
+def _raise_mismatch(
+    a: dms.DimensionedArray,
+    b: dms.DimensionedArray,
+    locations: list[tuple[int, ...]],
+    what: str,
+) -> None:
+    lines = [f"Values {what}, first differences:" if locations else f"Values {what}"]
+    for index in locations:
+        where = ', '.join(f'{dim}={i}' for dim, i in zip(a.dims, index, strict=True))
+        lines.append(
+            f"  [{where}]: {_element(a.values, index)} != {_element(b.values, index)}"
+        )
+    raise AssertionError('\n'.join(lines))
+
+
+def _assert_metadata(a: dms.DimensionedArray, b: dms.DimensionedArray) -> None:
+    if a.dims != b.dims:
+        raise AssertionError(f"Dims differ: {a.dims} != {b.dims}")
+    if a.shape != b.shape:
+        raise AssertionError(f"Shapes differ: {a.shape} != {b.shape}")
+    if a.unit != b.unit:
+        raise AssertionError(f"Units differ: {a.unit} != {b.unit}")
+
+
+def assert_identical(a: dms.DimensionedArray, b: dms.DimensionedArray) -> None:
+    """
+    Assert that two arrays have identical dims, shape, dtype, unit, and values.
+
+    Parameters
+    ----------
+    a:
+        Actual array.
+    b:
+        Expected array.
+
+    Raises
+    ------
+    AssertionError
+        If the arrays differ. The message reports the indices of the first
+        differences.
+    """
+    _assert_metadata(a, b)
+    if a.dtype != b.dtype:
+        raise AssertionError(f"Dtypes differ: {a.dtype} != {b.dtype}")
+    locations = _find_mismatches(a.values, b.values, lambda x, y: x != y)
+    if locations is not None:
+        _raise_mismatch(a, b, locations, 'differ')
+
+
+def _tolerance_in_unit_of(tolerance: Any, x: dms.DimensionedArray) -> float:
+    if isinstance(tolerance, dms.DimensionedArray):
+        if tolerance.ndim != 0:
+            raise ValueError("Tolerance must be a scalar")
+        if tolerance.unit != x.unit:
+            tolerance = tolerance.to(unit=x.unit, copy=False)
+        return float(tolerance.values)
+    operand = scalar_operand(tolerance)
+    if operand is None:
+        raise TypeError(f"Invalid tolerance {tolerance!r}")
+    value, unit = operand
+    if unit is None or unit == x.unit:
+        return float(value)
+    return float(value) * x.units_namespace.get_scale(src=unit, dst=x.unit)
+
+
+def assert_allclose(
+    a: dms.DimensionedArray,
+    b: dms.DimensionedArray,
+    *,
+    rtol: float = 1e-7,
+    atol: Any = 0,
+    equal_nan: bool = True,
+) -> None:
+    """
+    Assert that two arrays are equal within a tolerance.
+
+    The arrays must have the same dims, but not necessarily in the same order, and
+    convertible units. ``b`` is converted to the dim order and unit of ``a``.
+
+    Parameters
+    ----------
+    a:
+        Actual array.
+    b:
+        Expected array.
+    rtol:
+        Relative tolerance.
+    atol:
+        Absolute tolerance. A number is interpreted in the unit of ``a``. A scalar
+        with a unit, such as a 0-d array or a Pint quantity, is converted to the
+        unit of ``a``.
+    equal_nan:
+        If True, NaNs at the same position are considered equal.
+
+    Raises
+    ------
+    AssertionError
+        If the arrays are not close. The message reports the indices of the first
+        differences.
+    """
+    if set(a.dims) != set(b.dims):
+        raise AssertionError(f"Dims differ: {a.dims} != {b.dims}")
+    b = dms.permute_dims(b, a.dims)
+    if (a.unit is None) != (b.unit is None):
+        raise AssertionError(f"Units differ: {a.unit} != {b.unit}")
+    scale = 1.0
+    if a.unit != b.unit:
+        try:
+            scale = b.units_namespace.get_scale(src=b.unit, dst=a.unit)
+        except Exception as err:
+            raise AssertionError(f"Units differ: {a.unit} != {b.unit}") from err
+    _assert_metadata(a, b.__class__(values=b.values, dims=b.dims, unit=a.unit))
+    tolerance = _tolerance_in_unit_of(atol, a)
+
+    def mismatch(x: Any, y: Any) -> Any:
+        from array_api_compat import array_namespace
+
+        xp = array_namespace(x, y)
+        if xp.isdtype(x.dtype, 'bool'):
+            return x != y
+        if scale != 1:
+            y = y * scale
+        close = xp.abs(x - y) <= tolerance + rtol * xp.abs(y)
+        if equal_nan and xp.isdtype(x.dtype, ('real floating', 'complex floating')):
+            close = close | (xp.isnan(x) & xp.isnan(y))
+        return ~close
+
+    locations = _find_mismatches(a.values, b.values, mismatch)
+    if locations is not None:
+        b = b.__class__(values=b.values * scale, dims=b.dims, unit=a.unit)
+        _raise_mismatch(a, b, locations, 'not close')
+
 
-def assert_identical(a: dms.DimensionedArray, b: dms.DimensionedArray):
-    # TODO This is a quick hack for early testing
-    assert a.dims == b.dims  # noqa: S101
-    assert a.shape == b.shape  # noqa: S101
-    assert a.dtype == b.dtype  # noqa: S101
-    assert a.unit == b.unit  # noqa: S101
-    assert a.array_namespace.all(a.values == b.values)  # noqa: S101
+__all__ = ['assert_allclose', 'assert_identical']
@@ -2,7 +2,7 @@
 # Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
 from __future__ import annotations
 
-from pint import UnitRegistry
+from pint import UnitRegistry, compat
 
 
 class PintsUnitsNamespace:
@@ -16,3 +16,13 @@ class PintsUnitsNamespace:
         q_src = self._ureg.Quantity(1, src)
         q_dst = q_src.to(dst)
         return q_dst.magnitude
+
+
+def register_upcast_type() -> None:
+    """
+    Register DimensionedArray as an upcast type of Pint.
+
+    Pint quantities then return NotImplemented for DimensionedArray operands, so
+    that, e.g., ``quantity * array`` uses :py:meth:`DimensionedArray.__rmul__`.
+    """
+    compat.upcast_type_map.setdefault('pydims.dimensioned_array.DimensionedArray', None)
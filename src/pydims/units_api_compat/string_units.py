@@ -2,6 +2,21 @@
 # Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
 from __future__ import annotations
 
+import functools
+
+from pydims.dimensioned_array import UnitsError
 from pydims.string_units import Unit
 
 dimensionless = Unit()
+
+
+def get_scale(*, src: Unit, dst: Unit | str) -> float:
+    return _get_scale(src, dst)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_scale(src: Unit, dst: Unit | str) -> float:
+    dst = Unit(dst)
+    if not src.is_convertible_to(dst):
+        raise UnitsError(f"Cannot convert from unit '{src}' to '{dst}'")
+    return float(src.scale / dst.scale)
@@ -36,7 +36,21 @@ def _is_string_unit(unit: Any) -> bool:
     return issubclass(unit.__class__, Unit)
 
 
+# Namespaces by unit type. Pint creates unit classes per registry, so the type also
+# identifies the registry.
+_namespaces: dict[type, Any] = {}
+
+
 def units_namespace(unit: Any) -> Any:
+    namespace = _namespaces.get(unit.__class__)
+    if namespace is None:
+        namespace = _find_units_namespace(unit)
+        if namespace is not None:
+            _namespaces[unit.__class__] = namespace
+    return namespace
+
+
+def _find_units_namespace(unit: Any) -> Any:
     if _is_astropy_unit(unit):
         from . import astropy
 
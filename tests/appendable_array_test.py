@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims import string_units
+from pydims.testing import assert_identical
+
+make = dms.CreationFunctions(array=np, units=string_units)
+
+
+def frames(start: int, stop: int) -> dms.DimensionedArray:
+    values = np.arange(start * 2, stop * 2, dtype=float).reshape(stop - start, 2)
+    return make.asarray(dims=('time', 'x'), values=values, unit='counts')
+
+
+def test_append_grows_buffer():
+    buffer = dms.AppendableArray(frames(0, 1), dim='time')
+    for i in range(1, 10):
+        buffer.append(frames(i, i + 1))
+    assert len(buffer) == 10
+    assert buffer.capacity == 16
+    assert_identical(buffer.array, frames(0, 10))
+
+
+def test_append_multiple_frames_at_once():
+    buffer = dms.AppendableArray(frames(0, 2), dim='time', capacity=4)
+    buffer.append(frames(2, 7))
+    assert buffer.capacity == 8
+    assert_identical(buffer.array, frames(0, 7))
+
+
+def test_append_single_frame_without_append_dim():
+    buffer = dms.AppendableArray(frames(0, 1), dim='time')
+    buffer.append(frames(1, 2)[{'time': 0}])
+    assert_identical(buffer.array, frames(0, 2))
+
+
+def test_array_is_view_of_buffer():
+    buffer = dms.AppendableArray(frames(0, 2), dim='time', capacity=4)
+    view = buffer.array
+    buffer.append(frames(2, 3))
+    assert np.shares_memory(view.values, buffer.array.values)
+
+
+def test_append_raises_if_units_differ():
+    buffer = dms.AppendableArray(frames(0, 1), dim='time')
+    other = make.asarray(dims=('time', 'x'), values=[[1.0, 2.0]], unit='m')
+    with pytest.raises(ValueError, match="same unit"):
+        buffer.append(other)
+
+
+def test_append_raises_if_dims_differ():
+    buffer = dms.AppendableArray(frames(0, 1), dim='time')
+    other = make.asarray(dims=('x', 'time'), values=[[1.0], [2.0]], unit='counts')
+    with pytest.raises(ValueError, match="same dims"):
+        buffer.append(other)
+
+
+def test_append_raises_if_sizes_differ():
+    buffer = dms.AppendableArray(frames(0, 1), dim='time')
+    other = make.asarray(dims=('time', 'x'), values=[[1.0, 2.0, 3.0]], unit='counts')
+    with pytest.raises(dms.DimensionError, match="Sizes of dimension 'x'"):
+        buffer.append(other)
+
+
+def test_ring_requires_capacity():
+    with pytest.raises(ValueError, match="requires a capacity"):
+        dms.AppendableArray(frames(0, 1), dim='time', ring=True)
+
+
+def test_ring_keeps_last_frames():
+    buffer = dms.AppendableArray(frames(0, 1), dim='time', capacity=3, ring=True)
+    assert_identical(buffer.array, frames(0, 1))
+    buffer.append(frames(1, 3))
+    assert_identical(buffer.array, frames(0, 3))
+    buffer.append(frames(3, 4))
+    assert_identical(buffer.array, frames(1, 4))
+    for i in range(4, 9):
+        buffer.append(frames(i, i + 1))
+        assert_identical(buffer.array, frames(i - 2, i + 1))
+    assert len(buffer) == 3
+
+
+def test_ring_append_more_than_capacity():
+    buffer = dms.AppendableArray(frames(0, 2), dim='time', capacity=3, ring=True)
+    buffer.append(frames(2, 9))
+    assert_identical(buffer.array, frames(6, 9))
@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 
 import pydims as dms
+from pydims.string_units import Unit
 from pydims.testing import assert_identical
 
 
@@ -315,3 +316,116 @@ def test_stack():
             values=np.ones((2, 4, 3)), dims=('z', 'x', 'y'), unit=None
         ),
     )
+
+
+def test_flatten_copy_false_returns_view():
+    da = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    assert dms.shares_memory(dms.flatten(da, copy=False), da)
+
+
+def test_flatten_copy_false_raises_if_copy_is_required():
+    da = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    da = dms.permute_dims(da, ('y', 'x'))
+    with pytest.raises(ValueError, match="`flatten` with copy=False is not possible"):
+        dms.flatten(da, copy=False)
+
+
+def test_flatten_default_copy_returns_view_if_possible():
+    values = np.arange(60.0).reshape((2, 6, 5))
+    da = dms.DimensionedArray(values=values, dims=('x', 'y', 'z'), unit=None)
+    da = da[{'z': slice(0, 5, 2)}]
+    result = dms.flatten(da, dims=('x', 'y'), dim='xy')
+    assert dms.shares_memory(result, da)
+    np.testing.assert_array_equal(result.values, values[:, :, ::2].reshape(12, 3))
+    result = dms.flatten(da, dims=('y', 'z'), dim='yz')
+    assert not dms.shares_memory(result, da)
+    np.testing.assert_array_equal(result.values, values[:, :, ::2].reshape(2, 18))
+
+
+def test_flatten_copy_true_copies():
+    da = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    assert not dms.shares_memory(dms.flatten(da, copy=True), da)
+
+
+def test_fold_copy_false_returns_view_of_strided_input():
+    da = dms.DimensionedArray(values=np.ones((12, 2)), dims=('x', 'y'), unit=None)
+    da = da[{'x': slice(0, 12, 2)}]
+    result = dms.fold(da, 'x', sizes={'x1': 3, 'x2': 2}, copy=False)
+    assert result.sizes == {'x1': 3, 'x2': 2, 'y': 2}
+    assert dms.shares_memory(result, da)
+
+
+@pytest.mark.parametrize('copy', [None, False])
+def test_permute_dims_and_squeeze_return_view_unless_copy_is_true(copy):
+    da = dms.DimensionedArray(values=np.ones((2, 1)), dims=('x', 'y'), unit=None)
+    assert dms.shares_memory(dms.permute_dims(da, ('y', 'x'), copy=copy), da)
+    assert dms.shares_memory(dms.squeeze(da, copy=copy), da)
+    assert not dms.shares_memory(dms.permute_dims(da, ('y', 'x'), copy=True), da)
+    assert not dms.shares_memory(dms.squeeze(da, copy=True), da)
+
+
+def test_permute_dims_copy_true_is_contiguous_in_new_order():
+    da = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    assert dms.is_contiguous(dms.permute_dims(da, ('y', 'x'), copy=True))
+
+
+def test_expand_dims_copy_true_materializes_values():
+    da = dms.DimensionedArray(values=np.ones((2,)), dims=('x',), unit=None)
+    result = dms.expand_dims(da, sizes={'y': 3}, copy=True)
+    assert result.values.strides == (16, 8)
+
+
+def test_concat_converts_to_dims_and_unit_of_first():
+    a = dms.DimensionedArray(values=np.ones((1, 2)), dims=('x', 'y'), unit=Unit('m'))
+    b = dms.DimensionedArray(
+        values=np.arange(4.0).reshape(2, 2), dims=('y', 'x'), unit=Unit('mm')
+    )
+    result = dms.concat((a, b), dim='x')
+    assert result.dims == ('x', 'y')
+    assert result.unit == Unit('m')
+    np.testing.assert_allclose(
+        result.values, [[1.0, 1.0], [0.0, 0.002], [0.001, 0.003]]
+    )
+
+
+def test_concat_accepts_generator():
+    arrays = (
+        dms.DimensionedArray(values=np.full(2, float(i)), dims=('x',), unit=None)
+        for i in range(3)
+    )
+    result = dms.concat(arrays)
+    np.testing.assert_array_equal(result.values, [0, 0, 1, 1, 2, 2])
+
+
+def test_concat_promotes_dtype():
+    a = dms.DimensionedArray(values=np.arange(2), dims=('x',), unit=None)
+    b = dms.DimensionedArray(values=np.ones(1), dims=('x',), unit=None)
+    result = dms.concat((a, b))
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(result.values, [0.0, 1.0, 1.0])
+
+
+def test_concat_raises_if_units_not_convertible():
+    a = dms.DimensionedArray(values=np.ones(2), dims=('x',), unit=Unit('m'))
+    b = dms.DimensionedArray(values=np.ones(2), dims=('x',), unit=Unit('s'))
+    with pytest.raises(dms.UnitsError):
+        dms.concat((a, b))
+
+
+def test_concat_raises_if_dims_differ():
+    a = dms.DimensionedArray(values=np.ones((2, 2)), dims=('x', 'y'), unit=None)
+    b = dms.DimensionedArray(values=np.ones((2, 2)), dims=('x', 'z'), unit=None)
+    with pytest.raises(ValueError, match="same dims"):
+        dms.concat((a, b), dim='x')
+
+
+def test_stack_converts_to_dims_and_unit_of_first():
+    a = dms.DimensionedArray(values=np.zeros((2, 3)), dims=('x', 'y'), unit=Unit('km'))
+    b = dms.DimensionedArray(
+        values=np.arange(6.0).reshape(3, 2), dims=('y', 'x'), unit=Unit('m')
+    )
+    result = dms.stack(iter([a, b]), dim='z', axis=1)
+    assert result.dims == ('x', 'z', 'y')
+    assert result.unit == Unit('km')
+    np.testing.assert_allclose(result.values[:, 1, :], b.values.T / 1000)
+    np.testing.assert_array_equal(result.values[:, 0, :], 0.0)
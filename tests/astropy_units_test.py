@@ -34,3 +34,19 @@ def test_units_namespace_detects_astropy():
     units_api = units_namespace(units.Unit(''))
     assert units_api is not None
     assert units_api.Unit('m') == units.meter
+
+
+def test_reflected_mul_by_quantity():
+    x = make.linspace('x', 0, 2, 3, unit='m')
+    result = (2 * units.s) * x
+    assert isinstance(result, dms.DimensionedArray)
+    assert result.unit == units.s * units.m
+    assert array.all(result.values == array.asarray([0.0, 2.0, 4.0]))
+
+
+def test_reflected_add_quantity_with_same_unit():
+    x = make.linspace('x', 0, 2, 3, unit='m')
+    result = (1 * units.m) + x
+    assert isinstance(result, dms.DimensionedArray)
+    assert result.unit == units.m
+    assert array.all(result.values == array.asarray([1.0, 2.0, 3.0]))
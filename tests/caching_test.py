@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import dask.array as da
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims import string_units
+from pydims.caching import fingerprint, memoize
+from pydims.testing import assert_identical
+
+make = dms.CreationFunctions(array=np, units=string_units)
+
+
+def _array(values, unit='m', dims=('x',)):
+    return make.asarray(dims=dims, values=values, unit=unit)
+
+
+def test_fingerprint_is_equal_for_equal_arrays():
+    values = np.arange(10.0)
+    assert fingerprint(_array(values)) == fingerprint(_array(values.copy()))
+
+
+@pytest.mark.parametrize(
+    'other',
+    [
+        _array(np.arange(10.0), unit='s'),
+        _array(np.arange(10.0), dims=('y',)),
+        _array(np.arange(10)),
+        _array(np.arange(10.0) + 1),
+        _array(np.arange(10.0).reshape(2, 5), dims=('x', 'y')),
+    ],
+)
+def test_fingerprint_depends_on_metadata_and_values(other):
+    assert fingerprint(_array(np.arange(10.0))) != fingerprint(other)
+
+
+def test_fingerprint_depends_on_indexes():
+    x = _array(np.arange(10.0))
+    a = x.assign_indexes({'x': _array(np.arange(10.0))})
+    b = x.assign_indexes({'x': _array(np.arange(10.0) * 2)})
+    assert len({fingerprint(x), fingerprint(a), fingerprint(b)}) == 3
+    assert fingerprint(a) == fingerprint(
+        x.assign_indexes({'x': _array(np.arange(10.0))})
+    )
+
+
+def test_fingerprint_of_large_array_hashes_all_blocks(monkeypatch):
+    monkeypatch.setattr('pydims.caching._BLOCK_SIZE', 1024)
+    values = np.zeros(10_000)
+    other = values.copy()
+    other[-1] = 1.0
+    assert fingerprint(_array(values)) == fingerprint(_array(values.copy()))
+    assert fingerprint(_array(values)) != fingerprint(_array(other))
+
+
+def test_fingerprint_of_non_contiguous_array():
+    values = np.arange(20.0).reshape(4, 5)
+    a = _array(values.T, dims=('y', 'x'))
+    b = _array(np.ascontiguousarray(values.T), dims=('y', 'x'))
+    assert fingerprint(a) == fingerprint(b)
+
+
+def test_fingerprint_of_empty_array():
+    a = _array(np.zeros((0, 3)), dims=('x', 'y'))
+    assert fingerprint(a) != fingerprint(_array(np.zeros((3, 0)), dims=('x', 'y')))
+
+
+def test_fingerprint_of_dask_array_does_not_compute():
+    values = da.arange(10.0, chunks=3)
+    assert fingerprint(_array(values)) == fingerprint(_array(values))
+    assert fingerprint(_array(values)) != fingerprint(_array(values + 1))
+
+
+def test_memoize_returns_cached_result():
+    calls = []
+
+    @memoize(maxsize=2)
+    def double(x, factor=2):
+        calls.append(1)
+        return x * factor
+
+    x = _array(np.arange(4.0))
+    assert_identical(double(x), x * 2)
+    assert_identical(double(_array(np.arange(4.0))), x * 2)
+    assert len(calls) == 1
+    double(x, factor=3)
+    assert len(calls) == 2
+    info = double.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_memoize_misses_for_different_indexes():
+    @memoize(maxsize=2)
+    def nearest(x, label):
+        return dms.sel(x, {'x': label}, method='nearest')
+
+    x = _array(np.arange(4.0))
+    label = _array(2.2, dims=())
+    a = x.assign_indexes({'x': _array(np.arange(4.0))})
+    b = x.assign_indexes({'x': _array(np.arange(4.0) * 2)})
+    assert nearest(a, label).values == 2.0
+    assert nearest(b, label).values == 1.0
+    assert nearest.cache_info().misses == 2
+
+
+def test_memoize_evicts_least_recently_used():
+    calls = []
+
+    @memoize(maxsize=1)
+    def identity(x):
+        calls.append(1)
+        return x
+
+    a = _array(np.arange(2.0))
+    b = _array(np.arange(3.0))
+    identity(a)
+    identity(b)
+    identity(a)
+    assert len(calls) == 3
+
+
+def test_memoize_spills_to_disk(tmp_path):
+    calls = []
+
+    @memoize(maxsize=1, directory=tmp_path)
+    def square(x):
+        calls.append(1)
+        return x * x
+
+    a = _array(np.arange(3.0))
+    b = _array(np.arange(4.0))
+    expected = square(a)
+    square(b)
+    assert len(list(tmp_path.glob('*.pkl'))) == 1
+    assert_identical(square(a), expected)
+    assert len(calls) == 2
+    assert square.cache_info().disk_hits == 1
+    square.cache_clear()
+    assert square.cache_info().disk_bytes == 0
+
+
+def test_memoize_limits_disk_size(tmp_path):
+    @memoize(maxsize=1, directory=tmp_path, max_disk_bytes=2000)
+    def copy(x):
+        return x * 1.0
+
+    for n in range(5):
+        copy(_array(np.arange(100.0) + n))
+    assert 0 < copy.cache_info().disk_bytes <= 2000
+
+
+def test_memoize_rejects_unsupported_arguments():
+    @memoize
+    def func(x):
+        return x
+
+    with pytest.raises(TypeError, match='Cannot memoize'):
+        func(object())
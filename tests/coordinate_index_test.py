@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims import string_units
+
+make = dms.CreationFunctions(array=np, units=string_units)
+
+
+def test_init_raises_if_coord_is_not_1d():
+    coord = make.zeros(dims=('x', 'y'), shape=(2, 2), unit='m')
+    with pytest.raises(dms.DimensionError, match="must be 1-D"):
+        dms.CoordinateIndex(coord)
+
+
+def test_is_sorted():
+    assert dms.CoordinateIndex(make.asarray(('x',), [1.0, 2.0, 2.0, 3.0])).is_sorted
+    assert not dms.CoordinateIndex(make.asarray(('x',), [1.0, 3.0, 2.0])).is_sorted
+
+
+def test_step_of_uniform_coord():
+    index = dms.CoordinateIndex(make.linspace('x', 0.0, 1.0, 11, unit='m'))
+    assert index.step == pytest.approx(0.1)
+
+
+def test_step_is_none_for_non_uniform_coord():
+    index = dms.CoordinateIndex(make.asarray(('x',), [1.0, 2.0, 4.0], unit='m'))
+    assert index.step is None
+
+
+@pytest.mark.parametrize(
+    'values',
+    [[0.0, 1.0, 2.0, 3.0], [0.0, 1.0, 2.5, 3.0], [3.0, 0.0, 2.0, 1.0]],
+    ids=['uniform', 'sorted', 'unsorted'],
+)
+def test_position_exact(values: list[float]):
+    index = dms.CoordinateIndex(make.asarray(('x',), values, unit='m'))
+    for pos, value in enumerate(values):
+        assert index.position(make.asarray((), value, unit='m')) == pos
+
+
+@pytest.mark.parametrize(
+    'values',
+    [[0.0, 1.0, 2.0, 3.0], [0.0, 1.0, 2.5, 3.0], [3.0, 0.0, 2.5, 1.0]],
+    ids=['uniform', 'sorted', 'unsorted'],
+)
+def test_position_raises_if_label_not_found(values: list[float]):
+    index = dms.CoordinateIndex(make.asarray(('x',), values, unit='m'))
+    with pytest.raises(KeyError, match="not found in index of dimension 'x'"):
+        index.position(make.asarray((), 1.5, unit='m'))
+
+
+@pytest.mark.parametrize(
+    ('values', 'expected'),
+    [
+        ([0.0, 1.0, 2.0, 3.0], 1),
+        ([0.0, 1.2, 2.5, 3.0], 1),
+        ([3.0, 0.0, 1.2, 2.5], 2),
+    ],
+    ids=['uniform', 'sorted', 'unsorted'],
+)
+def test_position_nearest(values: list[float], expected: int):
+    index = dms.CoordinateIndex(make.asarray(('x',), values, unit='m'))
+    assert index.position(make.asarray((), 1.4, unit='m'), method='nearest') == expected
+
+
+def test_position_nearest_clamps_to_range():
+    index = dms.CoordinateIndex(make.asarray(('x',), [0.0, 1.0, 2.5], unit='m'))
+    assert index.position(make.asarray((), -5.0, unit='m'), method='nearest') == 0
+    assert index.position(make.asarray((), 5.0, unit='m'), method='nearest') == 2
+
+
+def test_position_raises_if_label_has_no_unit_but_index_has():
+    index = dms.CoordinateIndex(make.asarray(('x',), [0.0, 1.0], unit='m'))
+    with pytest.raises(dms.UnitsError):
+        index.position(1.0)
+
+
+def test_position_accepts_plain_number_if_index_has_no_unit():
+    index = dms.CoordinateIndex(make.asarray(('x',), [0, 10, 20], unit=None))
+    assert index.position(10) == 1
+
+
+def test_slice_is_half_open():
+    index = dms.CoordinateIndex(make.asarray(('x',), [0.0, 1.0, 2.5, 3.0], unit='m'))
+    start = make.asarray((), 1.0, unit='m')
+    stop = make.asarray((), 3.0, unit='m')
+    assert index.slice(start, stop) == slice(1, 3)
+    assert index.slice(None, stop) == slice(None, 3)
+    assert index.slice(start, None) == slice(1, None)
+
+
+@pytest.mark.parametrize('values', [[0, 1, 2, 3, 5], [0, 1, 2, 3, 4], [5, 0, 1, 3, 2]])
+def test_fractional_label_on_integer_coord_is_not_truncated(values: list[int]):
+    index = dms.CoordinateIndex(make.asarray(('x',), np.array(values), unit='m'))
+    label = make.asarray((), 1.7, unit='m')
+    with pytest.raises(KeyError, match='not found'):
+        index.position(label)
+    assert index.position(label, method='nearest') == values.index(2)
+    assert index.position(make.asarray((), 2.0, unit='m')) == values.index(2)
+
+
+def test_slice_with_fractional_labels_on_integer_coord():
+    index = dms.CoordinateIndex(
+        make.asarray(('x',), np.array([0, 1, 2, 3, 5]), unit='m')
+    )
+    start = make.asarray((), 0.5, unit='m')
+    stop = make.asarray((), 2.5, unit='m')
+    assert index.slice(start, stop) == slice(1, 3)
+    assert index.slice(make.asarray((), -1e30, unit='m'), None) == slice(0, None)
+    assert index.slice(None, make.asarray((), np.inf, unit='m')) == slice(None, 5)
+
+
+def test_slice_raises_if_not_sorted():
+    index = dms.CoordinateIndex(make.asarray(('x',), [1.0, 0.0], unit='m'))
+    with pytest.raises(ValueError, match="requires a sorted index"):
+        index.slice(make.asarray((), 0.5, unit='m'))
+
+
+def test_positions():
+    index = dms.CoordinateIndex(make.asarray(('x',), [0.0, 1.0, 2.5, 3.0], unit='m'))
+    labels = make.asarray(('x',), [3.0, 0.0, 1.0], unit='m')
+    assert list(index.positions(labels).values) == [3, 0, 1]
+    labels = make.asarray(('x',), [2.9, -1.0, 1.2], unit='m')
+    assert list(index.positions(labels, method='nearest').values) == [3, 0, 1]
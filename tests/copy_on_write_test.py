@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims import string_units
+from pydims.testing import assert_identical
+
+make = dms.CreationFunctions(array=np, units=string_units)
+
+
+@pytest.fixture()
+def _cow():
+    previous = dms.set_copy_on_write(True)
+    yield
+    dms.set_copy_on_write(previous)
+
+
+def _array():
+    return make.asarray(dims=('x',), values=np.arange(4.0), unit='m')
+
+
+@pytest.mark.usefixtures('_cow')
+def test_set_copy_on_write_returns_previous_setting():
+    assert dms.set_copy_on_write(False) is True
+    assert dms.set_copy_on_write(True) is False
+
+
+@pytest.mark.usefixtures('_cow')
+def test_values_are_read_only():
+    x = _array()
+    with pytest.raises(ValueError, match='read-only'):
+        x.values[0] = 1.0
+
+
+@pytest.mark.usefixtures('_cow')
+def test_astype_shares_until_write():
+    x = _array()
+    y = x.astype(x.dtype)
+    assert dms.shares_memory(x, y)
+    y[{'x': 0}] = make.asarray(dims=(), values=np.float64(10.0), unit='m')
+    assert not dms.shares_memory(x, y)
+    assert x.values[0] == 0.0
+    assert y.values[0] == 10.0
+
+
+@pytest.mark.usefixtures('_cow')
+def test_write_to_original_copies_if_shared():
+    x = _array()
+    y = x.to(unit='m')
+    original = x.values
+    x[{'x': 1}] = make.asarray(dims=(), values=np.float64(-1.0), unit='m')
+    assert y.values[1] == 1.0
+    assert x.values[1] == -1.0
+    assert original[1] == 1.0
+
+
+@pytest.mark.usefixtures('_cow')
+def test_write_after_sharing_array_died_does_not_copy():
+    x = _array()
+    y = x.astype(x.dtype)
+    del y
+    base = x._values
+    x[{'x': 0}] = make.asarray(dims=(), values=np.float64(5.0), unit='m')
+    assert x._values is base
+
+
+@pytest.mark.usefixtures('_cow')
+def test_getitem_result_is_copied_on_write():
+    x = _array()
+    y = x[{'x': slice(0, 2)}]
+    y[{'x': 0}] = make.asarray(dims=(), values=np.float64(7.0), unit='m')
+    assert x.values[0] == 0.0
+    assert_identical(
+        y, make.asarray(dims=('x',), values=np.array([7.0, 1.0]), unit='m')
+    )
+
+
+@pytest.mark.usefixtures('_cow')
+def test_derived_view_is_copied_on_write():
+    x = make.asarray(dims=('x', 'y'), values=np.ones((2, 3)), unit='m')
+    y = dms.permute_dims(x, ('y', 'x'))
+    y[{'x': 0}] = make.asarray(dims=('y',), values=np.zeros(3), unit='m')
+    assert float(np.sum(x.values)) == 6.0
+
+
+@pytest.mark.usefixtures('_cow')
+@pytest.mark.parametrize(
+    'derive',
+    [
+        lambda x: dms.permute_dims(x, ('y', 'x')),
+        lambda x: dms.squeeze(x[{'x': slice(0, 1)}]),
+        lambda x: dms.expand_dims(x, {'z': 2}),
+        lambda x: dms.flatten(x, dim='xy'),
+        lambda x: dms.fold(x, 'y', sizes={'y1': 3, 'y2': 1}),
+    ],
+    ids=['permute_dims', 'squeeze', 'expand_dims', 'flatten', 'fold'],
+)
+def test_derived_view_is_not_modified_by_write_to_source(derive):
+    x = make.asarray(dims=('x', 'y'), values=np.ones((2, 3)), unit='m')
+    y = derive(x)
+    expected = float(np.sum(y.values))
+    x[{'x': 0}] = make.asarray(dims=('y',), values=np.zeros(3), unit='m')
+    assert float(np.sum(y.values)) == expected
+    assert float(np.sum(x.values)) == 3.0
+
+
+@pytest.mark.usefixtures('_cow')
+def test_derived_copy_is_not_tracked():
+    x = make.asarray(dims=('x', 'y'), values=np.ones((2, 3)), unit='m')
+    y = dms.permute_dims(x, ('y', 'x'), copy=True)
+    base = x._values
+    x[{'x': 0}] = make.asarray(dims=('y',), values=np.zeros(3), unit='m')
+    assert x._values is base
+    assert float(np.sum(y.values)) == 6.0
+
+
+def test_without_copy_on_write_astype_copies():
+    x = _array()
+    y = x.astype(x.dtype)
+    assert not dms.shares_memory(x, y)
+    x.values[0] = 3.0
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
 import numpy as np
+import pytest
 
 import pydims as dms
 from pydims import string_units
@@ -35,3 +36,62 @@ def test_default_unit_depends_on_dtype():
     make = dms.CreationFunctions(np, units=string_units)
     assert make.zeros(dims=('x',), shape=(2,)).unit == StringUnit()
     assert make.zeros(dims=('x',), shape=(2,), dtype=bool).unit is None
+
+
+@pytest.mark.parametrize('name', ['uniform', 'normal', 'poisson'])
+def test_random_is_reproducible_for_any_number_of_workers(name):
+    make = dms.CreationFunctions(np, units=string_units)
+    create = getattr(make.random, name)
+    a = create(dims=('x', 'y'), shape=(1000, 200), seed=42, workers=1)
+    b = create(dims=('x', 'y'), shape=(1000, 200), seed=42, workers=4)
+    assert_identical(a, b)
+    c = create(dims=('x', 'y'), shape=(1000, 200), seed=43)
+    assert not np.array_equal(a.values, c.values)
+
+
+def test_random_uniform_range_and_unit():
+    make = dms.CreationFunctions(np, units=string_units)
+    x = make.random.uniform(
+        dims=('x',), shape=(10_000,), low=2.0, high=3.0, unit='m', seed=0
+    )
+    assert x.dims == ('x',)
+    assert x.unit == StringUnit('m')
+    assert x.dtype == np.float64
+    assert np.min(x.values) >= 2.0
+    assert np.max(x.values) < 3.0
+
+
+def test_random_normal_dtype_and_statistics():
+    make = dms.CreationFunctions(np, units=string_units)
+    x = make.random.normal(
+        dims=('x',), shape=(100_000,), loc=5.0, scale=2.0, dtype=np.float32, seed=1
+    )
+    assert x.dtype == np.float32
+    assert x.unit == StringUnit()
+    assert abs(float(np.mean(x.values)) - 5.0) < 0.05
+    assert abs(float(np.std(x.values)) - 2.0) < 0.05
+
+
+def test_random_poisson_is_integer():
+    make = dms.CreationFunctions(np, units=string_units)
+    x = make.random.poisson(dims=('x',), shape=(1000,), lam=3.0, unit='counts', seed=2)
+    assert x.dtype == np.int64
+    assert x.unit == StringUnit('counts')
+
+
+def test_random_0d():
+    make = dms.CreationFunctions(np, units=string_units)
+    x = make.random.uniform(dims=(), shape=(), seed=3)
+    assert x.shape == ()
+
+
+def test_random_dask_is_lazy_and_matches_numpy():
+    import dask.array as da
+
+    make_np = dms.CreationFunctions(np, units=string_units)
+    make_da = dms.CreationFunctions(da, units=string_units)
+    x = make_da.random.normal(dims=('x', 'y'), shape=(1000, 300), seed=7)
+    assert isinstance(x.values, da.Array)
+    assert x.values.numblocks[0] > 1
+    expected = make_np.random.normal(dims=('x', 'y'), shape=(1000, 300), seed=7)
+    np.testing.assert_array_equal(x.values.compute(), expected.values)
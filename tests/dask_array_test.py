@@ -44,3 +44,46 @@ def test_can_create_chunked_using_CreationFunctions():
     make = dms.CreationFunctions(da, None)
     x = make.linspace('x', 0, 1, 4, unit=None, chunks=(2,))
     assert x.values.chunks == ((2, 2),)
+
+
+def test_concat_and_stack_transposed_dask_arrays():
+    a = dms.DimensionedArray(
+        values=da.ones((2, 3), chunks=1), dims=('x', 'y'), unit=None
+    )
+    b = dms.DimensionedArray(
+        values=da.zeros((3, 2), chunks=1), dims=('y', 'x'), unit=None
+    )
+    concatenated = dms.concat((a, b), dim='x')
+    stacked = dms.stack((a, b), dim='z')
+    assert concatenated.dims == ('x', 'y')
+    assert stacked.dims == ('z', 'x', 'y')
+    assert not isinstance(concatenated.values, np.ndarray)
+    np.testing.assert_array_equal(
+        compute(concatenated.values),
+        np.concatenate([np.ones((2, 3)), np.zeros((2, 3))]),
+    )
+    np.testing.assert_array_equal(
+        compute(stacked.values), np.stack([np.ones((2, 3)), np.zeros((2, 3))])
+    )
+
+
+def test_numpy_and_dask_operands_stay_lazy_with_aligned_chunks():
+    lazy = dms.DimensionedArray(
+        values=da.ones((6, 4), chunks=(2, 2)), dims=('x', 'y'), unit=None
+    )
+    table = dms.DimensionedArray(values=np.arange(4.0), dims=('y',), unit=None)
+    for result in (lazy * table, table * lazy, table + lazy):
+        assert isinstance(result.values, da.Array)
+        chunks = dict(zip(result.dims, result.values.chunks, strict=True))
+        assert chunks == {'x': (2, 2, 2), 'y': (2, 2)}
+    expected = np.ones((6, 4)) * np.arange(4.0)
+    np.testing.assert_array_equal(compute((lazy * table).values), expected)
+    np.testing.assert_array_equal(compute((table * lazy).values), expected.T)
+
+
+def test_numpy_0d_and_dask_0d_operands_stay_lazy():
+    lazy = dms.sum(dms.DimensionedArray(values=da.ones(4), dims=('x',), unit=None))
+    eager = dms.sum(dms.DimensionedArray(values=np.ones(4), dims=('x',), unit=None))
+    result = eager + lazy
+    assert isinstance(result.values, da.Array)
+    assert compute(result.values) == 8.0
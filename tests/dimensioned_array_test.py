@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import math
+
 import array_api_strict as array
+import numpy as np
 import pytest
 
 import pydims as dms
@@ -266,3 +269,278 @@ def test_elemwise_binary_raises_if_dim_of_size_1_would_need_broadcasting():
         dms.common.elemwise_binary(
             x, y, values_op=lambda a, b: a + b, unit_op=lambda a, b: a
         )
+
+
+def test_assign_indexes_raises_if_size_does_not_match():
+    da = dms.DimensionedArray(values=array.ones((2, 3)), dims=('x', 'y'), unit=None)
+    coord = dms.DimensionedArray(values=array.arange(3.0), dims=('x',), unit=None)
+    with pytest.raises(dms.DimensionError, match="has length 3"):
+        da.assign_indexes({'x': coord})
+
+
+def test_getitem_slices_indexes_and_drops_index_of_removed_dim():
+    da = dms.DimensionedArray(values=array.ones((2, 3)), dims=('x', 'y'), unit=None)
+    da = da.assign_indexes(
+        {
+            'x': dms.DimensionedArray(values=array.arange(2.0), dims=('x',), unit=None),
+            'y': dms.DimensionedArray(values=array.arange(3.0), dims=('y',), unit=None),
+        }
+    )
+    result = da[{'x': 0, 'y': slice(1, 3)}]
+    assert set(result.indexes) == {'y'}
+    assert_identical(
+        result.indexes['y'].coord,
+        dms.DimensionedArray(values=array.arange(1.0, 3.0), dims=('y',), unit=None),
+    )
+
+
+def test_astype_copy_false_raises_if_dtype_differs():
+    da = dms.DimensionedArray(values=array.ones((2,)), dims=('x',), unit=None)
+    with pytest.raises(ValueError, match="`astype` with copy=False is not possible"):
+        da.astype(array.float32, copy=False)
+
+
+@pytest.mark.parametrize('copy', [None, False])
+def test_astype_does_not_copy_if_dtype_is_unchanged(copy: bool | None):
+    da = dms.DimensionedArray(values=array.ones((2,)), dims=('x',), unit=None)
+    assert da.astype(array.float64, copy=copy).values is da.values
+
+
+def test_to_unit_preserves_integer_dtype_for_exact_integer_scale():
+    da = dms.DimensionedArray(
+        values=array.asarray([1, 2], dtype=array.int32), dims=('x',), unit=Unit('m')
+    )
+    result = da.to(unit='mm')
+    assert result.dtype == array.int32
+    assert result.unit == Unit('mm')
+    assert array.all(result.values == array.asarray([1000, 2000], dtype=array.int32))
+
+
+def test_to_unit_preserves_integer_dtype_for_exact_rational_scale():
+    da = dms.DimensionedArray(
+        values=array.asarray([1_700_000_000_123_456_000, 3000], dtype=array.int64),
+        dims=('x',),
+        unit=Unit('ns'),
+    )
+    result = da.to(unit='us')
+    assert result.dtype == array.int64
+    expected = array.asarray([1_700_000_000_123_456, 3], dtype=array.int64)
+    assert array.all(result.values == expected)
+
+
+def test_to_unit_raises_if_integer_conversion_is_lossy():
+    da = dms.DimensionedArray(
+        values=array.asarray([1000, 1500], dtype=array.int64),
+        dims=('x',),
+        unit=Unit('ns'),
+    )
+    with pytest.raises(dms.UnitsError, match="lose precision"):
+        da.to(unit='us')
+
+
+def test_to_unit_raises_if_integer_conversion_overflows():
+    da = dms.DimensionedArray(
+        values=array.asarray([3_000_000], dtype=array.int32),
+        dims=('x',),
+        unit=Unit('km'),
+    )
+    with pytest.raises(dms.UnitsError, match="overflow"):
+        da.to(unit='mm')
+
+
+def test_to_unit_raises_if_integer_scale_is_not_rational():
+    da = dms.DimensionedArray(
+        values=array.asarray([1, 2], dtype=array.int64), dims=('x',), unit=Unit('deg')
+    )
+    with pytest.raises(dms.UnitsError):
+        da.to(unit='rad')
+    result = da.to(dtype=array.float64, unit='rad')
+    assert result.dtype == array.float64
+
+
+def test_to_unit_with_dtype_does_not_modify_input():
+    values = array.asarray([1, 2], dtype=array.int32)
+    da = dms.DimensionedArray(values=values, dims=('x',), unit=Unit('m'))
+    result = da.to(dtype=array.int64, unit='mm')
+    assert result.dtype == array.int64
+    assert array.all(result.values == array.asarray([1000, 2000], dtype=array.int64))
+    assert array.all(da.values == array.asarray([1, 2], dtype=array.int32))
+
+
+@pytest.mark.parametrize(
+    ('src', 'dst'),
+    [
+        (array.float64, array.float32),
+        (array.float32, array.float64),
+        (array.int64, array.float32),
+        (array.float64, array.int64),
+    ],
+)
+@pytest.mark.parametrize('shape', [(), (3,), (300, 200)])
+def test_to_dtype_and_unit_matches_separate_conversions(src, dst, shape):
+    size = math.prod(shape)
+    values = array.reshape(array.astype(array.arange(size) % 7, src), shape)
+    dims = ('x', 'y')[: len(shape)]
+    da = dms.DimensionedArray(values=values, dims=dims, unit=Unit('m'))
+    result = da.to(dtype=dst, unit='mm')
+    assert result.dtype == dst
+    assert result.unit == Unit('mm')
+    assert result.dims == dims
+    if src == array.float64:
+        expected = da.to(unit='mm').astype(dst)
+    else:
+        expected = da.astype(dst).to(unit='mm')
+    assert array.all(result.values == expected.values)
+
+
+def test_to_dtype_and_unit_converts_large_transposed_values():
+    values = array.reshape(
+        array.astype(array.arange(300 * 200), array.float64), (300, 200)
+    )
+    da = dms.DimensionedArray(values=values.T, dims=('y', 'x'), unit=Unit('km'))
+    result = da.to(dtype=array.float32, unit='m')
+    assert array.all(result.values == array.astype(values.T * 1000.0, array.float32))
+
+
+def test_setitem_converts_convertible_units():
+    da = dms.DimensionedArray(
+        values=array.zeros((2, 3)), dims=('x', 'y'), unit=Unit('m')
+    )
+    da[{'x': 1}] = dms.DimensionedArray(
+        values=array.asarray([1.0, 2.0, 3.0]), dims=('y',), unit=Unit('km')
+    )
+    expected = array.asarray([[0.0, 0.0, 0.0], [1000.0, 2000.0, 3000.0]])
+    assert array.all(da.values == expected)
+    assert da.unit == Unit('m')
+
+
+def test_setitem_converts_units_of_transposed_values():
+    da = dms.DimensionedArray(
+        values=array.zeros((2, 3)), dims=('x', 'y'), unit=Unit('mm')
+    )
+    da[...] = dms.DimensionedArray(
+        values=array.reshape(array.arange(6, dtype=array.float64), (3, 2)),
+        dims=('y', 'x'),
+        unit=Unit('m'),
+    )
+    expected = array.asarray([[0.0, 2000.0, 4000.0], [1000.0, 3000.0, 5000.0]])
+    assert array.all(da.values == expected)
+
+
+def test_setitem_scalar_fill_converts_units():
+    da = dms.DimensionedArray(
+        values=array.zeros((2, 3)), dims=('x', 'y'), unit=Unit('m')
+    )
+    da[{'y': slice(1, 3)}] = dms.DimensionedArray(
+        values=array.asarray(2.0), dims=(), unit=Unit('cm')
+    )
+    expected = array.asarray([[0.0, 0.02, 0.02], [0.0, 0.02, 0.02]])
+    assert array.all(da.values == expected)
+
+
+def test_setitem_integer_target_converts_exactly_or_raises():
+    da = dms.DimensionedArray(
+        values=array.zeros((2,), dtype=array.int64), dims=('x',), unit=Unit('us')
+    )
+    ns = Unit('ns')
+    da[...] = dms.DimensionedArray(
+        values=array.asarray([3000, 5000]), dims=('x',), unit=ns
+    )
+    assert array.all(da.values == array.asarray([3, 5]))
+    with pytest.raises(dms.UnitsError, match="lose precision"):
+        da[...] = dms.DimensionedArray(
+            values=array.asarray([3001, 5000]), dims=('x',), unit=ns
+        )
+
+
+def test_setitem_casts_to_dtype_of_target():
+    da = dms.DimensionedArray(
+        values=array.zeros((2,), dtype=array.float32), dims=('x',), unit=None
+    )
+    da[...] = dms.DimensionedArray(values=array.asarray([1, 2]), dims=('x',), unit=None)
+    assert da.dtype == array.float32
+    assert array.all(da.values == array.asarray([1.0, 2.0], dtype=array.float32))
+
+
+@pytest.mark.parametrize('x', [slice(None), slice(None, None, -2), 3])
+def test_setitem_casts_and_scales_in_chunks(monkeypatch, x):
+    monkeypatch.setattr('pydims.dimensioned_array._CHUNK_SIZE', 4)
+    values = np.zeros((7, 5), dtype=np.float32)
+    da = dms.DimensionedArray(values=values.copy(), dims=('x', 'y'), unit=Unit('m'))
+    source = np.arange(35, dtype=np.int64).reshape(5, 7)[:, x]
+    da[{'x': x}] = dms.DimensionedArray(
+        values=source, dims=('y', 'x')[: source.ndim], unit=Unit('km')
+    )
+    values[x, :] = source.T * 1000
+    np.testing.assert_array_equal(da.values, values)
+
+
+def test_setitem_slice_checks_sizes_of_selected_region():
+    da = dms.DimensionedArray(values=array.zeros((4, 2)), dims=('x', 'y'), unit=None)
+    da[{'x': slice(1, 3)}] = dms.DimensionedArray(
+        values=array.ones((2, 2)), dims=('x', 'y'), unit=None
+    )
+    assert array.all(da.values[1:3, :] == 1.0)
+    with pytest.raises(dms.DimensionError, match="'x' do not match: 2 != 4"):
+        da[{'x': slice(1, 3)}] = dms.DimensionedArray(
+            values=array.ones((4, 2)), dims=('x', 'y'), unit=None
+        )
+
+
+def test_mul_by_python_scalar_keeps_unit():
+    da = dms.DimensionedArray(
+        values=array.asarray([1.0, 2.0], dtype=array.float32),
+        dims=('x',),
+        unit=Unit('m'),
+    )
+    for result in (da * 2, 2 * da):
+        assert result.unit == Unit('m')
+        assert result.dtype == array.float32
+        assert array.all(
+            result.values == array.asarray([2.0, 4.0], dtype=array.float32)
+        )
+
+
+def test_add_python_scalar_requires_dimensionless():
+    dimensionless = dms.DimensionedArray(
+        values=array.asarray([1.0, 2.0]), dims=('x',), unit=Unit()
+    )
+    assert array.all((1 + dimensionless).values == array.asarray([2.0, 3.0]))
+    no_unit = dms.DimensionedArray(
+        values=array.asarray([1.0, 2.0]), dims=('x',), unit=None
+    )
+    assert (no_unit + 1).unit is None
+    meter = dms.DimensionedArray(
+        values=array.asarray([1.0, 2.0]), dims=('x',), unit=Unit('m')
+    )
+    with pytest.raises(ValueError, match="Units must be identical"):
+        meter + 1
+
+
+def test_binary_op_with_unsupported_operand_raises_type_error():
+    da = dms.DimensionedArray(values=array.asarray([1.0]), dims=('x',), unit=None)
+    with pytest.raises(TypeError):
+        da + 'abc'
+
+
+def test_binary_op_converts_numpy_operand_to_other_namespace():
+    import numpy as np
+
+    strict = dms.DimensionedArray(values=array.ones((2, 3)), dims=('x', 'y'), unit=None)
+    table = dms.DimensionedArray(values=np.arange(3.0), dims=('y',), unit=None)
+    result = table * strict
+    assert not isinstance(result.values, np.ndarray)
+    assert result.dims == ('y', 'x')
+    assert array.all(
+        result.values == array.asarray([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]])
+    )
+
+
+def test_reflected_mul_by_numpy_scalar_returns_dimensioned_array():
+    da = dms.DimensionedArray(
+        values=np.asarray([1.0, 2.0]), dims=('x',), unit=Unit('m')
+    )
+    result = np.float64(2.0) * da
+    assert isinstance(result, dms.DimensionedArray)
+    assert result.unit == Unit('m')
+    np.testing.assert_array_equal(result.values, [2.0, 4.0])
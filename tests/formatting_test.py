@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import array_api_strict
+import dask
+import dask.array as da
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims.string_units import Unit
+
+
+def _forbid_compute(*args, **kwargs):
+    raise AssertionError("repr must not compute lazy arrays")
+
+
+@pytest.fixture()
+def _repr_options():
+    previous = dms.set_repr_options()
+    yield
+    dms.set_repr_options(**previous)
+
+
+def test_repr_shows_summary_and_edge_values():
+    x = dms.DimensionedArray(
+        values=np.arange(20.0).reshape(2, 10), dims=('x', 'y'), unit=Unit('m')
+    )
+    text = repr(x)
+    assert '(x: 2, y: 10)' in text
+    assert 'float64' in text
+    assert 'numpy' in text
+    assert '160 B' in text
+    assert 'unit' in text
+    assert ' m\n' in text
+    assert 'values[x=0]  [0., 1., 2., ..., 7., 8., 9.]' in text
+    assert str(x) == text
+
+
+def test_repr_of_huge_broadcast_array_is_cheap():
+    values = np.broadcast_to(np.arange(3), (10**6, 10**6, 3))
+    x = dms.DimensionedArray(values=values, dims=('x', 'y', 'z'), unit=None)
+    assert 'values[x=0, y=0]  [0, 1, 2]' in repr(x)
+
+
+def test_repr_of_0d_array():
+    x = dms.DimensionedArray(values=np.asarray(1.5), dims=(), unit=None)
+    assert repr(x).endswith('values   1.5')
+
+
+def test_repr_of_array_api_strict_array():
+    x = dms.DimensionedArray(
+        values=array_api_strict.asarray([True, False]), dims=('x',), unit=None
+    )
+    assert '[True, False]' in repr(x)
+
+
+def test_repr_does_not_compute_lazy_array():
+    x = dms.DimensionedArray(
+        values=da.ones((1000, 4), chunks=(100, 2)), dims=('x', 'y'), unit=None
+    )
+    with dask.config.set(scheduler=_forbid_compute):
+        text = repr(x)
+        html = x._repr_html_()
+    assert 'chunks       (x: 100, y: 2)' in text
+    assert 'values[x=0]  [...]' in text
+    assert 'dask' in html
+
+
+@pytest.mark.usefixtures('_repr_options')
+def test_repr_computes_lazy_preview_if_configured():
+    x = dms.DimensionedArray(values=da.arange(100, chunks=10), dims=('x',), unit=None)
+    dms.set_repr_options(compute_lazy=True, edge_items=2)
+    assert 'values   [0, 1, ..., 98, 99]' in repr(x)
+
+
+def test_repr_html_escapes():
+    x = dms.DimensionedArray(values=np.ones(2), dims=('<x>',), unit=None)
+    html = x._repr_html_()
+    assert '&lt;x&gt;' in html
+    assert '<x>' not in html
+
+
+def test_set_repr_options_raises_if_edge_items_not_positive():
+    with pytest.raises(ValueError, match="edge_items"):
+        dms.set_repr_options(edge_items=0)
@@ -43,3 +43,57 @@ def test_take_extract_correct_values_and_preserves_unit():
         dims=('x', 'y'), values=[[1, 3, 1, 2], [4, 6, 4, 5]], unit='m'
     )
     assert_identical(result, expected)
+
+
+def test_sel_raises_if_dim_has_no_index():
+    arr = make.asarray(dims=('x',), values=[1, 2, 3], unit='m')
+    with pytest.raises(dms.DimensionError, match="No index for dimension 'x'"):
+        dms.sel(arr, {'x': make.asarray(dims=(), values=1.0, unit='m')})
+
+
+def test_sel_scalar_label_removes_dim():
+    arr = make.asarray(dims=('x', 'y'), values=[[1, 2, 3], [4, 5, 6]], unit='K')
+    arr = arr.assign_indexes({'y': make.linspace('y', 0.0, 1.0, 3, unit='m')})
+    result = dms.sel(arr, {'y': make.asarray(dims=(), values=0.5, unit='m')})
+    assert_identical(result, make.asarray(dims=('x',), values=[2, 5], unit='K'))
+
+
+def test_sel_nearest():
+    arr = make.asarray(dims=('x',), values=[1, 2, 3], unit='K')
+    arr = arr.assign_indexes({'x': make.asarray(('x',), [1.0, 2.0, 4.0], unit='m')})
+    label = make.asarray(dims=(), values=3.2, unit='m')
+    assert_identical(
+        dms.sel(arr, {'x': label}, method='nearest'),
+        make.asarray(dims=(), values=3, unit='K'),
+    )
+
+
+def test_sel_converts_label_unit():
+    from pint import UnitRegistry
+
+    make_pint = dms.CreationFunctions(array=np, units=UnitRegistry())
+    arr = make_pint.asarray(dims=('x',), values=[1, 2, 3], unit='K')
+    coord = make_pint.asarray(('x',), [1.0, 2.0, 4.0], unit='m')
+    arr = arr.assign_indexes({'x': coord})
+    label = make_pint.asarray(dims=(), values=200.0, unit='cm')
+    assert dms.sel(arr, {'x': label}).values == 2
+
+
+def test_sel_slice_keeps_sliced_index():
+    arr = make.asarray(dims=('x',), values=[1, 2, 3, 4], unit='K')
+    coord = make.asarray(('x',), [1.0, 2.0, 4.0, 8.0], unit=None)
+    arr = arr.assign_indexes({'x': coord})
+    result = dms.sel(arr, {'x': slice(2.0, 8.0)})
+    assert_identical(result, make.asarray(dims=('x',), values=[2, 3], unit='K'))
+    assert_identical(
+        result.indexes['x'].coord, make.asarray(('x',), [2.0, 4.0], unit=None)
+    )
+
+
+def test_sel_1d_labels():
+    arr = make.asarray(dims=('x',), values=[1, 2, 3, 4], unit='K')
+    arr = arr.assign_indexes({'x': make.asarray(('x',), [1.0, 2.0, 4.0, 8.0])})
+    labels = make.asarray(('x',), [8.0, 1.0])
+    assert_identical(
+        dms.sel(arr, {'x': labels}), make.asarray(dims=('x',), values=[4, 1], unit='K')
+    )
@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims import string_units
+from pydims.testing import assert_allclose, assert_identical
+
+make = dms.CreationFunctions(array=np, units=string_units)
+
+
+def _data(dtype=float):
+    values = np.random.default_rng(seed=1234).random((37, 23)) * 100
+    return make.asarray(dims=('x', 'y'), values=values.astype(dtype), unit='m')
+
+
+def _updates():
+    yield {'x': 3}, make.asarray(dims=('y',), values=np.arange(23.0), unit='m')
+    yield {'y': slice(5, 9)}, make.asarray(dims=(), values=-1000.0, unit='m')
+    yield {'x': slice(30, None), 'y': 22}, make.asarray(dims=(), values=1e4, unit='m')
+    yield {'x': slice(None, None, -7)}, make.asarray(dims=(), values=0.5, unit='m')
+    yield {'x': slice(2, 2)}, make.asarray(dims=(), values=7.0, unit='m')
+    yield {'x': -1, 'y': 0}, make.asarray(dims=(), values=2.0, unit='km')
+
+
+@pytest.mark.parametrize('reduction', ['sum', 'mean', 'min', 'max'])
+@pytest.mark.parametrize('dim', [None, 'x', 'y', ('y', 'x')])
+def test_result_matches_full_reduction_after_updates(reduction, dim):
+    x = _data()
+    maintained = dms.MaintainedReduction(x, reduction, dim=dim)
+    func = getattr(dms, reduction)
+    assert_allclose(maintained.result, func(x, dim=dim))
+    for key, value in _updates():
+        x[key] = value
+        assert_allclose(maintained.result, func(x, dim=dim))
+
+
+@pytest.mark.parametrize('reduction', ['sum', 'min', 'max'])
+def test_integer_results_are_exact(reduction):
+    x = _data(dtype=np.int64)
+    maintained = dms.MaintainedReduction(x, reduction, dim='y')
+    x[{'y': slice(0, 10)}] = make.asarray(dims=(), values=np.int64(-5), unit='m')
+    assert_identical(maintained.result, getattr(dms, reduction)(x, dim='y'))
+
+
+@pytest.mark.filterwarnings('error')
+def test_unsigned_sum_of_all_dims_decreases_without_overflow():
+    x = make.asarray(dims=('x',), values=np.array([200, 5], dtype=np.uint8), unit='m')
+    maintained = dms.MaintainedReduction(x, 'sum')
+    x[{'x': 0}] = make.asarray(dims=(), values=np.uint8(10), unit='m')
+    assert_identical(maintained.result, dms.sum(x))
+
+
+def test_sum_recovers_after_non_finite_values_are_replaced():
+    x = _data()
+    maintained = dms.MaintainedReduction(x, 'sum', dim='y')
+    x[{'x': 4, 'y': 2}] = make.asarray(dims=(), values=np.inf, unit='m')
+    assert maintained.result.values[4] == np.inf
+    x[{'x': 4, 'y': 2}] = make.asarray(dims=(), values=1.0, unit='m')
+    assert_allclose(maintained.result, dms.sum(x, dim='y'))
+
+
+def test_result_is_not_modified_by_later_updates():
+    x = _data()
+    maintained = dms.MaintainedReduction(x, 'max')
+    result = maintained.result
+    x[{'x': 0, 'y': 0}] = make.asarray(dims=(), values=1e6, unit='m')
+    assert result.values < 1e6
+    assert maintained.result.values == 1e6
+    assert maintained.dims == ()
+    assert maintained.unit == x.unit
+
+
+def test_rejected_assignment_keeps_result():
+    x = _data()
+    maintained = dms.MaintainedReduction(x, 'sum', dim='x')
+    with pytest.raises(dms.UnitsError):
+        x[{'x': 0}] = make.asarray(dims=(), values=1.0, unit='s')
+    assert_allclose(maintained.result, dms.sum(x, dim='x'))
+
+
+def test_other_arrays_do_not_update_reduction():
+    x = _data()
+    maintained = dms.MaintainedReduction(x, 'sum')
+    expected = maintained.result
+    other = _data()
+    other[...] = make.asarray(dims=(), values=0.0, unit='m')
+    assert_identical(maintained.result, expected)
+
+
+def test_invalid_reduction_raises():
+    with pytest.raises(ValueError, match='Reduction must be one of'):
+        dms.MaintainedReduction(_data(), 'prod')
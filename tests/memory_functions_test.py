@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims.testing import assert_identical
+
+
+def make_xy() -> dms.DimensionedArray:
+    return dms.DimensionedArray(
+        values=np.arange(6.0).reshape((2, 3)), dims=('x', 'y'), unit=None
+    )
+
+
+def test_shares_memory():
+    da = make_xy()
+    assert dms.shares_memory(da, da[{'x': 0}])
+    assert dms.shares_memory(da, dms.permute_dims(da, ('y', 'x')))
+    assert not dms.shares_memory(da, make_xy())
+
+
+def test_is_contiguous():
+    da = make_xy()
+    assert dms.is_contiguous(da)
+    assert not dms.is_contiguous(da, dims=('y', 'x'))
+    assert dms.is_contiguous(dms.permute_dims(da, ('y', 'x')), dims=('x', 'y'))
+    assert not dms.is_contiguous(da[{'y': slice(0, 3, 2)}])
+
+
+def test_is_contiguous_ignores_dims_of_size_1():
+    da = dms.DimensionedArray(values=np.ones((1, 3)), dims=('x', 'y'), unit=None)
+    assert dms.is_contiguous(da, dims=('y', 'x'))
+
+
+def test_is_contiguous_raises_if_dims_do_not_match():
+    with pytest.raises(ValueError, match="must contain all dims"):
+        dms.is_contiguous(make_xy(), dims=('x',))
+
+
+def test_ascontiguous_returns_view_if_contiguous():
+    da = make_xy()
+    result = dms.ascontiguous(da)
+    assert result.values is not da.values
+    assert dms.shares_memory(result, da)
+
+
+def test_ascontiguous_copies_if_not_contiguous():
+    da = make_xy()
+    result = dms.ascontiguous(da, dims=('y', 'x'))
+    assert result.dims == ('y', 'x')
+    assert not dms.shares_memory(result, da)
+    assert result.values.flags['C_CONTIGUOUS']
+    assert_identical(result, dms.permute_dims(da, ('y', 'x')))
+
+
+@pytest.mark.parametrize(
+    ('shape', 'dims'),
+    [
+        ((256, 512), ('y', 'x')),
+        ((300, 500), ('y', 'x')),
+        ((16, 64, 128), ('z', 'y', 'x')),
+        ((16, 64, 128), ('x', 'z', 'y')),
+        ((16, 64, 128), ('y', 'x', 'z')),
+    ],
+)
+@pytest.mark.parametrize('dtype', [np.float64, np.int8])
+def test_ascontiguous_transposing_copy_of_large_array(shape, dims, dtype):
+    values = np.arange(np.prod(shape)).reshape(shape).astype(dtype)
+    da = dms.DimensionedArray(
+        values=values, dims=('x', 'y', 'z')[: len(shape)], unit=None
+    )
+    result = dms.ascontiguous(da, dims=dims)
+    assert result.values.flags['C_CONTIGUOUS']
+    assert_identical(result, dms.permute_dims(da, dims))
+
+
+def test_ascontiguous_with_workers():
+    da = dms.DimensionedArray(
+        values=np.arange(256.0 * 512).reshape((256, 512)), dims=('x', 'y'), unit=None
+    )
+    result = dms.ascontiguous(da, dims=('y', 'x'), workers=3)
+    assert result.values.flags['C_CONTIGUOUS']
+    assert_identical(result, dms.permute_dims(da, ('y', 'x')))
+
+
+def test_flatten_of_transposed_large_array():
+    values = np.arange(256.0 * 512).reshape((256, 512))
+    da = dms.DimensionedArray(values=values, dims=('x', 'y'), unit=None)
+    result = dms.flatten(dms.permute_dims(da, ('y', 'x')), dim='yx')
+    np.testing.assert_array_equal(result.values, values.T.reshape(-1))
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims import string_units
+from pydims.meta import MetaArray, as_meta, dry_run
+
+make = dms.CreationFunctions(array=np, units=string_units)
+
+
+def _data():
+    return make.asarray(dims=('x', 'y'), values=np.ones((1000, 200)), unit='m')
+
+
+def test_as_meta_keeps_metadata_without_values():
+    x = as_meta(_data())
+    assert isinstance(x.values, MetaArray)
+    assert x.dims == ('x', 'y')
+    assert x.shape == (1000, 200)
+    assert x.dtype == np.float64
+    assert x.unit == string_units.Unit('m')
+    with pytest.raises(TypeError, match='no values'):
+        bool(x.values)
+
+
+def test_operations_propagate_metadata():
+    x = as_meta(_data())
+    t = as_meta(make.asarray(dims=('y',), values=np.ones(200), unit='s'))
+    assert (x * t).unit == string_units.Unit('m*s')
+    assert dms.permute_dims(x * t, ('y', 'x')).dims == ('y', 'x')
+    assert dms.sum(x, dim='x').sizes == {'y': 200}
+    assert dms.mean(x).dims == ()
+    assert x.to(unit='mm', dtype=np.float32).dtype == np.float32
+    assert dms.concat([x, x], dim='x').shape == (2000, 200)
+    assert dms.stack([x, x], dim='z').dims == ('z', 'x', 'y')
+    assert x[{'x': slice(0, 10)}].shape == (10, 200)
+    assert dms.flatten(x, dims=('x', 'y'), dim='xy').shape == (200_000,)
+
+
+def test_count_nonzero_has_integer_result():
+    mask = as_meta(make.asarray(dims=('x', 'y'), values=np.ones((10, 3), dtype=bool)))
+    result = dms.count_nonzero(mask, dim='x')
+    assert result.sizes == {'y': 3}
+    assert np.issubdtype(result.dtype, np.integer)
+    run = dry_run(lambda a: dms.count_nonzero(a, dim='x'), mask)
+    assert run.result.sizes == {'y': 3}
+
+
+def test_dimension_and_unit_errors_are_raised():
+    x = as_meta(_data())
+    with pytest.raises(dms.DimensionError):
+        x + as_meta(make.asarray(dims=('y',), values=np.ones(3), unit='m'))
+    with pytest.raises(ValueError, match='Units'):
+        x + as_meta(make.asarray(dims=('y',), values=np.ones(200), unit='s'))
+
+
+def test_dry_run_reports_peak_memory_by_operation():
+    def pipeline(x):
+        y = x * x
+        return dms.sum(y, dim='x')
+
+    run = dry_run(pipeline, _data())
+    nbytes = 1000 * 200 * 8
+    assert run.result.sizes == {'y': 200}
+    assert isinstance(run.result.values, MetaArray)
+    assert run.peak_bytes == 2 * nbytes + 200 * 8
+    assert run.stages['DimensionedArray.__mul__'] == 2 * nbytes
+    assert 'sum' in run.stages
+    assert 'sum' in run.summary()
+
+
+def test_dry_run_views_do_not_allocate():
+    run = dry_run(lambda x: dms.permute_dims(x, ('y', 'x')), _data())
+    assert run.peak_bytes == 1000 * 200 * 8
+
+
+def test_dry_run_converts_arrays_in_containers():
+    run = dry_run(lambda arrays: dms.concat(arrays, dim='x'), [_data(), _data()])
+    assert run.result.shape == (2000, 200)
+
+
+def test_value_dependent_operations_raise():
+    x = as_meta(_data())
+    with pytest.raises(TypeError):
+        x.values[x.values > 0]
@@ -1,7 +1,68 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2024 Pydims contributors (https://github.com/pydims)
+import subprocess
+import sys
+
+import pytest
+
 import pydims as pkg
 
 
 def test_has_version():
     assert hasattr(pkg, '__version__')
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, '-c', code],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_import_array_libraries():
+    result = _run_python(
+        "import sys, pydims; "
+        "print(sorted({'array_api_compat', 'numpy'} & set(sys.modules)))"
+    )
+    assert result.stdout.strip() == '[]'
+
+
+def test_accessing_dimensioned_array_does_not_import_array_api_compat():
+    result = _run_python(
+        "import sys, pydims; pydims.DimensionedArray; "
+        "print('array_api_compat' in sys.modules)"
+    )
+    assert result.stdout.strip() == 'False'
+
+
+def test_lazy_attributes_are_available():
+    for name in pkg.__all__:
+        assert getattr(pkg, name) is not None
+    assert pkg.common.elemwise_binary is not None
+    assert set(pkg.__all__) <= set(dir(pkg))
+
+
+def test_unknown_attribute_raises_AttributeError():
+    with pytest.raises(AttributeError, match="has no attribute 'does_not_exist'"):
+        pkg.does_not_exist
+
+
+# Generous budget for the cumulative import time of pydims itself. Currently the
+# import takes a few milliseconds, the budget guards against accidentally adding
+# eager imports of array libraries, units libraries, or importlib.metadata.
+_IMPORT_TIME_BUDGET_US = 50_000
+
+
+def test_import_time_is_within_budget():
+    result = _run_python('import pydims', '-X', 'importtime')
+    # Lines are formatted as 'import time: <self> | <cumulative> | <name>'
+    cumulative = {
+        line.split('|')[2].strip(): int(line.split('|')[1])
+        for line in result.stderr.splitlines()
+        if line.startswith('import time:')
+        and line.count('|') == 2
+        and not line.split('|')[1].strip().startswith('cumulative')
+    }
+    assert cumulative['pydims'] < _IMPORT_TIME_BUDGET_US
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import itertools
+
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims import string_units
+from pydims.packed_mask import PackedMask, pack, unpack
+from pydims.testing import assert_identical
+
+make = dms.CreationFunctions(array=np, units=string_units)
+
+shapes = [(5,), (3, 5, 7), (4, 8, 16), (2, 3, 8)]
+
+
+def _random_mask(shape, seed=0):
+    return np.random.default_rng(seed).random(shape) > 0.5
+
+
+@pytest.mark.parametrize('shape', shapes)
+def test_pack_unpack_roundtrip(shape):
+    values = _random_mask(shape)
+    packed = PackedMask.pack(values)
+    assert packed.shape == shape
+    assert packed.nbytes == (values.size + 7) // 8
+    np.testing.assert_array_equal(packed.unpack(), values)
+
+
+@pytest.mark.parametrize('shape', shapes)
+def test_logical_operations_match_numpy(shape):
+    a = _random_mask(shape, seed=1)
+    b = _random_mask(shape, seed=2)
+    pa, pb = PackedMask.pack(a), PackedMask.pack(b)
+    np.testing.assert_array_equal(np.asarray(pa & pb), a & b)
+    np.testing.assert_array_equal(np.asarray(pa | pb), a | b)
+    np.testing.assert_array_equal(np.asarray(pa ^ pb), a ^ b)
+    np.testing.assert_array_equal(np.asarray(~pa), ~a)
+
+
+def test_invert_keeps_padding_bits_clear():
+    packed = ~PackedMask.pack(np.zeros(5, dtype=bool))
+    assert packed._words[-1] == 0b11111
+    assert packed.__array_namespace__().count_nonzero(packed) == 5
+
+
+@pytest.mark.parametrize('shape', shapes)
+@pytest.mark.parametrize('func', ['any', 'all', 'count_nonzero'])
+def test_reductions_match_numpy(shape, func):
+    values = _random_mask(shape)
+    packed = PackedMask.pack(values)
+    xp = packed.__array_namespace__()
+    for n in range(1, len(shape) + 1):
+        for axes in itertools.combinations(range(len(shape)), n):
+            expected = getattr(np, func)(values, axis=axes)
+            result = getattr(xp, func)(packed, axis=axes)
+            np.testing.assert_array_equal(np.asarray(result), expected)
+
+
+def test_getitem_and_setitem_match_numpy():
+    values = _random_mask((4, 8, 16))
+    packed = PackedMask.pack(values)
+    for key in [1, (1, 2), slice(1, 3), (slice(None), 3), (Ellipsis, 0)]:
+        np.testing.assert_array_equal(packed[key].unpack(), values[key])
+    expected = values.copy()
+    packed[1:3] = True
+    expected[1:3] = True
+    packed[:, 0] = False
+    expected[:, 0] = False
+    np.testing.assert_array_equal(packed.unpack(), expected)
+
+
+def test_dimensioned_array_with_packed_values():
+    x = make.asarray(dims=('x', 'y'), values=_random_mask((16, 64)), unit=None)
+    y = make.asarray(dims=('y',), values=_random_mask(64, seed=1), unit=None)
+    px, py = pack(x), pack(y)
+    assert isinstance(px.values, PackedMask)
+    assert px.values.nbytes == x.values.nbytes // 8
+    result = px & ~py
+    assert isinstance(result.values, PackedMask)
+    assert_identical(unpack(result), x & ~y)
+    assert_identical(unpack(px | py), x | y)
+    assert_identical(unpack(dms.any(px, dim='x')), dms.any(x, dim='x'))
+    assert_identical(unpack(dms.all(px, dim='y')), dms.all(x, dim='y'))
+    assert_identical(dms.count_nonzero(px, dim='y'), dms.count_nonzero(x, dim='y'))
+    assert dms.count_nonzero(px).values == np.count_nonzero(x.values)
+
+
+def test_logical_operations_raise_if_unit_is_not_none():
+    x = make.asarray(dims=('x',), values=[True, False], unit='m')
+    y = make.asarray(dims=('x',), values=[True, True], unit=None)
+    with pytest.raises(ValueError, match='without unit'):
+        _ = x & y
+    with pytest.raises(ValueError, match='without unit'):
+        _ = ~x
+
+
+def test_pack_raises_if_dtype_is_not_bool():
+    with pytest.raises(TypeError, match='Only boolean arrays'):
+        pack(make.asarray(dims=('x',), values=[1, 2], unit=None))
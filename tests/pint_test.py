@@ -19,3 +19,37 @@ def test_to_unit():
     y = x.to(unit='cm')
     assert y.unit == ureg.Unit('cm')
     assert_identical(y, make.linspace('x', 0, 100, 3, unit='cm'))
+
+
+def test_mul_by_quantity_applies_unit_once():
+    x = make.linspace('x', 0, 2, 3, unit='m')
+    registry = x.unit._REGISTRY
+    result = x * registry.Quantity(2.0, 's')
+    assert result.unit == registry.Unit('m*s')
+    assert array.all(result.values == array.asarray([0.0, 2.0, 4.0]))
+
+
+def test_add_quantity_with_same_unit():
+    x = make.linspace('x', 0, 2, 3, unit='m')
+    registry = x.unit._REGISTRY
+    result = x + registry.Quantity(1.0, 'm')
+    assert result.unit == registry.Unit('m')
+    assert array.all(result.values == array.asarray([1.0, 2.0, 3.0]))
+
+
+def test_reflected_mul_by_quantity():
+    x = make.linspace('x', 0, 2, 3, unit='m')
+    registry = x.unit._REGISTRY
+    result = registry.Quantity(2.0, 's') * x
+    assert isinstance(result, dms.DimensionedArray)
+    assert result.unit == registry.Unit('s*m')
+    assert array.all(result.values == array.asarray([0.0, 2.0, 4.0]))
+
+
+def test_reflected_add_quantity_with_same_unit():
+    x = make.linspace('x', 0, 2, 3, unit='m')
+    registry = x.unit._REGISTRY
+    result = registry.Quantity(1.0, 'm') + x
+    assert isinstance(result, dms.DimensionedArray)
+    assert result.unit == registry.Unit('m')
+    assert array.all(result.values == array.asarray([1.0, 2.0, 3.0]))
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import numpy as np
+from pint import UnitRegistry
+
+import pydims as dms
+from pydims.profiling import profile
+
+
+def test_nothing_is_recorded_outside_of_context():
+    da = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    with profile() as prof:
+        pass
+    _ = da + da
+    assert prof.stats == {}
+
+
+def test_records_calls_and_allocated_bytes():
+    da = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    with profile() as prof:
+        _ = da + da
+        _ = da + da
+        _ = dms.sum(da, dim='x')
+    add = prof.stats['DimensionedArray.__add__']
+    assert add.calls == 2
+    assert add.bytes_allocated == 2 * 6 * 8
+    assert prof.stats['sum'].calls == 1
+    assert prof.stats['sum'].bytes_allocated == 3 * 8
+
+
+def test_views_do_not_count_as_allocations():
+    da = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    with profile() as prof:
+        _ = dms.permute_dims(da, ('y', 'x'))
+        _ = da[{'x': 0}]
+    assert prof.stats['permute_dims'].bytes_allocated == 0
+    assert prof.stats['DimensionedArray.__getitem__'].bytes_allocated == 0
+
+
+def test_records_transposing_copies():
+    xy = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    with profile() as prof:
+        _ = dms.permute_dims(xy, ('y', 'x'), copy=True)
+        _ = dms.ascontiguous(xy[{'y': slice(0, 2)}])
+    assert prof.stats['permute_dims'].transposes == 1
+    assert prof.stats['ascontiguous'].copies == 1
+    assert prof.stats['ascontiguous'].transposes == 0
+
+
+def test_permuted_views_are_not_recorded_as_transposes():
+    xy = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    with profile() as prof:
+        _ = dms.permute_dims(xy, ('y', 'x'))
+    assert prof.stats['permute_dims'].transposes == 0
+
+
+def test_records_operands_out_of_memory_order():
+    xy = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    yx = dms.DimensionedArray(values=np.ones((3, 2)), dims=('y', 'x'), unit=None)
+    with profile() as prof:
+        _ = xy + yx
+    assert prof.stats['DimensionedArray.__add__'].strided_operands == 1
+    assert prof.stats['DimensionedArray.__add__'].transposes == 0
+    with profile() as prof:
+        _ = xy + xy
+        _ = xy + dms.DimensionedArray(values=np.ones(3), dims=('y',), unit=None)
+    assert prof.stats['DimensionedArray.__add__'].strided_operands == 0
+
+
+def test_records_copies():
+    da = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    with profile() as prof:
+        _ = dms.concat((da, da), dim='x')
+        _ = dms.permute_dims(da, ('y', 'x'), copy=True)
+    assert prof.stats['concat'].copies == 1
+    assert prof.stats['permute_dims'].copies == 1
+
+
+def test_records_unit_conversions():
+    ureg = UnitRegistry()
+    da = dms.DimensionedArray(values=np.ones(3), dims=('x',), unit=ureg.Unit('m'))
+    with profile() as prof:
+        _ = da.to(unit='mm')
+    stats = prof.stats['DimensionedArray.to']
+    assert stats.unit_conversions == 1
+    assert stats.get_scale_time > 0
+
+
+def test_summary_and_trace_events():
+    da = dms.DimensionedArray(values=np.ones((2, 3)), dims=('x', 'y'), unit=None)
+    with profile() as prof:
+        _ = dms.sum(da, dim='x')
+    assert 'sum' in prof.summary()
+    assert 'strided' in prof.summary()
+    (event,) = prof.trace_events()
+    assert event['name'] == 'sum'
+    assert event['ph'] == 'X'
+    assert event['dur'] >= 0
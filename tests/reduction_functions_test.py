@@ -4,14 +4,26 @@ import numpy as np
 import pytest
 
 import pydims as dms
+from pydims import string_units
 from pydims.testing import assert_identical
 
-make = dms.CreationFunctions(array=np, units=dms.string_units)
+make = dms.CreationFunctions(array=np, units=string_units)
 
 
 @pytest.mark.parametrize(
     'func',
-    [dms.all, dms.any, dms.max, dms.min, dms.sum, dms.mean, dms.std, dms.var, dms.prod],
+    [
+        dms.all,
+        dms.any,
+        dms.count_nonzero,
+        dms.max,
+        dms.min,
+        dms.sum,
+        dms.mean,
+        dms.std,
+        dms.var,
+        dms.prod,
+    ],
 )
 def test_reduction_raises_if_given_keepdims_argument(func):
     da = make.asarray(dims=('x',), values=[1, 2, 3], unit=None)
@@ -67,6 +79,20 @@ def test_any_raises_if_unit_is_not_none():
         _ = dms.any(da, dim='x')
 
 
+def test_count_nonzero():
+    da = make.asarray(dims=('x', 'y'), values=[[0, 1, 2], [0, 0, 3]], unit=None)
+    assert_identical(
+        dms.count_nonzero(da, dim='y'),
+        make.asarray(dims=('x',), values=[2, 1], unit=None),
+    )
+    assert dms.count_nonzero(da).values == 3
+
+
+def test_count_nonzero_returns_dimensionless_for_input_with_unit():
+    da = make.asarray(dims=('x',), values=[0.0, 1.0, 2.0], unit='m')
+    assert dms.count_nonzero(da).unit == string_units.Unit('')
+
+
 @pytest.mark.parametrize('unit', [None, 'm'])
 def test_max_returns_input_unit(unit: None | str):
     da = make.asarray(dims=('x',), values=[1, 2, 3], unit=unit)
@@ -111,3 +137,82 @@ def test_var_works_with_no_unit():
 def test_var_squares_unit():
     da = make.asarray(dims=('x',), values=[1, 2, 3], unit='m')
     assert dms.var(da).unit == da.unit * da.unit
+
+
+@pytest.mark.parametrize('accumulation', ['blocked', 'kahan', 'pairwise'])
+def test_sum_with_accumulation_is_more_accurate_for_float32(accumulation):
+    rng = np.random.default_rng(1234)
+    values = rng.random((300_000, 2)).astype(np.float32)
+    da = dms.DimensionedArray(values=values, dims=('x', 'y'), unit=None)
+    exact = values.astype(np.float64).sum(axis=0)
+    default = dms.sum(da, dim='x')
+    result = dms.sum(da, dim='x', accumulation=accumulation)
+    assert result.dtype == np.float32
+    assert result.dims == ('y',)
+    error = np.abs(result.values - exact)
+    assert np.all(error < np.abs(default.values - exact))
+    np.testing.assert_allclose(result.values, exact, rtol=5e-6)
+
+
+@pytest.mark.parametrize('accumulation', ['blocked', 'kahan', 'pairwise'])
+def test_mean_with_accumulation(accumulation):
+    rng = np.random.default_rng(1234)
+    values = rng.random((3, 100_000)).astype(np.float32)
+    da = dms.DimensionedArray(values=values, dims=('x', 'y'), unit=None)
+    result = dms.mean(da, accumulation=accumulation)
+    assert result.dtype == np.float32
+    # The float32 result is exact up to a few float32 epsilons.
+    np.testing.assert_allclose(
+        result.values, values.astype(np.float64).mean(), rtol=1e-6
+    )
+
+
+@pytest.mark.parametrize('accumulation', ['blocked', 'kahan', 'pairwise'])
+@pytest.mark.parametrize('dim', ['x', 'z', ('x', 'y'), ('z', 'y'), ('z', 'x')])
+def test_sum_with_accumulation_of_transposed_input(accumulation, dim):
+    values = np.random.default_rng(1234).random((8, 30, 5000))
+    da = dms.DimensionedArray(values=values, dims=('x', 'y', 'z'), unit=None)
+    transposed = da.permute_dims(('z', 'x', 'y'))
+    result = dms.sum(transposed, dim=dim, accumulation=accumulation)
+    expected = dms.sum(transposed, dim=dim)
+    assert result.dims == expected.dims
+    np.testing.assert_allclose(result.values, expected.values, rtol=1e-12)
+
+
+def test_sum_with_blocked_accumulation_respects_dtype():
+    da = make.asarray(dims=('x',), values=np.ones(10, dtype=np.float32), unit=None)
+    result = dms.sum(da, accumulation='blocked', dtype=np.float64)
+    assert result.dtype == np.float64
+    assert result.values == 10.0
+
+
+def test_sum_with_accumulation_ignores_integers():
+    da = make.asarray(dims=('x',), values=[1, 2, 3], unit=None)
+    assert_identical(dms.sum(da, accumulation='kahan'), dms.sum(da))
+
+
+def test_sum_raises_for_unknown_accumulation():
+    da = make.asarray(dims=('x',), values=[1.0, 2.0], unit=None)
+    with pytest.raises(ValueError, match="Unknown accumulation"):
+        dms.sum(da, accumulation='magic')
+
+
+def test_full_reduction_result_supports_scalar_arithmetic():
+    da = make.asarray(dims=('x',), values=[1.0, 2.0, 3.0], unit='m')
+    total = dms.sum(da)
+    assert total.dims == ()
+    assert (total + total).values == 12.0
+    product = total * total
+    assert product.unit == string_units.Unit('m^2')
+    assert product.values == 36.0
+    converted = (total * 2).to(unit='mm')
+    assert converted.dims == ()
+    assert converted.unit == string_units.Unit('mm')
+    assert converted.values == 12000.0
+
+
+def test_full_reduction_result_arithmetic_checks_units():
+    a = dms.sum(make.asarray(dims=('x',), values=[1.0], unit='m'))
+    b = dms.sum(make.asarray(dims=('x',), values=[1.0], unit='s'))
+    with pytest.raises(ValueError, match="Units must be identical"):
+        a + b
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import pickle
+
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims import string_units
+from pydims.string_units import Unit
+from pydims.units_api_compat.string_units import get_scale
+
+make = dms.CreationFunctions(array=np, units=string_units)
+
+
+def test_default_is_dimensionless() -> None:
+    assert Unit() == Unit('') == Unit('1') == Unit('dimensionless')
+    assert Unit().exponents == ()
+
+
+def test_units_are_interned() -> None:
+    assert Unit('m') is Unit('m')
+    assert Unit('m*s') is Unit('s*m')
+    assert Unit('m/s') is Unit('m*s^-1')
+    assert Unit('m') * Unit('m') is Unit('m^2')
+
+
+def test_equal_canonical_form_compares_equal() -> None:
+    assert Unit('J') == Unit('kg*m^2/s^2')
+    assert Unit('kg') == Unit('1000*g')
+    assert Unit('m**2') == Unit('m^2')
+    assert Unit('1/(m*s)') == Unit('m^-1/s')
+    assert hash(Unit('N*m')) == hash(Unit('J'))
+
+
+def test_different_units_compare_unequal() -> None:
+    assert Unit('m') != Unit('mm')
+    assert Unit('m') != Unit('s')
+    assert Unit('counts') != Unit()
+
+
+def test_mul_does_not_nest_strings() -> None:
+    unit = Unit('m') * Unit('m') * Unit('s')
+    assert unit == Unit('m^2*s')
+    assert str(unit) == 'm^2*s'
+
+
+def test_str_does_not_depend_on_spelling() -> None:
+    assert str(Unit('1/s')) == str(Unit('Hz')) == 'Hz'
+    assert str(Unit('1000*g')) == 'kg'
+    assert str(Unit('kg*m^2/s^2')) == 'J'
+    assert str(Unit('s^-1*counts')) == 'counts/s'
+    assert str(Unit('2*m')) == '2.0*m'
+
+
+def test_div_and_pow() -> None:
+    assert Unit('m') / Unit('s') == Unit('m/s')
+    assert Unit('m') / Unit('m') == Unit()
+    assert Unit('m/s') ** 2 == Unit('m^2/s^2')
+    assert Unit('m') ** 0 == Unit()
+
+
+def test_unknown_symbols_are_base_units() -> None:
+    assert Unit('counts') * Unit('counts') == Unit('counts^2')
+    assert Unit('counts/s').exponents == (('counts', 1), ('s', -1))
+
+
+def test_invalid_string_raises() -> None:
+    with pytest.raises(ValueError, match='unit string'):
+        Unit('m*')
+    with pytest.raises(ValueError, match='Invalid'):
+        Unit('m^s')
+
+
+def test_pickle_roundtrip_returns_interned_instance() -> None:
+    assert pickle.loads(pickle.dumps(Unit('km/h'))) is Unit('km/h')  # noqa: S301
+
+
+def test_unit_is_immutable() -> None:
+    with pytest.raises(AttributeError):
+        Unit('m').value = 's'
+
+
+@pytest.mark.parametrize(
+    ('src', 'dst', 'expected'),
+    [
+        ('m', 'mm', 1000.0),
+        ('km', 'm', 1000.0),
+        ('us', 's', 1e-6),
+        ('h', 's', 3600.0),
+        ('km/h', 'm/s', 1 / 3.6),
+        ('kg', 'g', 1000.0),
+        ('L', 'm^3', 1e-3),
+        ('meV', 'eV', 1e-3),
+        ('counts', 'counts', 1.0),
+    ],
+)
+def test_get_scale(src: str, dst: str, expected: float) -> None:
+    assert get_scale(src=Unit(src), dst=dst) == pytest.approx(expected, rel=1e-15)
+
+
+def test_get_scale_raises_if_incompatible() -> None:
+    with pytest.raises(dms.UnitsError):
+        get_scale(src=Unit('m'), dst='s')
+
+
+def test_to_converts_values() -> None:
+    x = make.asarray(dims=('x',), values=[1.0, 2.0], unit='m')
+    y = x.to(unit='mm')
+    assert y.unit == Unit('mm')
+    np.testing.assert_array_equal(y.values, [1000.0, 2000.0])
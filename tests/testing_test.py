@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) 2024 PyDims contributors (https://github.com/pydims)
+import dask.array as da
+import numpy as np
+import pytest
+
+import pydims as dms
+from pydims import string_units
+from pydims.testing import assert_allclose, assert_identical
+
+make = dms.CreationFunctions(array=np, units=string_units)
+
+
+def test_assert_identical_passes_for_equal_arrays():
+    x = make.asarray(dims=('x', 'y'), values=np.ones((3, 4)), unit='m')
+    assert_identical(x, make.asarray(dims=('x', 'y'), values=np.ones((3, 4)), unit='m'))
+
+
+@pytest.mark.parametrize(
+    ('other', 'message'),
+    [
+        (make.asarray(dims=('y', 'x'), values=np.ones((3, 4)), unit='m'), 'Dims'),
+        (make.asarray(dims=('x', 'y'), values=np.ones((3, 5)), unit='m'), 'Shapes'),
+        (make.asarray(dims=('x', 'y'), values=np.ones((3, 4)), unit='s'), 'Units'),
+        (
+            make.asarray(dims=('x', 'y'), values=np.ones((3, 4), 'float32'), unit='m'),
+            'Dtypes',
+        ),
+    ],
+)
+def test_assert_identical_reports_metadata_mismatch(other, message):
+    x = make.asarray(dims=('x', 'y'), values=np.ones((3, 4)), unit='m')
+    with pytest.raises(AssertionError, match=message):
+        assert_identical(x, other)
+
+
+def test_assert_identical_reports_first_differences_across_chunks():
+    values = np.zeros((300, 400))
+    x = make.asarray(dims=('x', 'y'), values=values, unit='m')
+    other = values.copy()
+    other[250, 7] = 1.0
+    other[251, 0] = 2.0
+    y = make.asarray(dims=('x', 'y'), values=other, unit='m')
+    with pytest.raises(AssertionError, match=r'x=250, y=7.*\n.*x=251, y=0') as info:
+        assert_identical(x, y)
+    assert '0. != 1.' in str(info.value)
+
+
+def test_assert_identical_0d():
+    x = make.asarray(dims=(), values=np.float64(1.0), unit='m')
+    assert_identical(x, x)
+    with pytest.raises(AssertionError, match='differ'):
+        assert_identical(x, x * 2)
+
+
+def test_assert_identical_dask_reports_location_in_block():
+    values = np.arange(100.0).reshape(10, 10)
+    other = values.copy()
+    other[7, 3] = -1
+    x = make.asarray(
+        dims=('x', 'y'), values=da.from_array(values, chunks=(3, 4)), unit='m'
+    )
+    y = make.asarray(
+        dims=('x', 'y'), values=da.from_array(other, chunks=(3, 4)), unit='m'
+    )
+    assert_identical(x, x)
+    with pytest.raises(AssertionError, match=r'\[x=7, y=3\]: 73\. != -1\.'):
+        assert_identical(x, y)
+
+
+def test_assert_identical_dask_and_numpy():
+    values = np.arange(12.0).reshape(3, 4)
+    x = make.asarray(dims=('x', 'y'), values=da.from_array(values, chunks=2), unit='m')
+    y = make.asarray(dims=('x', 'y'), values=values, unit='m')
+    assert_identical(x, y)
+
+
+def test_assert_allclose_converts_unit_and_dim_order():
+    x = make.asarray(dims=('x', 'y'), values=np.ones((2, 3)), unit='m')
+    y = make.asarray(dims=('y', 'x'), values=np.full((3, 2), 100.0), unit='cm')
+    assert_allclose(x, y)
+
+
+def test_assert_allclose_atol_with_unit():
+    x = make.asarray(dims=('x',), values=np.array([1.0, 2.0]), unit='m')
+    y = make.asarray(dims=('x',), values=np.array([1.0, 2.004]), unit='m')
+    with pytest.raises(AssertionError, match=r'not close.*\n.*\[x=1\]'):
+        assert_allclose(x, y)
+    assert_allclose(x, y, atol=make.asarray(dims=(), values=np.float64(5.0), unit='mm'))
+    with pytest.raises(AssertionError):
+        assert_allclose(
+            x, y, atol=make.asarray(dims=(), values=np.float64(3.0), unit='mm')
+        )
+
+
+def test_assert_allclose_rejects_incompatible_units():
+    x = make.asarray(dims=('x',), values=np.ones(2), unit='m')
+    y = make.asarray(dims=('x',), values=np.ones(2), unit='s')
+    with pytest.raises(AssertionError, match='Units'):
+        assert_allclose(x, y)
+
+
+def test_assert_allclose_equal_nan():
+    x = make.asarray(dims=('x',), values=np.array([1.0, np.nan]), unit='m')
+    assert_allclose(x, x)
+    with pytest.raises(AssertionError, match=r'\[x=1\]'):
+        assert_allclose(x, x, equal_nan=False)
+
+
+def test_assert_allclose_dask():
+    values = np.linspace(0.0, 1.0, 50)
+    x = make.asarray(dims=('x',), values=da.from_array(values, chunks=7), unit='m')
+    y = make.asarray(dims=('x',), values=values * 1000, unit='mm')
+    assert_allclose(x, y)
+    z = make.asarray(dims=('x',), values=da.from_array(values + 1, chunks=7), unit='m')
+    with pytest.raises(AssertionError, match=r'\[x=0\]'):
+        assert_allclose(x, z)